@@ -0,0 +1,20 @@
+def iter_meta(post):
+    """Yield ``(box, field, value)`` for every ACPT meta value on a post.
+
+    Handles both shapes the app sees: the REST read format
+    (``{"meta_box": ..., "meta_fields": [{"name", "type", "value"}]}``) and the
+    write/template format (``{"box": ..., "field": ..., "value": ...}``).
+    """
+    acpt = post.get("acpt") if isinstance(post, dict) else None
+    if not isinstance(acpt, dict):
+        return
+
+    for meta_item in acpt.get("meta") or []:
+        if not isinstance(meta_item, dict):
+            continue
+        if "box" in meta_item and "field" in meta_item:
+            yield meta_item["box"], meta_item["field"], meta_item.get("value", "")
+        elif "meta_box" in meta_item:
+            for field in meta_item.get("meta_fields") or []:
+                if isinstance(field, dict) and "name" in field:
+                    yield meta_item["meta_box"], field["name"], field.get("value", "")
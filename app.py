@@ -1,5 +1,4 @@
 import streamlit as st
-import requests
 import json
 import pandas as pd
 import numpy as np
@@ -7,13 +6,32 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
-from requests.auth import HTTPBasicAuth
-import base64
 from datetime import datetime, timedelta
 import time
 import re
 import io
+import uuid
 from PIL import Image
+import typing
+
+from bulk import run_bulk, DEFAULT_BULK_WORKERS
+from arrow_io import posts_table
+from export import json_array_file, ndjson_file, json_file, csv_file, parquet_file, arrow_file
+from flatten import flatten_posts, meta_fields
+from import_stream import iter_import_items, chunked, DEFAULT_CHUNK_SIZE
+from jobs import get_journal, run_job, request_post_id, PENDING, SENT, FAILED
+from job_runner import get_runner, QUEUED, RUNNING
+from meta_index import MetaIndex, NUMBER
+from post_store import get_store
+from profiler import RerunProfiler, breakdown, trend
+from schema import validate_posts, validate_post, field_types
+from sync import sync_posts, new_sync_state, RECONCILE_INTERVAL
+from template_registry import get_registry, template_signature, EMPTY_TEMPLATE
+from wp_api import (
+    APIError, get_client, get_posts, get_post, create_post, update_post, delete_post,
+    create_request, update_request, delete_request, LIST_FIELDS,
+    DEFAULT_POOL_SIZE, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, DEFAULT_PAGE_WORKERS, DEFAULT_MAX_RETRIES
+)
 
 # Set page configuration
 st.set_page_config(
@@ -87,13 +105,30 @@ if 'auth_token' not in st.session_state:
     st.session_state.auth_token = None
 if 'connection_status' not in st.session_state:
     st.session_state.connection_status = False
+if 'sync_state' not in st.session_state:
+    st.session_state.sync_state = {}
+if 'post_details' not in st.session_state:
+    st.session_state.post_details = {}
+if 'posts_version' not in st.session_state:
+    st.session_state.posts_version = 0
+if 'derived' not in st.session_state:
+    st.session_state.derived = {}
+if 'posts_partial' not in st.session_state:
+    # True while the posts were fetched with the list projection (no content or ACPT meta)
+    st.session_state.posts_partial = False
+if 'session_id' not in st.session_state:
+    # Background job results are handed back only to the session that submitted the job
+    st.session_state.session_id = uuid.uuid4().hex
+
+# Times each section of this rerun when profiling is switched on in the sidebar
+profiler = RerunProfiler(enabled=st.session_state.get("profile_reruns", False))
 
 # App header
 st.markdown('<p class="main-header">WordPress ACPT Manager Pro</p>', unsafe_allow_html=True)
 st.markdown('<p class="sub-header">Comprehensive Custom Post Type Management with Industry Templates</p>', unsafe_allow_html=True)
 
 # Sidebar for WordPress connection settings
-with st.sidebar:
+with st.sidebar, profiler.section("Sidebar"):
     st.header("Connection Settings")
     
     # Connection settings
@@ -111,7 +146,64 @@ with st.sidebar:
     elif auth_method in ["Basic Auth", "Application Password"]:
         username = st.text_input("Username")
         password = st.text_input("Password", type="password")
-    
+
+    # Connection pool settings
+    with st.expander("Advanced Connection Settings"):
+        pool_size = st.number_input("Connection Pool Size", min_value=1, max_value=100, value=DEFAULT_POOL_SIZE)
+        connect_timeout = st.number_input("Connect Timeout (seconds)", min_value=1, max_value=60, value=DEFAULT_CONNECT_TIMEOUT)
+        read_timeout = st.number_input("Read Timeout (seconds)", min_value=1, max_value=300, value=DEFAULT_READ_TIMEOUT)
+        page_workers = st.number_input("Parallel Page Fetches", min_value=1, max_value=16, value=DEFAULT_PAGE_WORKERS)
+        bulk_workers = st.number_input("Bulk Operation Workers", min_value=1, max_value=64, value=DEFAULT_BULK_WORKERS)
+        use_batch_api = st.checkbox("Use WordPress Batch API when available", value=True,
+                                    help="Send bulk writes 25 at a time through /wp-json/batch/v1 (WordPress 5.6+)")
+        run_in_background = st.checkbox("Run Bulk Jobs in the Background", value=True,
+                                        help="Queue bulk create/update/delete/import jobs on a background worker so the "
+                                             "app stays usable while they run; follow them under Background Jobs")
+        adaptive_concurrency = st.checkbox("Adaptive Concurrency", value=True,
+                                           help="Ramp up parallel requests while the site responds quickly and back off on 429/5xx errors")
+        max_rps = st.number_input("Max Requests per Second (0 = unlimited)", min_value=0.0, max_value=500.0, value=0.0, step=1.0)
+        max_retries = st.number_input("Max Retries per Request", min_value=0, max_value=10, value=DEFAULT_MAX_RETRIES)
+        use_response_cache = st.checkbox("Revalidate Cached Responses (ETag / Last-Modified)", value=True,
+                                         help="Reuse previously fetched pages when the site answers 304 Not Modified, "
+                                              "and share recent fetch results with other sessions on the same site and account")
+        use_post_store = st.checkbox("Keep Local Post Store", value=True,
+                                     help="Mirror fetched posts to an on-disk SQLite store so the app starts warm after a reload")
+        extra_headers_json = st.text_area("Extra Request Headers (JSON)", value="{}", height=80)
+
+        try:
+            extra_headers = json.loads(extra_headers_json) if extra_headers_json.strip() else {}
+            if not isinstance(extra_headers, dict):
+                raise ValueError
+        except ValueError:
+            st.error("Extra headers must be a JSON object")
+            extra_headers = {}
+
+    # Shared pooled client for every API call made during this session
+    wp_client = None
+    if wp_url:
+        wp_client = get_client(
+            wp_url,
+            username,
+            password,
+            token if auth_method == "JWT/OAuth" else None,
+            pool_size=int(pool_size),
+            connect_timeout=int(connect_timeout),
+            read_timeout=int(read_timeout),
+            headers=extra_headers or None,
+            max_concurrency=int(bulk_workers),
+            max_rps=float(max_rps) or None,
+            adaptive=adaptive_concurrency,
+            max_retries=int(max_retries)
+        )
+
+    # On-disk mirror of fetched posts
+    post_store = get_store() if use_post_store else None
+    # Checkpoint journal for bulk jobs, so interrupted jobs can be resumed
+    job_journal = get_journal()
+    # Bulk jobs run here, outside the script run; sessions on the same site and account share the view
+    job_runner = get_runner()
+    job_owner = (wp_client.base_url, wp_client.auth_identity) if wp_client else None
+
     # Test connection button
     if st.button("Test Connection"):
         if not wp_url:
@@ -119,18 +211,8 @@ with st.sidebar:
         else:
             with st.spinner("Testing connection..."):
                 try:
-                    endpoint = f"{wp_url.rstrip('/')}/wp-json/"
-                    
-                    headers = {"Content-Type": "application/json"}
-                    auth = None
-                    
-                    if auth_method == "JWT/OAuth" and token:
-                        headers["Authorization"] = f"Bearer {token}"
-                    elif auth_method in ["Basic Auth", "Application Password"] and username and password:
-                        auth = HTTPBasicAuth(username, password)
-                    
-                    response = requests.get(endpoint, headers=headers, auth=auth, timeout=10)
-                    
+                    response = wp_client.get("", timeout=10)
+
                     if response.status_code == 200:
                         st.success("Connection successful!")
                         st.session_state.connection_status = True
@@ -152,30 +234,19 @@ with st.sidebar:
     
     # Template selection
     st.header("Industry Templates")
-    template_category = st.selectbox("Select Template Category", 
-                                    ["None", "Real Estate", "Stock Market", "DISC Assessment", "Product Catalog", "Event Management"])
+    template_registry = get_registry(signature=template_signature())
+    template_category = st.selectbox("Select Template Category", ["None"] + template_registry.categories())
     
     if template_category != "None":
-        if template_category == "Real Estate":
-            template_name = st.selectbox("Select Template", 
-                                        ["Residential Property", "Commercial Property", "Rental Listing", "Land Listing"])
-        elif template_category == "Stock Market":
-            template_name = st.selectbox("Select Template", 
-                                        ["Stock Profile", "Market Analysis", "Portfolio Summary", "Financial Report"])
-        elif template_category == "DISC Assessment":
-            template_name = st.selectbox("Select Template", 
-                                        ["Individual Assessment", "Team Assessment", "Leadership Profile", "Career Recommendation"])
-        elif template_category == "Product Catalog":
-            template_name = st.selectbox("Select Template", 
-                                        ["Physical Product", "Digital Product", "Service Offering", "Subscription"])
-        elif template_category == "Event Management":
-            template_name = st.selectbox("Select Template", 
-                                        ["Conference", "Workshop", "Webinar", "Social Event"])
+        template_name = st.selectbox("Select Template", template_registry.names(template_category))
         
         if st.button("Load Template"):
             st.session_state.current_template = f"{template_category} - {template_name}"
             st.success(f"Template loaded: {template_name}")
     
+    for template_path, template_error in template_registry.errors:
+        st.warning(f"Skipped template {template_path}: {template_error}")
+    
     st.divider()
     
     # Help section
@@ -195,767 +266,16 @@ with st.sidebar:
         
         This app helps you interact with ACPT through the WordPress REST API.
         
+        ### Custom Templates
+        
+        Add your own industry templates by dropping JSON files into `~/.acpt_manager/templates` (or a directory listed in the `ACPT_TEMPLATE_PATH` environment variable). Each file holds `category`, `name`, an optional sidebar `order` and the `post` to create; see the bundled `templates/` folder for examples.
+        
         [Visit ACPT Documentation](https://acpt.io/documentation/)
         """)
 
-# Functions for API interaction
-def get_posts(wp_url, post_type, username=None, password=None, token=None, params=None):
-    endpoint = f"{wp_url.rstrip('/')}/wp-json/wp/v2/{post_type}"
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    auth = None
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    elif username and password:
-        auth = HTTPBasicAuth(username, password)
-    
-    try:
-        response = requests.get(endpoint, headers=headers, auth=auth, params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching posts: {str(e)}")
-        if hasattr(e, 'response') and e.response:
-            st.error(f"Response: {e.response.text}")
-        return []
-
-def create_post(wp_url, post_type, post_data, username=None, password=None, token=None):
-    endpoint = f"{wp_url.rstrip('/')}/wp-json/wp/v2/{post_type}"
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    auth = None
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    elif username and password:
-        auth = HTTPBasicAuth(username, password)
-    
-    try:
-        response = requests.post(endpoint, headers=headers, auth=auth, json=post_data)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error creating post: {str(e)}")
-        if hasattr(e, 'response') and e.response:
-            st.error(f"Response: {e.response.text}")
-        return None
-
-def update_post(wp_url, post_type, post_id, post_data, username=None, password=None, token=None):
-    endpoint = f"{wp_url.rstrip('/')}/wp-json/wp/v2/{post_type}/{post_id}"
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    auth = None
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    elif username and password:
-        auth = HTTPBasicAuth(username, password)
-    
-    try:
-        response = requests.put(endpoint, headers=headers, auth=auth, json=post_data)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error updating post: {str(e)}")
-        if hasattr(e, 'response') and e.response:
-            st.error(f"Response: {e.response.text}")
-        return None
-
-def delete_post(wp_url, post_type, post_id, username=None, password=None, token=None):
-    endpoint = f"{wp_url.rstrip('/')}/wp-json/wp/v2/{post_type}/{post_id}?force=true"
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    auth = None
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    elif username and password:
-        auth = HTTPBasicAuth(username, password)
-    
-    try:
-        response = requests.delete(endpoint, headers=headers, auth=auth)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error deleting post: {str(e)}")
-        if hasattr(e, 'response') and e.response:
-            st.error(f"Response: {e.response.text}")
-        return None
-
-# Function to get template data
+# Function to get template data (shared and read-only; thaw() it before editing)
 def get_template_data(template_name):
-    # Real Estate Templates
-    if template_name == "Real Estate - Residential Property":
-        return {
-            "title": "Sample Residential Property",
-            "content": "<p>Beautiful residential property in a prime location.</p>",
-            "status": "draft",
-            "acpt": {
-                "meta": [
-                    {
-                        "box": "property_details",
-                        "field": "property_type",
-                        "value": "Residential"
-                    },
-                    {
-                        "box": "property_details",
-                        "field": "bedrooms",
-                        "value": 3
-                    },
-                    {
-                        "box": "property_details",
-                        "field": "bathrooms",
-                        "value": 2
-                    },
-                    {
-                        "box": "property_details",
-                        "field": "square_feet",
-                        "value": 2000
-                    },
-                    {
-                        "box": "property_details",
-                        "field": "year_built",
-                        "value": 2010
-                    },
-                    {
-                        "box": "location",
-                        "field": "address",
-                        "value": "123 Main Street"
-                    },
-                    {
-                        "box": "location",
-                        "field": "city",
-                        "value": "Anytown"
-                    },
-                    {
-                        "box": "location",
-                        "field": "state",
-                        "value": "CA"
-                    },
-                    {
-                        "box": "location",
-                        "field": "zip_code",
-                        "value": "90210"
-                    },
-                    {
-                        "box": "location",
-                        "field": "country",
-                        "value": "USA"
-                    },
-                    {
-                        "box": "pricing",
-                        "field": "price",
-                        "value": 450000
-                    },
-                    {
-                        "box": "pricing",
-                        "field": "price_per_sqft",
-                        "value": 225
-                    },
-                    {
-                        "box": "features",
-                        "field": "amenities",
-                        "value": ["Garage", "Swimming Pool", "Garden", "Fireplace"]
-                    },
-                    {
-                        "box": "features",
-                        "field": "heating_cooling",
-                        "value": "Central Air"
-                    },
-                    {
-                        "box": "features",
-                        "field": "parking",
-                        "value": "2-Car Garage"
-                    },
-                    {
-                        "box": "media",
-                        "field": "featured_image",
-                        "value": "https://example.com/property-image.jpg"
-                    },
-                    {
-                        "box": "media",
-                        "field": "virtual_tour",
-                        "value": "https://example.com/virtual-tour"
-                    }
-                ]
-            }
-        }
-    
-    elif template_name == "Real Estate - Commercial Property":
-        return {
-            "title": "Sample Commercial Property",
-            "content": "<p>Prime commercial property for your business needs.</p>",
-            "status": "draft",
-            "acpt": {
-                "meta": [
-                    {
-                        "box": "property_details",
-                        "field": "property_type",
-                        "value": "Commercial"
-                    },
-                    {
-                        "box": "property_details",
-                        "field": "building_type",
-                        "value": "Office"
-                    },
-                    {
-                        "box": "property_details",
-                        "field": "square_feet",
-                        "value": 5000
-                    },
-                    {
-                        "box": "property_details",
-                        "field": "year_built",
-                        "value": 2005
-                    },
-                    {
-                        "box": "property_details",
-                        "field": "floors",
-                        "value": 2
-                    },
-                    {
-                        "box": "location",
-                        "field": "address",
-                        "value": "456 Business Ave"
-                    },
-                    {
-                        "box": "location",
-                        "field": "city",
-                        "value": "Metropolis"
-                    },
-                    {
-                        "box": "location",
-                        "field": "state",
-                        "value": "NY"
-                    },
-                    {
-                        "box": "location",
-                        "field": "zip_code",
-                        "value": "10001"
-                    },
-                    {
-                        "box": "location",
-                        "field": "country",
-                        "value": "USA"
-                    },
-                    {
-                        "box": "pricing",
-                        "field": "price",
-                        "value": 1200000
-                    },
-                    {
-                        "box": "pricing",
-                        "field": "price_per_sqft",
-                        "value": 240
-                    },
-                    {
-                        "box": "pricing",
-                        "field": "lease_option",
-                        "value": "Available"
-                    },
-                    {
-                        "box": "pricing",
-                        "field": "lease_rate",
-                        "value": "25 per sqft/year"
-                    },
-                    {
-                        "box": "features",
-                        "field": "amenities",
-                        "value": ["Elevator", "Conference Room", "Kitchen", "Security System"]
-                    },
-                    {
-                        "box": "features",
-                        "field": "parking",
-                        "value": "20 Spaces"
-                    },
-                    {
-                        "box": "features",
-                        "field": "zoning",
-                        "value": "Commercial"
-                    },
-                    {
-                        "box": "media",
-                        "field": "featured_image",
-                        "value": "https://example.com/commercial-property.jpg"
-                    },
-                    {
-                        "box": "media",
-                        "field": "floor_plan",
-                        "value": "https://example.com/floor-plan.pdf"
-                    }
-                ]
-            }
-        }
-    
-    # Stock Market Templates
-    elif template_name == "Stock Market - Stock Profile":
-        return {
-            "title": "AAPL - Apple Inc.",
-            "content": "<p>Apple Inc. designs, manufactures, and markets smartphones, personal computers, tablets, wearables, and accessories worldwide.</p>",
-            "status": "draft",
-            "acpt": {
-                "meta": [
-                    {
-                        "box": "stock_info",
-                        "field": "ticker",
-                        "value": "AAPL"
-                    },
-                    {
-                        "box": "stock_info",
-                        "field": "company_name",
-                        "value": "Apple Inc."
-                    },
-                    {
-                        "box": "stock_info",
-                        "field": "exchange",
-                        "value": "NASDAQ"
-                    },
-                    {
-                        "box": "stock_info",
-                        "field": "sector",
-                        "value": "Technology"
-                    },
-                    {
-                        "box": "stock_info",
-                        "field": "industry",
-                        "value": "Consumer Electronics"
-                    },
-                    {
-                        "box": "financials",
-                        "field": "current_price",
-                        "value": 175.43
-                    },
-                    {
-                        "box": "financials",
-                        "field": "market_cap",
-                        "value": "2.85T"
-                    },
-                    {
-                        "box": "financials",
-                        "field": "pe_ratio",
-                        "value": 28.76
-                    },
-                    {
-                        "box": "financials",
-                        "field": "dividend_yield",
-                        "value": 0.55
-                    },
-                    {
-                        "box": "financials",
-                        "field": "52_week_high",
-                        "value": 198.23
-                    },
-                    {
-                        "box": "financials",
-                        "field": "52_week_low",
-                        "value": 124.17
-                    },
-                    {
-                        "box": "performance",
-                        "field": "daily_change",
-                        "value": 1.25
-                    },
-                    {
-                        "box": "performance",
-                        "field": "ytd_return",
-                        "value": 34.8
-                    },
-                    {
-                        "box": "performance",
-                        "field": "one_year_return",
-                        "value": 42.5
-                    },
-                    {
-                        "box": "performance",
-                        "field": "five_year_return",
-                        "value": 325.7
-                    },
-                    {
-                        "box": "analysis",
-                        "field": "analyst_rating",
-                        "value": "Buy"
-                    },
-                    {
-                        "box": "analysis",
-                        "field": "price_target",
-                        "value": 205.00
-                    },
-                    {
-                        "box": "analysis",
-                        "field": "analyst_consensus",
-                        "value": ["Buy", "Buy", "Hold", "Buy", "Strong Buy"]
-                    },
-                    {
-                        "box": "media",
-                        "field": "company_logo",
-                        "value": "https://example.com/apple-logo.png"
-                    },
-                    {
-                        "box": "media",
-                        "field": "price_chart",
-                        "value": "https://example.com/aapl-chart.png"
-                    }
-                ]
-            }
-        }
-    
-    elif template_name == "Stock Market - Market Analysis":
-        return {
-            "title": "Market Analysis - Q2 2023",
-            "content": "<p>Comprehensive analysis of market trends and sector performance for Q2 2023.</p>",
-            "status": "draft",
-            "acpt": {
-                "meta": [
-                    {
-                        "box": "analysis_info",
-                        "field": "period",
-                        "value": "Q2 2023"
-                    },
-                    {
-                        "box": "analysis_info",
-                        "field": "analyst",
-                        "value": "Jane Smith"
-                    },
-                    {
-                        "box": "analysis_info",
-                        "field": "publication_date",
-                        "value": "2023-07-15"
-                    },
-                    {
-                        "box": "market_overview",
-                        "field": "sp500_performance",
-                        "value": 8.3
-                    },
-                    {
-                        "box": "market_overview",
-                        "field": "nasdaq_performance",
-                        "value": 12.5
-                    },
-                    {
-                        "box": "market_overview",
-                        "field": "dow_performance",
-                        "value": 5.2
-                    },
-                    {
-                        "box": "market_overview",
-                        "field": "vix_average",
-                        "value": 18.7
-                    },
-                    {
-                        "box": "sector_performance",
-                        "field": "technology",
-                        "value": 15.3
-                    },
-                    {
-                        "box": "sector_performance",
-                        "field": "healthcare",
-                        "value": 7.8
-                    },
-                    {
-                        "box": "sector_performance",
-                        "field": "financials",
-                        "value": 4.2
-                    },
-                    {
-                        "box": "sector_performance",
-                        "field": "energy",
-                        "value": -2.5
-                    },
-                    {
-                        "box": "sector_performance",
-                        "field": "consumer_discretionary",
-                        "value": 9.7
-                    },
-                    {
-                        "box": "sector_performance",
-                        "field": "consumer_staples",
-                        "value": 3.1
-                    },
-                    {
-                        "box": "economic_indicators",
-                        "field": "gdp_growth",
-                        "value": 2.4
-                    },
-                    {
-                        "box": "economic_indicators",
-                        "field": "inflation_rate",
-                        "value": 3.1
-                    },
-                    {
-                        "box": "economic_indicators",
-                        "field": "unemployment_rate",
-                        "value": 3.6
-                    },
-                    {
-                        "box": "economic_indicators",
-                        "field": "fed_rate",
-                        "value": 5.25
-                    },
-                    {
-                        "box": "outlook",
-                        "field": "market_outlook",
-                        "value": "Cautiously Optimistic"
-                    },
-                    {
-                        "box": "outlook",
-                        "field": "recommended_sectors",
-                        "value": ["Technology", "Healthcare", "Consumer Discretionary"]
-                    },
-                    {
-                        "box": "outlook",
-                        "field": "risk_factors",
-                        "value": ["Inflation", "Geopolitical Tensions", "Supply Chain Disruptions"]
-                    },
-                    {
-                        "box": "media",
-                        "field": "market_chart",
-                        "value": "https://example.com/market-q2-2023.png"
-                    },
-                    {
-                        "box": "media",
-                        "field": "sector_comparison_chart",
-                        "value": "https://example.com/sector-comparison-q2-2023.png"
-                    }
-                ]
-            }
-        }
-    
-    # DISC Assessment Templates
-    elif template_name == "DISC Assessment - Individual Assessment":
-        return {
-            "title": "DISC Assessment - John Doe",
-            "content": "<p>DISC personality assessment results for John Doe.</p>",
-            "status": "draft",
-            "acpt": {
-                "meta": [
-                    {
-                        "box": "assessment_info",
-                        "field": "client_name",
-                        "value": "John Doe"
-                    },
-                    {
-                        "box": "assessment_info",
-                        "field": "assessment_date",
-                        "value": "2023-06-10"
-                    },
-                    {
-                        "box": "assessment_info",
-                        "field": "assessor",
-                        "value": "Dr. Emily Johnson"
-                    },
-                    {
-                        "box": "disc_scores",
-                        "field": "dominance",
-                        "value": 68
-                    },
-                    {
-                        "box": "disc_scores",
-                        "field": "influence",
-                        "value": 82
-                    },
-                    {
-                        "box": "disc_scores",
-                        "field": "steadiness",
-                        "value": 45
-                    },
-                    {
-                        "box": "disc_scores",
-                        "field": "conscientiousness",
-                        "value": 73
-                    },
-                    {
-                        "box": "personality_profile",
-                        "field": "primary_style",
-                        "value": "Influence"
-                    },
-                    {
-                        "box": "personality_profile",
-                        "field": "secondary_style",
-                        "value": "Conscientiousness"
-                    },
-                    {
-                        "box": "personality_profile",
-                        "field": "behavioral_pattern",
-                        "value": "Persuader"
-                    },
-                    {
-                        "box": "personality_profile",
-                        "field": "key_strengths",
-                        "value": ["Enthusiastic", "Persuasive", "Organized", "Detail-oriented"]
-                    },
-                    {
-                        "box": "personality_profile",
-                        "field": "potential_limitations",
-                        "value": ["May be overly talkative", "Can be impatient with routine tasks"]
-                    },
-                    {
-                        "box": "work_style",
-                        "field": "communication_style",
-                        "value": "Open and expressive, but also values accuracy and precision"
-                    },
-                    {
-                        "box": "work_style",
-                        "field": "decision_making",
-                        "value": "Makes decisions based on both people impact and logical analysis"
-                    },
-                    {
-                        "box": "work_style",
-                        "field": "team_role",
-                        "value": "Motivator and Quality Controller"
-                    },
-                    {
-                        "box": "work_style",
-                        "field": "ideal_environment",
-                        "value": "Collaborative setting with clear guidelines and opportunities to influence others"
-                    },
-                    {
-                        "box": "recommendations",
-                        "field": "development_areas",
-                        "value": ["Active listening", "Patience with routine tasks", "Time management"]
-                    },
-                    {
-                        "box": "recommendations",
-                        "field": "career_matches",
-                        "value": ["Sales Manager", "Marketing Director", "Project Manager", "Training Specialist"]
-                    },
-                    {
-                        "box": "media",
-                        "field": "disc_chart",
-                        "value": "https://example.com/disc-chart-john-doe.png"
-                    }
-                ]
-            }
-        }
-    
-    elif template_name == "DISC Assessment - Team Assessment":
-        return {
-            "title": "Marketing Team DISC Assessment",
-            "content": "<p>Comprehensive DISC assessment for the Marketing Team.</p>",
-            "status": "draft",
-            "acpt": {
-                "meta": [
-                    {
-                        "box": "assessment_info",
-                        "field": "team_name",
-                        "value": "Marketing Team"
-                    },
-                    {
-                        "box": "assessment_info",
-                        "field": "department",
-                        "value": "Marketing"
-                    },
-                    {
-                        "box": "assessment_info",
-                        "field": "assessment_date",
-                        "value": "2023-05-15"
-                    },
-                    {
-                        "box": "assessment_info",
-                        "field": "team_size",
-                        "value": 8
-                    },
-                    {
-                        "box": "assessment_info",
-                        "field": "assessor",
-                        "value": "Dr. Robert Williams"
-                    },
-                    {
-                        "box": "team_composition",
-                        "field": "dominance_percentage",
-                        "value": 25
-                    },
-                    {
-                        "box": "team_composition",
-                        "field": "influence_percentage",
-                        "value": 38
-                    },
-                    {
-                        "box": "team_composition",
-                        "field": "steadiness_percentage",
-                        "value": 12
-                    },
-                    {
-                        "box": "team_composition",
-                        "field": "conscientiousness_percentage",
-                        "value": 25
-                    },
-                    {
-                        "box": "team_composition",
-                        "field": "primary_team_style",
-                        "value": "Influence"
-                    },
-                    {
-                        "box": "team_dynamics",
-                        "field": "team_strengths",
-                        "value": ["Creative problem-solving", "Persuasive communication", "Attention to detail", "Goal-oriented"]
-                    },
-                    {
-                        "box": "team_dynamics",
-                        "field": "team_challenges",
-                        "value": ["May lack patience for implementation", "Could benefit from more process orientation", "Potential for conflict between task-focused and people-focused members"]
-                    },
-                    {
-                        "box": "team_dynamics",
-                        "field": "communication_patterns",
-                        "value": "Primarily open and expressive, with some members preferring direct and factual communication"
-                    },
-                    {
-                        "box": "team_dynamics",
-                        "field": "decision_making_process",
-                        "value": "Tends to be collaborative but can sometimes move too quickly without thorough analysis"
-                    },
-                    {
-                        "box": "team_dynamics",
-                        "field": "conflict_resolution_style",
-                        "value": "Generally addresses conflicts openly, though some team members may avoid confrontation"
-                    },
-                    {
-                        "box": "recommendations",
-                        "field": "team_development",
-                        "value": ["Implement structured project management processes", "Create clear roles that leverage individual DISC styles", "Establish communication protocols that respect different styles"]
-                    },
-                    {
-                        "box": "recommendations",
-                        "field": "leadership_approach",
-                        "value": "Balance between providing clear direction and allowing creative freedom; recognize individual contributions"
-                    },
-                    {
-                        "box": "recommendations",
-                        "field": "team_building_activities",
-                        "value": ["Problem-solving workshops", "Communication style training", "Role clarity exercises"]
-                    },
-                    {
-                        "box": "media",
-                        "field": "team_disc_chart",
-                        "value": "https://example.com/marketing-team-disc.png"
-                    },
-                    {
-                        "box": "media",
-                        "field": "team_dynamics_chart",
-                        "value": "https://example.com/team-dynamics-chart.png"
-                    }
-                ]
-            }
-        }
-    
-    # Default empty template
-    return {
-        "title": "",
-        "content": "",
-        "status": "draft",
-        "acpt": {
-            "meta": []
-        }
-    }
+    return template_registry.get_key(template_name, EMPTY_TEMPLATE)
 
 # Function to generate sample data for visualizations
 def generate_sample_data(template_name):
@@ -1043,6 +363,7 @@ def generate_sample_data(template_name):
     return {}
 
 # Function to create visualizations based on template
+@profiler.timed("create_visualizations")
 def create_visualizations(template_name, data):
     if "Real Estate" in template_name and 'price_data' in data and 'features_data' in data:
         col1, col2 = st.columns(2)
@@ -1164,17 +485,533 @@ def create_visualizations(template_name, data):
         
         st.plotly_chart(fig, use_container_width=True)
 
-# Main content area with tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "📋 View Posts", 
-    "➕ Create Post", 
-    "📊 Visualize Data", 
-    "📤 Export/Import", 
-    "⚙️ Batch Operations"
-])
-
-# Tab 1: View Posts
-with tab1:
+# Functions for reporting API failures
+def show_api_error(error):
+    st.error(str(error))
+    if isinstance(error, APIError) and error.response_text:
+        st.error(f"Response: {error.response_text}")
+
+def show_bulk_failures(results, max_shown=50):
+    failures = [(i, result) for i, result in enumerate(results) if not result]
+    if failures:
+        with st.expander(f"Failed items ({len(failures)})"):
+            for i, error in failures[:max_shown]:
+                st.markdown(f"- **Item {i+1}:** {error}")
+            if len(failures) > max_shown:
+                st.info(f"... and {len(failures) - max_shown} more failures")
+
+# Functions for validating payloads against the ACPT post schema before they are sent
+def validate_payloads(items, types=(), max_shown=500, memo_key=None):
+    """Validate every item locally; show a per-item report and return the per-item errors.
+
+    With ``memo_key`` (e.g. an uploaded file's id) the errors are memoized
+    across reruns and only the report is redrawn.
+    """
+    if memo_key is None:
+        errors = validate_posts(items, types)
+    else:
+        errors = memoize("payload_validation", lambda: validate_posts(items, types), memo_key, types)
+    invalid = [(i, error) for i, error in enumerate(errors) if error]
+    if invalid:
+        st.warning(f"{len(invalid)} of {len(items)} items failed validation and will not be sent")
+        with st.expander(f"Validation errors ({len(invalid)})"):
+            st.dataframe(pd.DataFrame([{"Item": i + 1, "Errors": error} for i, error in invalid[:max_shown]]),
+                         hide_index=True, use_container_width=True)
+            if len(invalid) > max_shown:
+                st.info(f"... and {len(invalid) - max_shown} more invalid items")
+    elif items:
+        st.success(f"All {len(items)} items passed validation")
+    return errors
+
+def run_bulk_job(kind, label, post_type, sub_requests, errors=None, on_progress=None, apply_to_session=True):
+    """Send sub-requests as a journaled, resumable job; items that failed validation are never sent.
+
+    Returns the per-item results in input order (``APIError`` for invalid
+    items). With background jobs enabled the job is queued instead and
+    None is returned; ``apply_to_session`` then has its results applied to
+    the session's posts when they arrive.
+    """
+    errors = errors or [None] * len(sub_requests)
+    job_id = job_journal.create_job(wp_client.base_url, wp_client.auth_identity, post_type, kind, label)
+    job_journal.add_items(job_id, ((i, sub_request, error) for i, (sub_request, error)
+                                   in enumerate(zip(sub_requests, errors))))
+
+    results = [APIError("validating", error) if error else None for error in errors]
+    valid = [(i, sub_request) for i, (sub_request, error) in enumerate(zip(sub_requests, errors)) if not error]
+
+    if run_in_background:
+        invalid = [(i, result) for i, result in enumerate(results) if result is not None]
+
+        def items(status):
+            status.add_results(invalid)
+            return valid
+        submit_job(job_id, kind, label, post_type, items, total=len(sub_requests), apply_to_session=apply_to_session)
+        return None
+
+    st.caption(f"Job `{job_id}`: if this run is interrupted, resume it from Batch Operations → Job History")
+    done = 0
+    for chunk, chunk_results in run_job(wp_client, job_journal, job_id, post_type, valid,
+                                        use_batch=use_batch_api, max_workers=int(bulk_workers)):
+        for (i, _), result in zip(chunk, chunk_results):
+            results[i] = result
+        done += len(chunk)
+        if on_progress:
+            on_progress(done, len(valid))
+    return results
+
+def submit_job(job_id, kind, label, post_type, items, total=None, apply_to_session=False, chunk_size=None):
+    """Queue a journaled job on the background runner.
+
+    ``items(status)`` returns the job's ``(index, sub_request)`` pairs. Every
+    chunk is persisted to the post store from the worker; results meant for
+    the session are deferred until its next rerun.
+    """
+    client, store, use_batch, max_workers = wp_client, post_store, use_batch_api, int(bulk_workers)
+
+    def work(status):
+        chunks = run_job(client, job_journal, job_id, post_type, items(status), use_batch=use_batch,
+                         max_workers=max_workers, chunk_size=chunk_size)
+        try:
+            for chunk, results in chunks:
+                status.add_results(zip((index for index, _ in chunk), results))
+                if kind == "delete":
+                    changed = [request_post_id(sub_request) for (_, sub_request), result in zip(chunk, results) if result]
+                    if store:
+                        store.delete_posts(client.base_url, client.auth_identity, post_type, changed)
+                else:
+                    changed = [result for result in results if result]
+                    if store:
+                        store.upsert_posts(client.base_url, client.auth_identity, post_type, changed)
+                if apply_to_session:
+                    status.defer(changed)
+                if status.cancelled:
+                    break
+        finally:
+            chunks.close()
+
+    job_runner.submit(work, job_id, label, kind, post_type, total=total, owner=job_owner,
+                      session=st.session_state.session_id)
+    st.info(f"Job `{job_id}` is running in the background. Follow it under Background Jobs in the sidebar; "
+            "you can keep working meanwhile")
+
+# Function to apply the results of finished background jobs to this session's posts
+def apply_background_results():
+    if not job_owner:
+        return
+    for status in job_runner.jobs(owner=job_owner):
+        # Results for another post type, or updates with no posts loaded to apply them to, stay queued
+        if status.post_type != post_type or (status.kind != "create" and not st.session_state.get("posts")):
+            continue
+        changed = status.drain(st.session_state.session_id)
+        if not changed:
+            continue
+        if status.kind == "create":
+            set_posts(st.session_state.get("posts", []) + changed)
+        elif status.kind == "delete":
+            deleted_ids = set(changed)
+            set_posts([p for p in st.session_state.posts if p.get("id") not in deleted_ids])
+        elif status.kind == "update":
+            updated = {result.get("id"): result for result in changed if isinstance(result, dict)}
+            set_posts([updated.get(p.get("id"), p) for p in st.session_state.posts])
+
+# Function to follow background jobs; refreshes itself while any job is active
+def show_background_jobs():
+    with st.expander("Background Jobs", expanded=bool(job_runner.active(owner=job_owner))):
+        jobs = job_runner.jobs(owner=job_owner) if job_owner else []
+        if not jobs:
+            st.info("No background jobs yet")
+            return
+
+        for status in jobs:
+            job = status.snapshot()
+            st.markdown(f"**{job['label']}** · `{job['job_id']}` · {job['state']}")
+            if job["total"]:
+                st.progress(min(job["processed"] / job["total"], 1.0))
+            details = f"{job['processed']}{'/' + str(job['total']) if job['total'] else ''} items, " \
+                      f"{job['failed']} failed, {job['rate']:.1f} items/sec"
+            if job["eta"] is not None:
+                details += f", ETA {timedelta(seconds=int(job['eta']))}"
+            st.caption(details)
+            if job["error"]:
+                st.error(job["error"])
+            if job["errors"]:
+                with st.expander(f"Errors ({job['failed']})"):
+                    st.dataframe(pd.DataFrame(job["errors"], columns=["Item", "Error"]), hide_index=True,
+                                 use_container_width=True)
+            if job["state"] in (QUEUED, RUNNING) and st.button("Cancel", key=f"cancel_job_{job['job_id']}"):
+                status.cancel()
+                st.info("Cancelling after the chunks in flight; resume it later from Job History")
+
+        # Pick up results and refresh the rest of the page once a job finishes
+        active = {status.job_id for status in job_runner.active(owner=job_owner)}
+        if st.session_state.get("active_jobs", set()) - active and hasattr(st, "rerun"):
+            st.session_state.active_jobs = active
+            st.rerun()
+        st.session_state.active_jobs = active
+
+        if not hasattr(st, "fragment"):
+            st.button("Refresh Jobs")
+
+# Function to parse, validate and journal an upload chunk by chunk, yielding the items to send
+def streamed_items(uploaded_file, post_type, types, chunk_size, job_id, on_invalid):
+    for chunk in chunked(iter_import_items(uploaded_file), chunk_size):
+        numbers, items, parse_errors = zip(*chunk)
+        errors = [parse_error or error for parse_error, error in zip(parse_errors, validate_posts(items, types))]
+        sub_requests = [create_request(post_type, item) for item in items]
+        if job_id:
+            job_journal.add_items(job_id, zip(numbers, sub_requests, errors))
+        on_invalid([(number, APIError("validating", error)) for number, error in zip(numbers, errors) if error])
+        for number, sub_request, error in zip(numbers, sub_requests, errors):
+            if not error:
+                yield number, sub_request
+
+# Function to import a large JSON array or NDJSON upload in pipelined chunks without loading it whole
+def stream_import(uploaded_file, post_type, types=(), chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False, max_shown=500):
+    """Parse, validate and (unless ``dry_run``) create posts chunk by chunk as a journaled job.
+
+    Only the chunks in flight are held in memory; per-item results are
+    reduced to counts plus the first ``max_shown`` failures. Returns
+    ``(succeeded, failed)``, or None when the import was queued in the
+    background.
+    """
+    if not dry_run:
+        job_id = job_journal.create_job(wp_client.base_url, wp_client.auth_identity, post_type, "create",
+                                        f"Streaming import: {uploaded_file.name}")
+        if run_in_background:
+            # The job reads its own copy, so the upload widget can keep using the original
+            upload = io.BytesIO(uploaded_file.getvalue())
+            submit_job(job_id, "create", f"Streaming import: {uploaded_file.name}", post_type,
+                       lambda status: streamed_items(upload, post_type, types, chunk_size, job_id, status.add_results),
+                       chunk_size=chunk_size)
+            return None
+        st.caption(f"Job `{job_id}`: if this run is interrupted, resume it from Batch Operations → Job History")
+
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    succeeded = failed = 0
+    failures = []
+    started = time.time()
+
+    def tally(outcomes):
+        nonlocal succeeded, failed
+        for number, result in outcomes:
+            if result:
+                succeeded += 1
+            else:
+                failed += 1
+                if len(failures) < max_shown:
+                    failures.append({"Item": number, "Errors": str(result)})
+
+    def report():
+        elapsed = max(time.time() - started, 1e-6)
+        progress_bar.progress(min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0))
+        status_text.text(f"{'Checked' if dry_run else 'Imported'} {succeeded + failed} items: "
+                         f"{succeeded} {'valid' if dry_run else 'successful'}, {failed} failed "
+                         f"({(succeeded + failed) / elapsed:.0f} items/sec)")
+
+    try:
+        if dry_run:
+            for count, (number, _) in enumerate(streamed_items(uploaded_file, post_type, types, chunk_size, None,
+                                                               tally), start=1):
+                tally([(number, True)])
+                if count % chunk_size == 0:
+                    report()
+        else:
+            for chunk, results in run_job(wp_client, job_journal, job_id, post_type,
+                                          streamed_items(uploaded_file, post_type, types, chunk_size, job_id, tally),
+                                          use_batch=use_batch_api, max_workers=int(bulk_workers),
+                                          chunk_size=chunk_size):
+                persist_posts(post_type, results)
+                tally(zip((number for number, _ in chunk), results))
+                report()
+    except (ValueError, UnicodeDecodeError) as e:
+        st.error(f"Stopped reading the file: {e}")
+    report()
+
+    progress_bar.progress(1.0)
+    if failures:
+        with st.expander(f"Failed items ({failed})"):
+            st.dataframe(pd.DataFrame(failures), hide_index=True, use_container_width=True)
+            if failed > max_shown:
+                st.info(f"... and {failed - max_shown} more failures")
+    return succeeded, failed
+
+# Function to show the request timings recorded by the API client
+def show_request_diagnostics(client):
+    with st.expander("Request Diagnostics"):
+        if client is None:
+            st.info("Connect to a site to record request timings")
+            return
+        if st.button("Clear Records", key="clear_request_log"):
+            client.request_log.clear()
+        st.caption(f"{len(client.request_log)} requests recorded")
+        if not st.checkbox("Show diagnostics", key="show_request_diagnostics"):
+            return
+
+        windows = {"Last minute": 60, "Last 5 minutes": 300, "Last 15 minutes": 900, "All recorded": None}
+        window = st.selectbox("Window", list(windows), index=1, key="diagnostics_window")
+        since = time.time() - windows[window] if windows[window] else None
+        records = client.request_log.records(since=since)
+        if not records:
+            st.info("No requests recorded in this window")
+            return
+
+        df = pd.DataFrame(records)
+        df["duration_ms"] = (df["duration"] * 1000).round(1)
+        df["status"] = df["status"].map(lambda status: "network error" if pd.isna(status) else str(int(status)))
+        failed = df["status"].map(lambda status: status == "network error" or int(status) >= 400)
+        span = max(df["time"].max() - df["time"].min(), 1.0)
+
+        col1, col2 = st.columns(2)
+        col1.metric("Requests", len(df))
+        col2.metric("Requests/sec", f"{len(df) / span:.1f}")
+        col1.metric("Error Rate", f"{failed.mean():.1%}")
+        col2.metric("p95 Latency", f"{df['duration_ms'].quantile(0.95):.0f} ms")
+
+        fig = px.histogram(df, x="duration_ms", color="method", nbins=30, height=250,
+                           labels={"duration_ms": "Latency (ms)"})
+        fig.update_layout(margin=dict(l=0, r=0, t=20, b=0), legend_title_text="")
+        st.plotly_chart(fig, use_container_width=True)
+
+        per_second = df.groupby(pd.to_datetime(df["time"].astype(int), unit="s")).size().rename("requests/sec")
+        st.line_chart(per_second, height=150)
+
+        st.markdown("**Responses by status**")
+        by_status = df.groupby("status").agg(requests=("status", "size"), mean_ms=("duration_ms", "mean"))
+        by_status["share"] = (by_status["requests"] / len(df)).map("{:.1%}".format)
+        st.dataframe(by_status.round(1), use_container_width=True)
+
+        st.markdown("**Slowest requests**")
+        slowest = df.nlargest(10, "duration")
+        slowest["time"] = pd.to_datetime(slowest["time"], unit="s").dt.strftime("%H:%M:%S")
+        slowest["wait_ms"] = (slowest["wait"] * 1000).round(1)
+        st.dataframe(slowest[["time", "method", "endpoint", "status", "duration_ms", "wait_ms", "bytes"]],
+                     hide_index=True, use_container_width=True)
+
+        st.download_button("Download Records (JSONL)", client.request_log.to_jsonl(),
+                           file_name=f"request_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+                           mime="application/x-ndjson")
+
+# Function to show the per-section timings of recent reruns
+def show_rerun_profile(history):
+    with st.expander("Rerun Profiler"):
+        st.checkbox("Profile reruns", key="profile_reruns",
+                    help="Time the sidebar, each section, visualizations and export builders on every rerun")
+        if not history:
+            st.caption("Switch profiling on and interact with the app to collect timings")
+            return
+
+        latest = history[-1]
+        previous = history[-2]["total"] if len(history) > 1 else None
+        st.metric("Last Rerun", f"{latest['total'] * 1000:.0f} ms",
+                  delta=f"{(latest['total'] - previous) * 1000:+.0f} ms" if previous is not None else None,
+                  delta_color="inverse")
+        st.dataframe(breakdown(latest), hide_index=True, use_container_width=True)
+
+        if len(history) > 1:
+            st.markdown(f"**Last {len(history)} reruns (ms)**")
+            st.area_chart(trend(history), height=200)
+
+        if st.button("Reset Profile", key="reset_rerun_profile"):
+            st.session_state.rerun_profile = []
+
+# Functions for keeping the local post store in step with the site
+def persist_posts(post_type, posts):
+    if post_store and wp_client:
+        post_store.upsert_posts(wp_client.base_url, wp_client.auth_identity, post_type, [p for p in posts if p])
+
+def persist_deletions(post_type, ids):
+    if post_store and wp_client and ids:
+        post_store.delete_posts(wp_client.base_url, wp_client.auth_identity, post_type, ids)
+
+def persist_sync_state(post_type, state):
+    if post_store and wp_client:
+        post_store.set_sync_state(wp_client.base_url, wp_client.auth_identity, post_type, state)
+
+# Function to load the full record behind a list entry
+def load_post_details(post, post_type, client, max_cached=500):
+    # Posts fetched with the list projection carry no content; fetch and cache the rest
+    if "content" in post or client is None:
+        return post
+    
+    key = f"{client.base_url}|{post_type}|{post.get('id')}"
+    cached = st.session_state.post_details.get(key)
+    if cached and cached.get("modified") == post.get("modified"):
+        return cached
+    
+    details = get_post(None, post_type, post.get("id"), client=client)
+    if not details:
+        show_api_error(details)
+        return post
+    
+    persist_posts(post_type, [details])
+    st.session_state.post_details.pop(key, None)
+    st.session_state.post_details[key] = details
+    while len(st.session_state.post_details) > max_cached:
+        del st.session_state.post_details[next(iter(st.session_state.post_details))]
+    return details
+
+# Functions for replacing list entries with their full records before exporting
+# or analysing them; the list projection leaves out content and ACPT meta
+def load_full_posts(post_type, chunk_size=100):
+    posts = st.session_state.posts
+    ids = [p.get("id") for p in posts]
+    statuses = ",".join(sorted({p.get("status") for p in posts if p.get("status")})) or "any"
+    chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    results = run_bulk(
+        lambda chunk: get_posts(None, post_type, params={"include": ",".join(str(i) for i in chunk), "status": statuses,
+                                                          "per_page": chunk_size},
+                                client=wp_client, use_cache=use_response_cache),
+        chunks, max_workers=int(page_workers))
+    
+    failed = next((result for result in results if isinstance(result, APIError)), None)
+    if failed is not None:
+        show_api_error(failed)
+        return False
+    
+    full = {post.get("id"): post for result in results for post in result}
+    # Posts the site no longer returns were deleted or moved since the list was fetched
+    set_posts([full[post_id] for post_id in ids if post_id in full], partial=False)
+    persist_posts(post_type, full.values())
+    if len(full) < len(ids):
+        st.info(f"{len(ids) - len(full)} post(s) no longer exist on the site and were removed from the list")
+    return True
+
+def require_full_posts(post_type, key):
+    # Returns True once the session's posts carry content and ACPT meta
+    if not st.session_state.posts_partial:
+        return True
+    st.warning("These posts were fetched with list columns only, so their content and ACPT meta are missing. "
+               "Load the full records to continue")
+    if wp_client and st.button("Load Full Records", key=key):
+        with st.spinner("Fetching full records..."):
+            return load_full_posts(post_type)
+    return False
+
+# Functions for changing the post list. Every change goes through set_posts() or
+# posts_changed() so data memoized from the posts is rebuilt. ``partial`` records
+# whether the new list came from a list-projection fetch; None keeps the current flag.
+def set_posts(posts, partial=None):
+    st.session_state.posts = posts
+    if partial is not None:
+        st.session_state.posts_partial = partial
+    posts_changed()
+
+def posts_changed():
+    st.session_state.posts_version += 1
+
+# Function to memoize data derived from the posts across reruns; it is
+# recomputed only when the posts or the extra key values change
+def memoize(name, compute, *key):
+    key = (st.session_state.posts_version, *key)
+    cached = st.session_state.derived.get(name)
+    if cached is None or cached[0] != key:
+        cached = (key, compute())
+        st.session_state.derived[name] = cached
+    return cached[1]
+
+# Wide, typed table of the fetched posts (one column per ACPT field), shared by
+# the View Posts table, CSV export and bulk update
+def flat_posts():
+    return memoize("flat_posts", lambda: flatten_posts(st.session_state.posts))
+
+# Whether this Streamlit accepts a callable as st.download_button's data, read
+# from the public signature's type hints
+def _supports_deferred_downloads():
+    try:
+        data_type = typing.get_type_hints(st.download_button).get("data")
+    except Exception:
+        return False
+    return "Callable" in str(data_type)
+
+DEFERRED_DOWNLOADS = _supports_deferred_downloads()
+
+# Download button whose file is built by build() only when the user asks for it.
+# Streamlit runs a data callable on click, after the script run and in another
+# thread, so build() must carry its data (default arguments) rather than read
+# st.session_state or script globals; older versions get a "Prepare" step.
+# Either way Streamlit reads the whole built file into memory to serve it.
+def export_button(label, build, file_name, mime, key):
+    if DEFERRED_DOWNLOADS:
+        st.download_button(label, data=build, file_name=file_name, mime=mime, key=key, on_click="ignore")
+    elif st.button(f"Prepare {label}", key=f"{key}_prepare"):
+        st.download_button(label, data=build(), file_name=file_name, mime=mime, key=key)
+
+# Function to build the View Posts table (and the rows behind its selectbox)
+def build_posts_table(sort_by):
+    df = None
+
+    # Sort in SQL when the loaded posts are mirrored in the local store
+    if post_store and wp_client and st.session_state.get("posts_source") == f"{wp_client.base_url}|{post_type}":
+        order_by, descending = {
+            "Date (Newest)": ("date", True),
+            "Date (Oldest)": ("date", False),
+            "Title (A-Z)": ("title", False),
+            "Title (Z-A)": ("title", True)
+        }[sort_by]
+        df = post_store.query(wp_client.base_url, wp_client.auth_identity, post_type,
+                              ids=[p.get("id") for p in st.session_state.posts],
+                              order_by=order_by, descending=descending)
+        if len(df) == len(st.session_state.posts):
+            df = df.rename(columns={"id": "ID", "title": "Title", "status": "Status", "date": "Date"})
+            df = df[["ID", "Title", "Status", "Date"]]
+            df["Status"] = df["Status"].fillna("").str.capitalize()
+            df["Title"] = df["Title"].replace("", "No Title")
+            post_data = df.to_dict("records")
+        else:
+            df = None
+
+    if df is None:
+        # Create a dataframe for the posts
+        df = flat_posts()[["ID", "Title", "Status", "Date"]].copy()
+        df["Status"] = df["Status"].str.capitalize()
+        post_data = df.to_dict("records")
+    
+        # Sort the data
+        if sort_by == "Date (Newest)":
+            df = df.sort_values(by="Date", ascending=False)
+        elif sort_by == "Date (Oldest)":
+            df = df.sort_values(by="Date", ascending=True)
+        elif sort_by == "Title (A-Z)":
+            df = df.sort_values(by="Title", ascending=True)
+        elif sort_by == "Title (Z-A)":
+            df = df.sort_values(by="Title", ascending=False)
+    
+    return df, post_data
+
+# Warm-start the post list from the local store for this site and post type
+if post_store and wp_client and post_type:
+    store_key = f"{wp_client.base_url}|{post_type}"
+    if not st.session_state.posts and st.session_state.get("warm_start_key") != store_key:
+        st.session_state.warm_start_key = store_key
+        stored_posts = post_store.load_posts(wp_client.base_url, wp_client.auth_identity, post_type)
+        if stored_posts:
+            # The store holds list entries and full records alike
+            set_posts(stored_posts, partial=any("content" not in p and "acpt" not in p for p in stored_posts))
+            st.session_state.posts_source = store_key
+            stored_sync_state = post_store.get_sync_state(wp_client.base_url, wp_client.auth_identity, post_type)
+            if stored_sync_state:
+                st.session_state.sync_state[store_key] = stored_sync_state
+
+# Results of background jobs that finished since the last rerun
+apply_background_results()
+
+# Main content area. Unlike st.tabs, which runs every tab's body on each rerun,
+# only the selected section executes.
+SECTIONS = {
+    "View Posts": "📋 View Posts",
+    "Create Post": "➕ Create Post",
+    "Visualize Data": "📊 Visualize Data",
+    "Export/Import": "📤 Export/Import",
+    "Batch Operations": "⚙️ Batch Operations"
+}
+active_section = st.radio("Section", list(SECTIONS), format_func=SECTIONS.get, horizontal=True,
+                          key="active_section", label_visibility="collapsed")
+# The sections below keep their own indentation, so the active one is timed with start/stop
+profiler.start(active_section)
+
+# Section 1: View Posts
+if active_section == "View Posts":
     st.markdown('<p class="sub-header">View and Manage Posts</p>', unsafe_allow_html=True)
     
     # Search and filter options
@@ -1189,6 +1026,21 @@ with tab1:
     with col3:
         sort_by = st.selectbox("Sort by", ["Date (Newest)", "Date (Oldest)", "Title (A-Z)", "Title (Z-A)"])
     
+    mode_col1, mode_col2 = st.columns(2)
+    
+    with mode_col1:
+        max_posts = st.number_input("Maximum Posts to Fetch (0 = all)", min_value=0, value=0, step=100)
+    
+    with mode_col2:
+        fetch_mode = st.radio("Fetch Mode", ["Full Fetch", "Incremental Sync"], horizontal=True,
+                              help="Incremental sync only downloads posts modified since the last fetch of this post type")
+        force_reconcile = st.checkbox("Check for deleted posts", value=False,
+                                      help=f"Incremental sync does this automatically every {RECONCILE_INTERVAL // 60} minutes")
+    
+    include_details = st.checkbox("Include content and ACPT meta in list", value=False,
+                                  help="Needed for meta field analysis, CSV meta columns and bulk meta updates. "
+                                       "Otherwise only list columns are downloaded and each post's details load when selected.")
+    
     # Fetch posts button
     fetch_col1, fetch_col2 = st.columns([3, 1])
     
@@ -1199,9 +1051,7 @@ with tab1:
             else:
                 with st.spinner("Fetching posts..."):
                     # Prepare parameters
-                    params = {
-                        "per_page": 100  # Fetch up to 100 posts
-                    }
+                    params = {}
                     
                     if search_term:
                         params["search"] = search_term
@@ -1209,50 +1059,67 @@ with tab1:
                     if status_filter != "All":
                         params["status"] = status_filter.lower()
                     
+                    # Only download the columns the table shows
+                    if not include_details:
+                        params["_fields"] = ",".join(LIST_FIELDS)
+                    
                     # Get authentication details
                     auth_token = st.session_state.auth_token if auth_method == "JWT/OAuth" else None
                     
-                    # Fetch posts
-                    posts = get_posts(wp_url, post_type, username, password, auth_token, params)
+                    # Incremental sync needs a cursor from an earlier fetch with the same filters
+                    sync_key = f"{wp_client.base_url}|{post_type}"
+                    sync_state = st.session_state.sync_state.get(sync_key)
                     
-                    if posts:
-                        st.session_state.posts = posts
-                        st.success(f"Found {len(posts)} {post_type}(s)")
+                    if (fetch_mode == "Incremental Sync" and sync_state and sync_state["params"] == params
+                            and st.session_state.get("posts_source") == sync_key):
+                        result = sync_posts(wp_client, post_type, st.session_state.posts, sync_state,
+                                            max_workers=int(page_workers), use_cache=use_response_cache,
+                                            force_reconcile=force_reconcile)
+                        
+                        if isinstance(result, APIError):
+                            show_api_error(result)
+                        else:
+                            posts, st.session_state.sync_state[sync_key], summary = result
+                            # Projected changes make a list of full records partial again
+                            set_posts(posts, partial=st.session_state.posts_partial or
+                                      bool(summary["changed"] and "_fields" in params))
+                            persist_posts(post_type, summary["changed_posts"])
+                            persist_deletions(post_type, summary["removed_ids"])
+                            persist_sync_state(post_type, st.session_state.sync_state[sync_key])
+                            st.success(f"Synced {len(st.session_state.posts)} {post_type}(s): "
+                                       f"{summary['changed']} changed, {summary['removed']} removed")
                     else:
-                        st.warning(f"No {post_type}s found matching your criteria")
+                        # Fetch posts
+                        posts = get_posts(wp_url, post_type, username, password, auth_token, params, client=wp_client,
+                                          max_items=int(max_posts) or None, max_workers=int(page_workers),
+                                          use_cache=use_response_cache)
+                        
+                        if isinstance(posts, APIError):
+                            show_api_error(posts)
+                        elif posts:
+                            set_posts(posts, partial="_fields" in params)
+                            st.session_state.posts_source = sync_key
+                            st.session_state.sync_state[sync_key] = new_sync_state(posts, params)
+                            persist_posts(post_type, posts)
+                            persist_sync_state(post_type, st.session_state.sync_state[sync_key])
+                            st.success(f"Found {len(posts)} {post_type}(s)")
+                        else:
+                            st.warning(f"No {post_type}s found matching your criteria")
     
     with fetch_col2:
-        st.download_button(
-            label="Export Results",
-            data=json.dumps(st.session_state.posts, indent=2) if 'posts' in st.session_state and st.session_state.posts else "[]",
-            file_name=f"{post_type}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json",
-            disabled=not ('posts' in st.session_state and st.session_state.posts)
-        )
+        if 'posts' in st.session_state and st.session_state.posts:
+            export_button("Export Results", lambda posts=st.session_state.posts: json_array_file(posts),
+                          f"{post_type}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                          "application/json", key="export_results")
+            if st.session_state.posts_partial:
+                st.caption("List columns only; Export/Import → All Fetched Posts exports full records")
+        else:
+            st.button("Export Results", disabled=True)
     
     # Display posts in a table
     if 'posts' in st.session_state and st.session_state.posts:
-        # Create a dataframe for the posts
-        post_data = []
-        for post in st.session_state.posts:
-            post_item = {
-                "ID": post.get("id"),
-                "Title": post.get("title", {}).get("rendered", "No Title"),
-                "Status": post.get("status", "").capitalize(),
-                "Date": post.get("date", "")
-            }
-            post_data.append(post_item)
-        
-        # Sort the data
-        df = pd.DataFrame(post_data)
-        if sort_by == "Date (Newest)":
-            df = df.sort_values(by="Date", ascending=False)
-        elif sort_by == "Date (Oldest)":
-            df = df.sort_values(by="Date", ascending=True)
-        elif sort_by == "Title (A-Z)":
-            df = df.sort_values(by="Title", ascending=True)
-        elif sort_by == "Title (Z-A)":
-            df = df.sort_values(by="Title", ascending=False)
+        df, post_data = memoize("posts_table", lambda: build_posts_table(sort_by), sort_by, post_type,
+                                st.session_state.get("posts_source"), post_store is not None)
         
         # Display the dataframe
         st.dataframe(df, use_container_width=True)
@@ -1268,6 +1135,9 @@ with tab1:
             post_id = int(selected_post_id.split(" - ")[0])
             selected_post = next((p for p in st.session_state.posts if p["id"] == post_id), None)
             
+            if selected_post:
+                selected_post = load_post_details(selected_post, post_type, wp_client)
+            
             if selected_post:
                 # Post actions
                 col1, col2, col3, col4 = st.columns(4)
@@ -1276,7 +1146,7 @@ with tab1:
                     if st.button("Edit Post", use_container_width=True):
                         st.session_state.current_template = "Custom"
                         st.session_state.edit_post = selected_post
-                        st.info("Post loaded for editing in the 'Create Post' tab")
+                        st.info("Post loaded for editing in the 'Create Post' section")
                 
                 with col2:
                     if st.button("View on Site", use_container_width=True):
@@ -1293,7 +1163,7 @@ with tab1:
                             duplicate_post["title"] = f"Copy of {duplicate_post['title']['rendered']}"
                         st.session_state.current_template = "Custom"
                         st.session_state.edit_post = duplicate_post
-                        st.info("Post duplicated and loaded for editing in the 'Create Post' tab")
+                        st.info("Post duplicated and loaded for editing in the 'Create Post' section")
                 
                 with col4:
                     if st.button("Delete Post", use_container_width=True):
@@ -1301,11 +1171,14 @@ with tab1:
                             confirm = st.checkbox("Confirm deletion")
                             if confirm:
                                 auth_token = st.session_state.auth_token if auth_method == "JWT/OAuth" else None
-                                result = delete_post(wp_url, post_type, post_id, username, password, auth_token)
+                                result = delete_post(wp_url, post_type, post_id, username, password, auth_token, client=wp_client)
                                 if result:
                                     st.success("Post deleted successfully")
                                     # Remove from session state
-                                    st.session_state.posts = [p for p in st.session_state.posts if p["id"] != post_id]
+                                    set_posts([p for p in st.session_state.posts if p["id"] != post_id])
+                                    persist_deletions(post_type, [post_id])
+                                else:
+                                    show_api_error(result)
                         else:
                             st.warning("Please test your connection before deleting posts")
                 
@@ -1376,8 +1249,8 @@ with tab1:
                     # Display raw JSON
                     st.json(selected_post)
 
-# Tab 2: Create Post
-with tab2:
+# Section 2: Create Post
+if active_section == "Create Post":
     st.markdown('<p class="sub-header">Create or Edit Post</p>', unsafe_allow_html=True)
     
     # Check if we're editing a post
@@ -1402,14 +1275,7 @@ with tab2:
         }
     else:
         # Empty template
-        template_data = {
-            "title": "",
-            "content": "",
-            "status": "draft",
-            "acpt": {
-                "meta": []
-            }
-        }
+        template_data = EMPTY_TEMPLATE
     
     # Basic post information
     post_title = st.text_input("Post Title", value=template_data.get("title", ""))
@@ -1647,14 +1513,15 @@ with tab2:
                 # Create or update the post
                 with st.spinner(f"{'Updating' if editing_post else 'Creating'} post..."):
                     if editing_post and post_id:
-                        result = update_post(wp_url, post_type, post_id, post_data, username, password, auth_token)
+                        result = update_post(wp_url, post_type, post_id, post_data, username, password, auth_token, client=wp_client)
                         success_message = "Post updated successfully!"
                     else:
-                        result = create_post(wp_url, post_type, post_data, username, password, auth_token)
+                        result = create_post(wp_url, post_type, post_data, username, password, auth_token, client=wp_client)
                         success_message = "Post created successfully!"
                     
                     if result:
                         st.success(f"{success_message} ID: {result.get('id')}")
+                        persist_posts(post_type, [result])
                         
                         # Clear edit state if we were editing
                         if 'edit_post' in st.session_state:
@@ -1667,13 +1534,16 @@ with tab2:
                         if 'posts' in st.session_state and st.session_state.posts:
                             # Remove old version if updating
                             if editing_post and post_id:
-                                st.session_state.posts = [p for p in st.session_state.posts if p["id"] != post_id]
+                                set_posts([p for p in st.session_state.posts if p["id"] != post_id])
                             
                             # Add new version
                             st.session_state.posts.append(result)
+                            posts_changed()
+                    else:
+                        show_api_error(result)
 
-# Tab 3: Visualize Data
-with tab3:
+# Section 3: Visualize Data
+if active_section == "Visualize Data":
     st.markdown('<p class="sub-header">Data Visualization</p>', unsafe_allow_html=True)
     
     # Select visualization type
@@ -1704,143 +1574,103 @@ with tab3:
             
             if viz_option == "Post Status Distribution":
                 # Count posts by status
-                status_counts = {}
-                for post in st.session_state.posts:
-                    status = post.get("status", "unknown").capitalize()
-                    status_counts[status] = status_counts.get(status, 0) + 1
+                def count_statuses():
+                    status_counts = {}
+                    for post in st.session_state.posts:
+                        status = post.get("status", "unknown").capitalize()
+                        status_counts[status] = status_counts.get(status, 0) + 1
+                    
+                    return pd.DataFrame({
+                        "Status": list(status_counts.keys()),
+                        "Count": list(status_counts.values())
+                    })
                 
-                # Create dataframe
-                status_df = pd.DataFrame({
-                    "Status": list(status_counts.keys()),
-                    "Count": list(status_counts.values())
-                })
+                status_df = memoize("status_counts", count_statuses)
                 
                 # Create visualization
                 fig = px.pie(status_df, values="Count", names="Status", title="Post Status Distribution")
                 st.plotly_chart(fig, use_container_width=True)
             
             elif viz_option == "Posts by Date":
-                # Extract dates
-                dates = []
-                for post in st.session_state.posts:
-                    date_str = post.get("date", "")
-                    if date_str:
-                        try:
-                            date = datetime.strptime(date_str.split("T")[0], "%Y-%m-%d")
-                            dates.append(date)
-                        except:
-                            pass
-                
-                # Create dataframe
-                date_df = pd.DataFrame({"Date": dates})
-                date_df["Month"] = date_df["Date"].dt.strftime("%Y-%m")
+                def count_months():
+                    # Extract dates
+                    dates = []
+                    for post in st.session_state.posts:
+                        date_str = post.get("date", "")
+                        if date_str:
+                            try:
+                                date = datetime.strptime(date_str.split("T")[0], "%Y-%m-%d")
+                                dates.append(date)
+                            except:
+                                pass
+                    
+                    # Create dataframe
+                    date_df = pd.DataFrame({"Date": dates})
+                    date_df["Month"] = date_df["Date"].dt.strftime("%Y-%m")
+                    
+                    # Count posts by month
+                    month_counts = date_df["Month"].value_counts().reset_index()
+                    month_counts.columns = ["Month", "Count"]
+                    return month_counts.sort_values("Month")
                 
-                # Count posts by month
-                month_counts = date_df["Month"].value_counts().reset_index()
-                month_counts.columns = ["Month", "Count"]
-                month_counts = month_counts.sort_values("Month")
+                month_counts = memoize("month_counts", count_months)
                 
                 # Create visualization
                 fig = px.bar(month_counts, x="Month", y="Count", title="Posts by Month")
                 st.plotly_chart(fig, use_container_width=True)
             
             elif viz_option == "Meta Field Analysis":
-                # Select meta box and field
-                meta_boxes = set()
-                meta_fields = {}
-                
-                for post in st.session_state.posts:
-                    if "acpt" in post and "meta" in post["acpt"]:
-                        for meta_item in post["acpt"]["meta"]:
-                            if isinstance(meta_item, dict) and "box" in meta_item and "field" in meta_item:
-                                box_name = meta_item["box"]
-                                field_name = meta_item["field"]
-                                
-                                meta_boxes.add(box_name)
-                                
-                                if box_name not in meta_fields:
-                                    meta_fields[box_name] = set()
-                                
-                                meta_fields[box_name].add(field_name)
+                if require_full_posts(post_type, "meta_analysis_load_full"):
+                    # Select meta box and field
+                    # Columnar index of every meta value, rebuilt only when the posts change
+                    meta_index = memoize("meta_index", lambda: MetaIndex(st.session_state.posts))
                 
-                if meta_boxes:
-                    selected_box = st.selectbox("Select Meta Box", list(meta_boxes))
+                    if meta_index.boxes():
+                        selected_box = st.selectbox("Select Meta Box", meta_index.boxes())
                     
-                    if selected_box in meta_fields and meta_fields[selected_box]:
-                        selected_field = st.selectbox("Select Field", list(meta_fields[selected_box]))
+                        if meta_index.fields(selected_box):
+                            selected_field = st.selectbox("Select Field", meta_index.fields(selected_box))
+                            column = meta_index.column(selected_box, selected_field)
                         
-                        # Extract field values
-                        field_values = []
-                        for post in st.session_state.posts:
-                            if "acpt" in post and "meta" in post["acpt"]:
-                                for meta_item in post["acpt"]["meta"]:
-                                    if isinstance(meta_item, dict) and "box" in meta_item and "field" in meta_item:
-                                        if meta_item["box"] == selected_box and meta_item["field"] == selected_field:
-                                            field_values.append({
-                                                "Post ID": post.get("id"),
-                                                "Post Title": post.get("title", {}).get("rendered", "No Title"),
-                                                "Value": meta_item.get("value", "")
-                                            })
-                        
-                        if field_values:
-                            # Create dataframe
-                            field_df = pd.DataFrame(field_values)
-                            
-                            # Determine visualization based on value type
-                            sample_value = field_values[0]["Value"] if field_values else None
-                            
-                            if isinstance(sample_value, (int, float)):
-                                # Numeric visualization
-                                st.subheader(f"Distribution of {selected_field} values")
-                                fig = px.histogram(field_df, x="Value", title=f"Distribution of {selected_field}")
-                                st.plotly_chart(fig, use_container_width=True)
+                            if column is not None and len(column):
+                                # Determine visualization based on value type
+                                if column.kind == NUMBER:
+                                    # Numeric visualization
+                                    st.subheader(f"Distribution of {selected_field} values")
+                                    fig = px.histogram(x=column.values, title=f"Distribution of {selected_field}",
+                                                       labels={"x": "Value"})
+                                    st.plotly_chart(fig, use_container_width=True)
                                 
-                                # Summary statistics
-                                st.subheader("Summary Statistics")
-                                st.dataframe(field_df["Value"].describe().reset_index())
+                                    # Summary statistics
+                                    st.subheader("Summary Statistics")
+                                    st.dataframe(column.summary)
                             
-                            elif isinstance(sample_value, str):
-                                # Text visualization - count unique values
-                                value_counts = field_df["Value"].value_counts().reset_index()
-                                value_counts.columns = ["Value", "Count"]
-                                
-                                st.subheader(f"Most common {selected_field} values")
-                                fig = px.bar(value_counts.head(10), x="Value", y="Count", title=f"Top {selected_field} values")
-                                st.plotly_chart(fig, use_container_width=True)
-                            
-                            elif isinstance(sample_value, list):
-                                # List visualization - flatten and count
-                                all_values = []
-                                for values in field_df["Value"]:
-                                    if isinstance(values, list):
-                                        all_values.extend(values)
-                                
-                                value_counts = pd.Series(all_values).value_counts().reset_index()
-                                value_counts.columns = ["Value", "Count"]
-                                
-                                st.subheader(f"Most common {selected_field} values")
-                                fig = px.bar(value_counts.head(10), x="Value", y="Count", title=f"Top {selected_field} values")
-                                st.plotly_chart(fig, use_container_width=True)
+                                else:
+                                    # Text, checkbox and list values - count unique values (list items individually)
+                                    st.subheader(f"Most common {selected_field} values")
+                                    fig = px.bar(column.value_counts.head(10), x="Value", y="Count", title=f"Top {selected_field} values")
+                                    st.plotly_chart(fig, use_container_width=True)
                             
-                            # Raw data
-                            st.subheader("Raw Data")
-                            st.dataframe(field_df)
+                                # Raw data
+                                st.subheader("Raw Data")
+                                st.dataframe(column.frame(meta_index.titles))
+                            else:
+                                st.info(f"No values found for field {selected_field}")
                         else:
-                            st.info(f"No values found for field {selected_field}")
+                            st.info("No fields found in the selected meta box")
                     else:
-                        st.info("No fields found in the selected meta box")
-                else:
-                    st.info("No meta boxes found in the posts")
+                        st.info("No meta boxes found in the posts")
         else:
-            st.warning("Please fetch posts in the 'View Posts' tab before creating visualizations")
+            st.warning("Please fetch posts in the 'View Posts' section before creating visualizations")
 
-# Tab 4: Export/Import
-with tab4:
+# Section 4: Export/Import
+if active_section == "Export/Import":
     st.markdown('<p class="sub-header">Export and Import Data</p>', unsafe_allow_html=True)
     
-    export_tab, import_tab = st.tabs(["Export", "Import"])
+    data_section = st.radio("Export or Import", ["Export", "Import"], horizontal=True,
+                            key="data_section", label_visibility="collapsed")
     
-    with export_tab:
+    if data_section == "Export":
         st.markdown("### Export Options")
         
         export_type = st.radio("What would you like to export?", 
@@ -1855,10 +1685,9 @@ with tab4:
                 st.json(template_data)
                 
                 # Download button
-                json_str = json.dumps(template_data, indent=2)
-                b64 = base64.b64encode(json_str.encode()).decode()
-                href = f'<a href="data:application/json;base64,{b64}" download="template_{st.session_state.current_template.replace(" ", "_").lower()}.json">Download Template JSON</a>'
-                st.markdown(href, unsafe_allow_html=True)
+                export_button("Download Template JSON", lambda data=template_data: json_file(data),
+                              f"template_{st.session_state.current_template.replace(' ', '_').lower()}.json",
+                              "application/json", key="export_template")
             else:
                 st.info("Please select a template from the sidebar")
         
@@ -1871,81 +1700,83 @@ with tab4:
                 st.json(post_data)
                 
                 # Download button
-                json_str = json.dumps(post_data, indent=2)
-                b64 = base64.b64encode(json_str.encode()).decode()
-                href = f'<a href="data:application/json;base64,{b64}" download="post_{post_data.get("id", "export")}.json">Download Post JSON</a>'
-                st.markdown(href, unsafe_allow_html=True)
+                export_button("Download Post JSON", lambda data=post_data: json_file(data),
+                              f"post_{post_data.get('id', 'export')}.json", "application/json", key="export_post")
             else:
-                st.info("No post is currently being edited. Go to the 'View Posts' tab and select a post to edit")
+                st.info("No post is currently being edited. Go to the 'View Posts' section and select a post to edit")
         
         elif export_type == "All Fetched Posts":
             # Export all fetched posts
             if 'posts' in st.session_state and st.session_state.posts:
                 st.success(f"Exporting {len(st.session_state.posts)} posts")
                 
-                # Options for export format
-                export_format = st.radio("Export Format", ["Full JSON", "Simplified JSON", "CSV"])
+                if require_full_posts(post_type, "export_load_full"):
+                    # Options for export format
+                    export_format = st.radio("Export Format", ["Full JSON", "Simplified JSON", "NDJSON", "CSV", "Parquet", "Arrow IPC"])
                 
-                if export_format == "Full JSON":
-                    # Full JSON export
-                    json_str = json.dumps(st.session_state.posts, indent=2)
-                    b64 = base64.b64encode(json_str.encode()).decode()
-                    href = f'<a href="data:application/json;base64,{b64}" download="{post_type}_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json">Download Full JSON</a>'
-                    st.markdown(href, unsafe_allow_html=True)
+                    # Text formats can be gzipped as they are written (Parquet and Arrow are compressed already)
+                    compress = export_format in ("Full JSON", "Simplified JSON", "NDJSON", "CSV") and st.checkbox(
+                        "Compress with gzip", key="export_gzip",
+                        help="Typically 5-10x smaller; Bulk Import's streaming method reads .json.gz / .ndjson.gz directly")
+                    gz, gz_mime = (".gz", "application/gzip") if compress else ("", None)
                 
-                elif export_format == "Simplified JSON":
-                    # Simplified JSON with just the essential fields
-                    simplified_posts = []
-                    for post in st.session_state.posts:
-                        simplified_post = {
-                            "id": post.get("id"),
-                            "title": post.get("title", {}).get("rendered", "No Title"),
-                            "status": post.get("status", ""),
-                            "date": post.get("date", ""),
-                            "content": post.get("content", {}).get("rendered", ""),
-                            "acpt": post.get("acpt", {})
-                        }
-                        simplified_posts.append(simplified_post)
-                    
-                    json_str = json.dumps(simplified_posts, indent=2)
-                    b64 = base64.b64encode(json_str.encode()).decode()
-                    href = f'<a href="data:application/json;base64,{b64}" download="{post_type}_simplified_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json">Download Simplified JSON</a>'
-                    st.markdown(href, unsafe_allow_html=True)
+                    # Files are written when the download is clicked, from this snapshot of the posts
+                    export_posts = st.session_state.posts
+                    export_time = datetime.now().strftime("%Y%m%d_%H%M%S")
                 
-                elif export_format == "CSV":
-                    # CSV export with flattened meta fields
-                    csv_data = []
-                    for post in st.session_state.posts:
-                        post_data = {
-                            "ID": post.get("id"),
-                            "Title": post.get("title", {}).get("rendered", "No Title"),
-                            "Status": post.get("status", ""),
-                            "Date": post.get("date", "")
-                        }
-                        
-                        # Add ACPT meta fields
-                        if "acpt" in post and "meta" in post["acpt"]:
-                            for meta_item in post["acpt"]["meta"]:
-                                if isinstance(meta_item, dict) and "box" in meta_item and "field" in meta_item:
-                                    field_key = f"{meta_item['box']}_{meta_item['field']}"
-                                    field_value = meta_item.get("value", "")
-                                    
-                                    # Convert lists to comma-separated strings
-                                    if isinstance(field_value, list):
-                                        field_value = ", ".join([str(v) for v in field_value])
-                                    
-                                    post_data[field_key] = field_value
-                        
-                        csv_data.append(post_data)
+                    with profiler.section("Export builders"):
+                        if export_format == "Full JSON":
+                            # Full JSON export
+                            export_button("Download Full JSON",
+                                          lambda posts=export_posts, compress=compress: json_array_file(posts, compress=compress),
+                                          f"{post_type}_export_{export_time}.json{gz}", gz_mime or "application/json",
+                                          key="export_full_json")
+                
+                        elif export_format == "Simplified JSON":
+                            # Simplified JSON with just the essential fields
+                            def simplified_posts(posts):
+                                for post in posts:
+                                    yield {
+                                        "id": post.get("id"),
+                                        "title": post.get("title", {}).get("rendered", "No Title"),
+                                        "status": post.get("status", ""),
+                                        "date": post.get("date", ""),
+                                        "content": post.get("content", {}).get("rendered", ""),
+                                        "acpt": post.get("acpt", {})
+                                    }
                     
-                    # Convert to DataFrame and then to CSV
-                    df = pd.DataFrame(csv_data)
-                    csv = df.to_csv(index=False)
-                    b64 = base64.b64encode(csv.encode()).decode()
-                    href = f'<a href="data:text/csv;base64,{b64}" download="{post_type}_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv">Download CSV</a>'
-                    st.markdown(href, unsafe_allow_html=True)
+                            export_button("Download Simplified JSON",
+                                          lambda posts=export_posts, compress=compress:
+                                              json_array_file(simplified_posts(posts), compress=compress),
+                                          f"{post_type}_simplified_{export_time}.json{gz}", gz_mime or "application/json",
+                                          key="export_simplified_json")
+                
+                        elif export_format == "NDJSON":
+                            # One post per line, ready for the streaming import
+                            export_button("Download NDJSON",
+                                          lambda posts=export_posts, compress=compress: ndjson_file(posts, compress=compress),
+                                          f"{post_type}_export_{export_time}.ndjson{gz}", gz_mime or "application/x-ndjson",
+                                          key="export_ndjson")
+                
+                        elif export_format == "CSV":
+                            # CSV export with flattened meta fields (lists as comma-separated strings)
+                            export_df = flat_posts()
+                            export_button("Download CSV", lambda df=export_df, compress=compress: csv_file(df, compress=compress),
+                                          f"{post_type}_export_{export_time}.csv{gz}", gz_mime or "text/csv",
+                                          key="export_csv")
+                
+                        elif export_format == "Parquet":
+                            # Typed columns: numbers stay numbers and list fields stay lists
+                            export_button("Download Parquet", lambda posts=export_posts: parquet_file(posts_table(posts)),
+                                          f"{post_type}_export_{export_time}.parquet", "application/vnd.apache.parquet",
+                                          key="export_parquet")
+                
+                        elif export_format == "Arrow IPC":
+                            export_button("Download Arrow IPC", lambda posts=export_posts: arrow_file(posts_table(posts)),
+                                          f"{post_type}_export_{export_time}.arrow", "application/vnd.apache.arrow.file",
+                                          key="export_arrow")
             else:
-                st.info("No posts have been fetched. Go to the 'View Posts' tab and fetch posts first")
+                st.info("No posts have been fetched. Go to the 'View Posts' section and fetch posts first")
         
         elif export_type == "Custom Query":
             # Custom query export
@@ -1963,7 +1794,7 @@ with tab4:
             with col2:
                 query_status = st.selectbox("Status", ["Any", "publish", "draft", "pending", "private"])
             
-            query_limit = st.slider("Number of Posts", min_value=1, max_value=100, value=10)
+            query_limit = st.number_input("Number of Posts", min_value=1, max_value=100000, value=10)
             
             # Execute query button
             if st.button("Execute Query and Export"):
@@ -1974,9 +1805,7 @@ with tab4:
                 else:
                     with st.spinner("Executing query..."):
                         # Prepare parameters
-                        params = {
-                            "per_page": query_limit
-                        }
+                        params = {}
                         
                         if query_status != "Any":
                             params["status"] = query_status
@@ -1985,60 +1814,72 @@ with tab4:
                         auth_token = st.session_state.auth_token if auth_method == "JWT/OAuth" else None
                         
                         # Execute query
-                        query_results = get_posts(wp_url, query_post_type, username, password, auth_token, params)
+                        query_results = get_posts(wp_url, query_post_type, username, password, auth_token, params, client=wp_client,
+                                                  max_items=int(query_limit), max_workers=int(page_workers),
+                                                  use_cache=use_response_cache)
                         
-                        if query_results:
-                            st.success(f"Query returned {len(query_results)} results")
-                            
-                            # Display results
-                            with st.expander("View Results", expanded=True):
-                                st.json(query_results)
-                            
-                            # Export options
-                            export_format = st.radio("Export Format", ["JSON", "CSV"])
-                            
-                            if export_format == "JSON":
-                                json_str = json.dumps(query_results, indent=2)
-                                b64 = base64.b64encode(json_str.encode()).decode()
-                                href = f'<a href="data:application/json;base64,{b64}" download="query_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json">Download JSON Results</a>'
-                                st.markdown(href, unsafe_allow_html=True)
-                            
-                            elif export_format == "CSV":
-                                # Flatten results for CSV
-                                csv_data = []
-                                for post in query_results:
-                                    post_data = {
-                                        "ID": post.get("id"),
-                                        "Title": post.get("title", {}).get("rendered", "No Title"),
-                                        "Status": post.get("status", ""),
-                                        "Date": post.get("date", "")
-                                    }
-                                    
-                                    # Add ACPT meta fields
-                                    if "acpt" in post and "meta" in post["acpt"]:
-                                        for meta_item in post["acpt"]["meta"]:
-                                            if isinstance(meta_item, dict) and "box" in meta_item and "field" in meta_item:
-                                                field_key = f"{meta_item['box']}_{meta_item['field']}"
-                                                field_value = meta_item.get("value", "")
-                                                
-                                                # Convert lists to comma-separated strings
-                                                if isinstance(field_value, list):
-                                                    field_value = ", ".join([str(v) for v in field_value])
-                                                
-                                                post_data[field_key] = field_value
-                                    
-                                    csv_data.append(post_data)
-                                
-                                # Convert to DataFrame and then to CSV
-                                df = pd.DataFrame(csv_data)
-                                csv = df.to_csv(index=False)
-                                b64 = base64.b64encode(csv.encode()).decode()
-                                href = f'<a href="data:text/csv;base64,{b64}" download="query_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv">Download CSV Results</a>'
-                                st.markdown(href, unsafe_allow_html=True)
+                        if isinstance(query_results, APIError):
+                            show_api_error(query_results)
+                            st.session_state.pop("query_results", None)
+                        elif query_results:
+                            st.session_state.query_results = query_results
                         else:
+                            st.session_state.pop("query_results", None)
                             st.warning("Query returned no results")
+            
+            # Results are kept across reruns so the format, gzip and download widgets below can be used
+            query_results = st.session_state.get("query_results")
+            if query_results:
+                st.success(f"Query returned {len(query_results)} results")
+                
+                # Display results
+                with st.expander("View Results", expanded=True):
+                    st.json(query_results)
+                    
+                # Export options
+                export_format = st.radio("Export Format", ["JSON", "NDJSON", "CSV", "Parquet", "Arrow IPC"],
+                                         key="export_query_format")
+                compress = export_format in ("JSON", "NDJSON", "CSV") and st.checkbox(
+                    "Compress with gzip", key="export_query_gzip")
+                gz, gz_mime = (".gz", "application/gzip") if compress else ("", None)
+                    
+                with profiler.section("Export builders"):
+                    query_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    if export_format == "JSON":
+                        export_button("Download JSON Results",
+                                      lambda results=query_results, compress=compress:
+                                          json_array_file(results, compress=compress),
+                                      f"query_results_{query_time}.json{gz}", gz_mime or "application/json",
+                                      key="export_query_json")
+                    
+                    elif export_format == "NDJSON":
+                        export_button("Download NDJSON Results",
+                                      lambda results=query_results, compress=compress:
+                                          ndjson_file(results, compress=compress),
+                                      f"query_results_{query_time}.ndjson{gz}",
+                                      gz_mime or "application/x-ndjson", key="export_query_ndjson")
+                    
+                    elif export_format == "CSV":
+                        # Flatten results for CSV
+                        export_button("Download CSV Results",
+                                      lambda results=query_results, compress=compress:
+                                          csv_file(flatten_posts(results), compress=compress),
+                                      f"query_results_{query_time}.csv{gz}", gz_mime or "text/csv",
+                                      key="export_query_csv")
+                    
+                    elif export_format == "Parquet":
+                        export_button("Download Parquet Results",
+                                      lambda results=query_results: parquet_file(posts_table(results)),
+                                      f"query_results_{query_time}.parquet",
+                                      "application/vnd.apache.parquet", key="export_query_parquet")
+                    
+                    elif export_format == "Arrow IPC":
+                        export_button("Download Arrow IPC Results",
+                                      lambda results=query_results: arrow_file(posts_table(results)),
+                                      f"query_results_{query_time}.arrow",
+                                      "application/vnd.apache.arrow.file", key="export_query_arrow")
     
-    with import_tab:
+    if data_section == "Import":
         st.markdown("### Import Options")
         
         import_type = st.radio("What would you like to import?", 
@@ -2056,10 +1897,13 @@ with tab4:
                         template_data = json.loads(template_json)
                         
                         # Validate template structure
-                        if "title" in template_data and "content" in template_data and "acpt" in template_data:
+                        validation_error = validate_post(template_data)
+                        if validation_error:
+                            st.error(f"Invalid template: {validation_error}")
+                        elif "title" in template_data and "content" in template_data and "acpt" in template_data:
                             st.session_state.current_template = "Custom"
                             st.session_state.edit_post = template_data
-                            st.success("Template loaded successfully! Go to the 'Create Post' tab to use it")
+                            st.success("Template loaded successfully! Go to the 'Create Post' section to use it")
                         else:
                             st.error("Invalid template format. Template must include title, content, and acpt fields")
                     except json.JSONDecodeError:
@@ -2079,6 +1923,10 @@ with tab4:
                         try:
                             post_data = json.loads(post_json)
                             
+                            validation_error = validate_post(post_data)
+                            if validation_error:
+                                st.warning(f"This post will not pass validation: {validation_error}")
+                            
                             # Display preview
                             st.subheader("Post Preview")
                             
@@ -2121,10 +1969,13 @@ with tab4:
                             post_data = json.loads(post_json)
                             
                             # Validate post structure
-                            if ("title" in post_data or ("title" in post_data and "rendered" in post_data["title"])) and "acpt" in post_data:
+                            validation_error = validate_post(post_data)
+                            if validation_error:
+                                st.error(f"Invalid post: {validation_error}")
+                            elif ("title" in post_data or ("title" in post_data and "rendered" in post_data["title"])) and "acpt" in post_data:
                                 st.session_state.current_template = "Custom"
                                 st.session_state.edit_post = post_data
-                                st.success("Post loaded successfully! Go to the 'Create Post' tab to edit it")
+                                st.success("Post loaded successfully! Go to the 'Create Post' section to edit it")
                             else:
                                 st.error("Invalid post format. Post must include title and acpt fields")
                         except json.JSONDecodeError:
@@ -2134,14 +1985,17 @@ with tab4:
             # Bulk import
             st.subheader("Bulk Import")
             
-            import_method = st.radio("Import Method", ["Upload JSON File", "Paste JSON Array"])
+            import_method = st.radio("Import Method", ["Upload JSON File", "Stream Large File (NDJSON / JSON array / Parquet / Arrow)",
+                                                       "Paste JSON Array"])
             
             if import_method == "Upload JSON File":
                 uploaded_file = st.file_uploader("Upload JSON File", type=["json"])
                 
                 if uploaded_file is not None:
                     try:
-                        import_data = json.load(uploaded_file)
+                        # Parsed and validated once per uploaded file, not on every rerun
+                        upload_key = (uploaded_file.name, uploaded_file.size, getattr(uploaded_file, "file_id", None))
+                        import_data = memoize("upload_import_data", lambda: json.loads(uploaded_file.getvalue()), upload_key)
                         
                         if isinstance(import_data, list):
                             st.success(f"Loaded {len(import_data)} items from file")
@@ -2151,6 +2005,14 @@ with tab4:
                                 st.write(f"First item in the import:")
                                 st.json(import_data[0] if import_data else {})
                             
+                            # Validate every item locally before anything is sent
+                            import_types = ()
+                            if st.session_state.current_template and st.checkbox(
+                                    f"Check field types against the '{st.session_state.current_template}' template",
+                                    key="import_file_field_types"):
+                                import_types = field_types(get_template_data(st.session_state.current_template))
+                            validation_errors = validate_payloads(import_data, import_types, memo_key=upload_key)
+                            
                             # Import options
                             st.subheader("Import Options")
                             
@@ -2170,37 +2032,102 @@ with tab4:
                                     progress_bar = st.progress(0)
                                     status_text = st.empty()
                                     
-                                    # Get authentication details
-                                    auth_token = st.session_state.auth_token if auth_method == "JWT/OAuth" else None
+                                    def update_progress(done, total):
+                                        progress_bar.progress(done / total)
+                                        status_text.text(f"Imported {done} of {total} items")
                                     
-                                    # Import each item
-                                    success_count = 0
-                                    error_count = 0
+                                    # Import the valid items as a resumable job on the bulk worker pool
+                                    results = run_bulk_job(
+                                        "create",
+                                        f"Bulk import: {uploaded_file.name}",
+                                        import_post_type,
+                                        [create_request(import_post_type, item) for item in import_data],
+                                        validation_errors,
+                                        on_progress=update_progress,
+                                        apply_to_session=False
+                                    )
                                     
-                                    for i, item in enumerate(import_data):
-                                        # Update progress
-                                        progress = (i + 1) / len(import_data)
-                                        progress_bar.progress(progress)
-                                        status_text.text(f"Importing item {i+1} of {len(import_data)}")
+                                    if results is not None:
+                                        success_count = sum(1 for result in results if result)
+                                        persist_posts(import_post_type, results)
+                                        error_count = len(results) - success_count
                                         
-                                        # Create post
-                                        result = create_post(wp_url, import_post_type, item, username, password, auth_token)
-                                        
-                                        if result:
-                                            success_count += 1
-                                        else:
-                                            error_count += 1
-                                    
-                                    # Final status
-                                    st.success(f"Import completed: {success_count} successful, {error_count} failed")
+                                        # Final status
+                                        st.success(f"Import completed: {success_count} successful, {error_count} failed")
+                                        show_bulk_failures(results)
                         else:
                             st.error("Invalid import format. Expected a JSON array")
                     except json.JSONDecodeError:
                         st.error("Invalid JSON file. Please check the file format")
             
+            elif import_method == "Stream Large File (NDJSON / JSON array / Parquet / Arrow)":
+                st.info("Reads the file in chunks and sends each chunk while the next one is parsed, "
+                        "so memory stays flat however large the file is. Use NDJSON/JSONL (one post per line), "
+                        "a JSON array, or a Parquet / Arrow IPC file (read one row group at a time; "
+                        "ACPT columns from this app's export import back into their fields). "
+                        "Gzipped files (.json.gz, .ndjson.gz) are decompressed as they are read.")
+                stream_file = st.file_uploader("Upload NDJSON, JSON, Parquet or Arrow File (optionally gzipped)",
+                                               type=["ndjson", "jsonl", "json", "parquet", "arrow", "feather", "gz"])
+                
+                if stream_file is not None:
+                    # Preview the first item only
+                    with st.expander("Preview Import Data"):
+                        try:
+                            first_item = next(iter_import_items(stream_file), None)
+                            st.write("First item in the import:")
+                            st.json(first_item[1] if first_item and first_item[1] is not None else {})
+                        except (ValueError, UnicodeDecodeError) as e:
+                            st.error(f"Could not read the file: {e}")
+                    
+                    # Import options
+                    st.subheader("Import Options")
+                    
+                    import_post_type = st.selectbox("Post Type for Import", ["post", "product", "page", "property", "stock", "assessment", "custom"],
+                                                    key="stream_import_post_type")
+                    
+                    if import_post_type == "custom":
+                        import_post_type = st.text_input("Enter Custom Post Type", key="stream_import_custom_type")
+                    
+                    chunk_size = st.number_input("Items per chunk", min_value=25, max_value=2000, value=DEFAULT_CHUNK_SIZE,
+                                                 step=25, help="Items parsed, validated and dispatched together")
+                    
+                    import_types = ()
+                    if st.session_state.current_template and st.checkbox(
+                            f"Check field types against the '{st.session_state.current_template}' template",
+                            key="stream_import_field_types"):
+                        import_types = field_types(get_template_data(st.session_state.current_template))
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        validate_clicked = st.button("Validate File")
+                    
+                    with col2:
+                        import_clicked = st.button("Execute Streaming Import")
+                    
+                    if validate_clicked:
+                        valid_count, invalid_count = stream_import(stream_file, import_post_type, import_types,
+                                                                   chunk_size=int(chunk_size), dry_run=True)
+                        st.success(f"Validation completed: {valid_count} valid, {invalid_count} invalid")
+                    elif import_clicked:
+                        if not wp_url:
+                            st.warning("Please enter a WordPress URL")
+                        elif not st.session_state.connection_status:
+                            st.warning("Please test your connection before importing")
+                        else:
+                            outcome = stream_import(stream_file, import_post_type, import_types, chunk_size=int(chunk_size))
+                            if outcome is not None:
+                                success_count, error_count = outcome
+                                st.success(f"Import completed: {success_count} successful, {error_count} failed")
+                
             elif import_method == "Paste JSON Array":
                 import_json = st.text_area("Paste JSON Array", height=300)
                 
+                # Same opt-in as the upload and streaming imports
+                paste_field_types = bool(st.session_state.current_template) and st.checkbox(
+                    f"Check field types against the '{st.session_state.current_template}' template",
+                    key="import_paste_field_types")
+                
                 if st.button("Validate Import Data"):
                     if import_json:
                         try:
@@ -2214,6 +2141,12 @@ with tab4:
                                     st.write(f"First item in the import:")
                                     st.json(import_data[0] if import_data else {})
                                 
+                                # Validate every item locally before anything is sent
+                                import_types = ()
+                                if paste_field_types:
+                                    import_types = field_types(get_template_data(st.session_state.current_template))
+                                validation_errors = validate_payloads(import_data, import_types)
+                                
                                 # Import options
                                 st.subheader("Import Options")
                                 
@@ -2233,41 +2166,41 @@ with tab4:
                                         progress_bar = st.progress(0)
                                         status_text = st.empty()
                                         
-                                        # Get authentication details
-                                        auth_token = st.session_state.auth_token if auth_method == "JWT/OAuth" else None
+                                        def update_progress(done, total):
+                                            progress_bar.progress(done / total)
+                                            status_text.text(f"Imported {done} of {total} items")
                                         
-                                        # Import each item
-                                        success_count = 0
-                                        error_count = 0
+                                        # Import the valid items as a resumable job on the bulk worker pool
+                                        results = run_bulk_job(
+                                            "create",
+                                            "Bulk import: pasted JSON",
+                                            import_post_type,
+                                            [create_request(import_post_type, item) for item in import_data],
+                                            validation_errors,
+                                            on_progress=update_progress,
+                                            apply_to_session=False
+                                        )
                                         
-                                        for i, item in enumerate(import_data):
-                                            # Update progress
-                                            progress = (i + 1) / len(import_data)
-                                            progress_bar.progress(progress)
-                                            status_text.text(f"Importing item {i+1} of {len(import_data)}")
+                                        if results is not None:
+                                            success_count = sum(1 for result in results if result)
+                                            persist_posts(import_post_type, results)
+                                            error_count = len(results) - success_count
                                             
-                                            # Create post
-                                            result = create_post(wp_url, import_post_type, item, username, password, auth_token)
-                                            
-                                            if result:
-                                                success_count += 1
-                                            else:
-                                                error_count += 1
-                                        
-                                        # Final status
-                                        st.success(f"Import completed: {success_count} successful, {error_count} failed")
+                                            # Final status
+                                            st.success(f"Import completed: {success_count} successful, {error_count} failed")
+                                            show_bulk_failures(results)
                             else:
                                 st.error("Invalid import format. Expected a JSON array")
                         except json.JSONDecodeError:
                             st.error("Invalid JSON format. Please check your input")
 
-# Tab 5: Batch Operations
-with tab5:
+# Section 5: Batch Operations
+if active_section == "Batch Operations":
     st.markdown('<p class="sub-header">Batch Operations</p>', unsafe_allow_html=True)
     
     # Batch operation types
     operation_type = st.selectbox("Select Operation Type", 
-                                 ["Bulk Create", "Bulk Update", "Bulk Delete"])
+                                 ["Bulk Create", "Bulk Update", "Bulk Delete", "Job History"])
     
     if operation_type == "Bulk Create":
         st.subheader("Bulk Create Posts")
@@ -2281,23 +2214,9 @@ with tab5:
                 template_data = get_template_data(st.session_state.current_template)
             else:
                 st.warning("Please select a template from the sidebar")
-                template_data = {
-                    "title": "",
-                    "content": "",
-                    "status": "draft",
-                    "acpt": {
-                        "meta": []
-                    }
-                }
+                template_data = EMPTY_TEMPLATE
         else:
-            template_data = {
-                "title": "",
-                "content": "",
-                "status": "draft",
-                "acpt": {
-                    "meta": []
-                }
-            }
+            template_data = EMPTY_TEMPLATE
         
         # Number of posts to create
         num_posts = st.number_input("Number of Posts to Create", min_value=1, max_value=100, value=5)
@@ -2306,7 +2225,8 @@ with tab5:
         base_title = st.text_input("Base Title", value=template_data.get("title", ""))
         base_content = st.text_area("Base Content", value=template_data.get("content", ""), height=100)
         post_status = st.selectbox("Post Status", ["draft", "publish", "pending", "private"], 
-                                  index=["draft", "publish", "pending", "private"].index(template_data.get("status", "draft")))
+                                  index=["draft", "publish", "pending", "private"].index(template_data.get("status", "draft")),
+                                  key="bulk_create_post_status")
         
         # Preview generation
         if st.button("Preview Generation"):
@@ -2351,21 +2271,10 @@ with tab5:
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                # Get authentication details
-                auth_token = st.session_state.auth_token if auth_method == "JWT/OAuth" else None
-                
-                # Create posts
-                success_count = 0
-                error_count = 0
-                created_posts = []
+                # Prepare post data for every post up front
+                bulk_payloads = []
                 
                 for i in range(num_posts):
-                    # Update progress
-                    progress = (i + 1) / num_posts
-                    progress_bar.progress(progress)
-                    status_text.text(f"Creating post {i+1} of {num_posts}")
-                    
-                    # Prepare post data
                     post_data = {
                         "title": f"{base_title} {i+1}",
                         "content": base_content,
@@ -2385,24 +2294,40 @@ with tab5:
                                     "value": meta_item.get("value", "")
                                 })
                     
-                    # Create post
-                    result = create_post(wp_url, post_type, post_data, username, password, auth_token)
-                    
-                    if result:
-                        success_count += 1
-                        created_posts.append(result)
-                    else:
-                        error_count += 1
+                    bulk_payloads.append(post_data)
                 
-                # Final status
-                st.success(f"Bulk creation completed: {success_count} successful, {error_count} failed")
+                def update_progress(done, total):
+                    progress_bar.progress(done / total)
+                    status_text.text(f"Created {done} of {total} posts")
                 
-                # Add to session state
-                if created_posts:
-                    if 'posts' in st.session_state:
-                        st.session_state.posts.extend(created_posts)
-                    else:
-                        st.session_state.posts = created_posts
+                # Validate the generated payloads, then create the valid posts on the bulk worker pool
+                validation_errors = validate_payloads(bulk_payloads, field_types(template_data))
+                results = run_bulk_job(
+                    "create",
+                    f"Bulk create: {base_title}",
+                    post_type,
+                    [create_request(post_type, item) for item in bulk_payloads],
+                    validation_errors,
+                    on_progress=update_progress
+                )
+                
+                if results is not None:
+                    created_posts = [result for result in results if result]
+                    success_count = len(created_posts)
+                    persist_posts(post_type, created_posts)
+                    error_count = len(results) - success_count
+                    
+                    # Final status
+                    st.success(f"Bulk creation completed: {success_count} successful, {error_count} failed")
+                    show_bulk_failures(results)
+                    
+                    # Add to session state
+                    if created_posts:
+                        if 'posts' in st.session_state:
+                            st.session_state.posts.extend(created_posts)
+                            posts_changed()
+                        else:
+                            set_posts(created_posts)
     
     elif operation_type == "Bulk Update":
         st.subheader("Bulk Update Posts")
@@ -2457,39 +2382,27 @@ with tab5:
             if "ACPT Meta Fields" in update_fields:
                 st.markdown("### ACPT Meta Fields to Update")
                 
-                # Collect all meta boxes and fields from selected posts
-                all_meta_boxes = {}
-                
-                for post in selected_posts:
-                    if "acpt" in post and "meta" in post["acpt"]:
-                        for meta_box in post["acpt"]["meta"]:
-                            if "meta_box" in meta_box:
-                                box_name = meta_box["meta_box"]
-                                
-                                if box_name not in all_meta_boxes:
-                                    all_meta_boxes[box_name] = set()
-                                
-                                if "meta_fields" in meta_box:
-                                    for field in meta_box["meta_fields"]:
-                                        if "name" in field:
-                                            all_meta_boxes[box_name].add(field["name"])
-                
                 # Select meta fields to update
                 meta_updates = []
                 
-                for box_name, fields in all_meta_boxes.items():
-                    with st.expander(f"Meta Box: {box_name}"):
-                        st.markdown(f"### {box_name}")
+                if require_full_posts(post_type, "bulk_update_load_full"):
+                    # Collect all meta boxes and fields from selected posts
+                    flat = flat_posts()
+                    all_meta_boxes = meta_fields(flat, flat["ID"].isin([post.get("id") for post in selected_posts]))
+                
+                    for box_name, fields in all_meta_boxes.items():
+                        with st.expander(f"Meta Box: {box_name}"):
+                            st.markdown(f"### {box_name}")
                         
-                        for field_name in fields:
-                            if st.checkbox(f"Update {field_name}", key=f"update_{box_name}_{field_name}"):
-                                field_value = st.text_input(f"New value for {field_name}", key=f"value_{box_name}_{field_name}")
+                            for field_name in fields:
+                                if st.checkbox(f"Update {field_name}", key=f"update_{box_name}_{field_name}"):
+                                    field_value = st.text_input(f"New value for {field_name}", key=f"value_{box_name}_{field_name}")
                                 
-                                meta_updates.append({
-                                    "box": box_name,
-                                    "field": field_name,
-                                    "value": field_value
-                                })
+                                    meta_updates.append({
+                                        "box": box_name,
+                                        "field": field_name,
+                                        "value": field_value
+                                    })
             
             # Execute bulk update
             if st.button("Execute Bulk Update"):
@@ -2506,54 +2419,63 @@ with tab5:
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    # Get authentication details
-                    auth_token = st.session_state.auth_token if auth_method == "JWT/OAuth" else None
+                    # Prepare update data (identical for every selected post)
+                    update_data = {}
                     
-                    # Update posts
-                    success_count = 0
-                    error_count = 0
+                    if "Title" in update_fields and new_title:
+                        update_data["title"] = new_title
                     
-                    for i, post in enumerate(selected_posts):
-                        # Update progress
-                        progress = (i + 1) / len(selected_posts)
-                        progress_bar.progress(progress)
-                        status_text.text(f"Updating post {i+1} of {len(selected_posts)}")
-                        
-                        # Prepare update data
-                        update_data = {}
-                        
-                        if "Title" in update_fields and new_title:
-                            update_data["title"] = new_title
-                        
-                        if "Content" in update_fields and new_content:
-                            update_data["content"] = new_content
-                        
-                        if "Status" in update_fields:
-                            update_data["status"] = new_status
+                    if "Content" in update_fields and new_content:
+                        update_data["content"] = new_content
+                    
+                    if "Status" in update_fields:
+                        update_data["status"] = new_status
+                    
+                    if "ACPT Meta Fields" in update_fields and meta_updates:
+                        update_data["acpt"] = {
+                            "meta": meta_updates
+                        }
+                    
+                    def update_progress(done, total):
+                        progress_bar.progress(done / total)
+                        status_text.text(f"Updated {done} of {total} posts")
+                    
+                    # The payload is shared by every post, so validating it once covers them all
+                    validation_error = validate_post(update_data)
+                    if validation_error:
+                        st.error(f"Invalid update: {validation_error}. Nothing was sent")
+                    else:
+                        # Update posts as a resumable job on the bulk worker pool
+                        results = run_bulk_job(
+                            "update",
+                            f"Bulk update: {', '.join(update_fields)}",
+                            post_type,
+                            [update_request(post_type, post.get("id"), update_data) for post in selected_posts],
+                            on_progress=update_progress
+                        )
+                    
+                        if results is not None:
+                            success_count = 0
+                            error_count = 0
                         
-                        if "ACPT Meta Fields" in update_fields and meta_updates:
-                            update_data["acpt"] = {
-                                "meta": meta_updates
-                            }
+                            # Write results back into session state by post ID
+                            post_index = {p.get("id"): j for j, p in enumerate(st.session_state.posts)}
+                            for post, result in zip(selected_posts, results):
+                                if result:
+                                    success_count += 1
+                                    if post.get("id") in post_index:
+                                        st.session_state.posts[post_index[post.get("id")]] = result
+                                else:
+                                    error_count += 1
+                            posts_changed()
                         
-                        # Update post
-                        result = update_post(wp_url, post_type, post.get("id"), update_data, username, password, auth_token)
+                            persist_posts(post_type, results)
                         
-                        if result:
-                            success_count += 1
-                            
-                            # Update in session state
-                            for j, p in enumerate(st.session_state.posts):
-                                if p.get("id") == post.get("id"):
-                                    st.session_state.posts[j] = result
-                                    break
-                        else:
-                            error_count += 1
-                    
-                    # Final status
-                    st.success(f"Bulk update completed: {success_count} successful, {error_count} failed")
+                            # Final status
+                            st.success(f"Bulk update completed: {success_count} successful, {error_count} failed")
+                            show_bulk_failures(results)
         else:
-            st.warning("No posts have been fetched. Go to the 'View Posts' tab and fetch posts first")
+            st.warning("No posts have been fetched. Go to the 'View Posts' section and fetch posts first")
     
     elif operation_type == "Bulk Delete":
         st.subheader("Bulk Delete Posts")
@@ -2603,39 +2525,162 @@ with tab5:
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    # Get authentication details
-                    auth_token = st.session_state.auth_token if auth_method == "JWT/OAuth" else None
+                    def update_progress(done, total):
+                        progress_bar.progress(done / total)
+                        status_text.text(f"Deleted {done} of {total} posts")
                     
-                    # Delete posts
-                    success_count = 0
-                    error_count = 0
-                    deleted_ids = []
+                    # Delete posts as a resumable job on the bulk worker pool
+                    results = run_bulk_job(
+                        "delete",
+                        f"Bulk delete: {len(selected_posts)} posts",
+                        post_type,
+                        [delete_request(post_type, post.get("id")) for post in selected_posts],
+                        on_progress=update_progress
+                    )
                     
-                    for i, post in enumerate(selected_posts):
-                        # Update progress
-                        progress = (i + 1) / len(selected_posts)
-                        progress_bar.progress(progress)
-                        status_text.text(f"Deleting post {i+1} of {len(selected_posts)}")
+                    if results is not None:
+                        deleted_ids = [post.get("id") for post, result in zip(selected_posts, results) if result]
+                        success_count = len(deleted_ids)
+                        persist_deletions(post_type, deleted_ids)
+                        error_count = len(results) - success_count
                         
-                        # Delete post
-                        result = delete_post(wp_url, post_type, post.get("id"), username, password, auth_token)
+                        # Update session state
+                        if deleted_ids:
+                            set_posts([p for p in st.session_state.posts if p.get("id") not in deleted_ids])
                         
-                        if result:
-                            success_count += 1
-                            deleted_ids.append(post.get("id"))
-                        else:
-                            error_count += 1
-                    
-                    # Update session state
-                    if deleted_ids:
-                        st.session_state.posts = [p for p in st.session_state.posts if p.get("id") not in deleted_ids]
-                    
-                    # Final status
-                    st.success(f"Bulk deletion completed: {success_count} successful, {error_count} failed")
+                        # Final status
+                        st.success(f"Bulk deletion completed: {success_count} successful, {error_count} failed")
+                        show_bulk_failures(results)
+        else:
+            st.warning("No posts have been fetched. Go to the 'View Posts' section and fetch posts first")
+    
+    elif operation_type == "Job History":
+        st.subheader("Bulk Job History")
+        
+        if not wp_client:
+            st.info("Connect to a site to see its bulk jobs")
         else:
-            st.warning("No posts have been fetched. Go to the 'View Posts' tab and fetch posts first")
+            jobs_df = job_journal.jobs(wp_client.base_url, wp_client.auth_identity)
+            
+            if jobs_df.empty:
+                st.info("No bulk jobs have been run against this site yet")
+            else:
+                running_ids = {status.job_id for status in job_runner.active(owner=job_owner)}
+                jobs_df["state"] = np.where(jobs_df["pending"] + jobs_df["unknown"] > 0, "Incomplete",
+                                            np.where(jobs_df["failed"] > 0, "Completed with failures", "Completed"))
+                jobs_df.loc[jobs_df["id"].isin(running_ids), "state"] = "Running"
+                jobs_df["created"] = pd.to_datetime(jobs_df["created"], unit="s").dt.strftime("%Y-%m-%d %H:%M:%S")
+                st.dataframe(jobs_df[["id", "label", "post_type", "created", "state", "total", "done", "failed",
+                                      "unknown", "pending"]], hide_index=True, use_container_width=True)
+                
+                labels = {row.id: f"{row.label} ({row.id}, {row.created})" for row in jobs_df.itertuples()}
+                job_id = st.selectbox("Select Job", list(labels), format_func=labels.get)
+                job = jobs_df[jobs_df["id"] == job_id].iloc[0]
+                
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Done", int(job["done"]))
+                col2.metric("Failed", int(job["failed"]))
+                col3.metric("Unknown", int(job["unknown"]))
+                col4.metric("Pending", int(job["pending"]))
+                
+                if job["unknown"]:
+                    st.warning(f"{job['unknown']} items were in flight when the job stopped, so they may or may not "
+                               "have been applied. Resending them can create duplicate posts; check the site first")
+                
+                problem_items = job_journal.items(job_id, [FAILED, SENT], limit=500)
+                if not problem_items.empty:
+                    with st.expander(f"Failed and unknown items ({int(job['failed'] + job['unknown'])})"):
+                        st.dataframe(problem_items, hide_index=True, use_container_width=True)
+                
+                resend_unknown = st.checkbox("Resend items with unknown outcome", value=job["kind"] != "create",
+                                             key="job_resend_unknown")
+                
+                # A job still running in the background must not be resumed a second time
+                job_running = job_id in running_ids
+                if job_running:
+                    st.info("This job is running in the background; follow it under Background Jobs")
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    resume_clicked = st.button("Resume Job",
+                                               disabled=job_running or not (job["pending"] or job["unknown"]))
+                with col2:
+                    retry_clicked = st.button("Retry Failed Items", disabled=job_running or not job["failed"])
+                with col3:
+                    delete_clicked = st.button("Delete Job", disabled=job_running)
+                
+                if delete_clicked:
+                    job_journal.delete_job(job_id)
+                    st.success(f"Deleted job {job_id}")
+                elif resume_clicked or retry_clicked:
+                    if not st.session_state.connection_status:
+                        st.warning("Please test your connection before bulk operations")
+                    else:
+                        if retry_clicked:
+                            statuses, total = (FAILED,), int(job["failed"])
+                        elif resend_unknown:
+                            statuses, total = (PENDING, SENT), int(job["pending"] + job["unknown"])
+                        else:
+                            statuses, total = (PENDING,), int(job["pending"])
+                        
+                        if run_in_background:
+                            submit_job(job_id, job["kind"], f"{job['label']} ({'retry' if retry_clicked else 'resume'})",
+                                       job["post_type"], lambda status: job_journal.outstanding(job_id, statuses),
+                                       total=total, apply_to_session=True)
+                        else:
+                            progress_bar = st.progress(0)
+                            status_text = st.empty()
+                            job_post_type = job["post_type"]
+                            success_count = error_count = 0
+                            deleted_ids = []
+                            changed_posts = []
+                            
+                            # Only the selected items are sent; everything already done stays done
+                            for chunk, results in run_job(wp_client, job_journal, job_id, job_post_type,
+                                                          job_journal.outstanding(job_id, statuses),
+                                                          use_batch=use_batch_api, max_workers=int(bulk_workers)):
+                                success_count += sum(1 for result in results if result)
+                                error_count += sum(1 for result in results if not result)
+                                if job["kind"] == "delete":
+                                    deleted_ids.extend(request_post_id(sub_request)
+                                                       for (_, sub_request), result in zip(chunk, results) if result)
+                                else:
+                                    persist_posts(job_post_type, results)
+                                    changed_posts.extend(result for result in results if result)
+                                progress_bar.progress(min((success_count + error_count) / max(total, 1), 1.0))
+                                status_text.text(f"Sent {success_count + error_count} of {total} items")
+                            
+                            if deleted_ids:
+                                persist_deletions(job_post_type, deleted_ids)
+                                if st.session_state.get("posts"):
+                                    set_posts([p for p in st.session_state.posts if p.get("id") not in deleted_ids])
+                            
+                            # Apply the sent posts to the session like the first run, when it shows this post type
+                            if changed_posts and job_post_type == post_type:
+                                if job["kind"] == "create":
+                                    set_posts(st.session_state.get("posts", []) + changed_posts)
+                                elif st.session_state.get("posts"):
+                                    updated = {result.get("id"): result for result in changed_posts}
+                                    set_posts([updated.get(p.get("id"), p) for p in st.session_state.posts])
+                            
+                            st.success(f"Job {job_id}: {success_count} successful, {error_count} failed")
+
+profiler.stop()
+
+# Request diagnostics go last so they include the requests made during this rerun
+with st.sidebar, profiler.section("Request Diagnostics"):
+    show_request_diagnostics(wp_client)
+with st.sidebar, profiler.section("Background Jobs"):
+    # Poll while jobs are active, where this Streamlit has fragments
+    if hasattr(st, "fragment"):
+        st.fragment(run_every=2 if job_runner.active(owner=job_owner) else None)(show_background_jobs)()
+    else:
+        show_background_jobs()
 
 # Footer
 st.markdown("---")
 st.markdown("WordPress ACPT Manager Pro - Built with Streamlit")
 st.markdown("© 2023 - All rights reserved")
+
+with st.sidebar:
+    show_rerun_profile(profiler.finish())
@@ -0,0 +1,146 @@
+import json
+import math
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from flatten import flatten_posts
+
+DEFAULT_ROW_GROUP_SIZE = 10000  # Rows per Parquet row group / Arrow record batch on export
+
+PARQUET_MAGIC = b"PAR1"
+ARROW_FILE_MAGIC = b"ARROW1"
+ARROW_STREAM_MAGIC = b"\xff\xff\xff\xff"  # Continuation marker that opens an Arrow IPC stream
+
+# Field metadata tying a column to its ACPT meta field. Values Arrow cannot
+# type as one column (mixed types, objects) are stored as JSON text and
+# marked with an encoding so they import back unchanged.
+BOX_KEY, FIELD_KEY, ENCODING_KEY = b"acpt_box", b"acpt_field", b"acpt_encoding"
+
+# Post properties for the fixed columns, exported and accepted on import
+BASE_COLUMNS = {"Title": "title", "Content": "content", "Status": "status", "Date": "date"}
+
+
+def _missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+def _has_struct(data_type):
+    if pa.types.is_struct(data_type):
+        return True
+    return (pa.types.is_list(data_type) or pa.types.is_large_list(data_type)) and _has_struct(data_type.value_type)
+
+def _arrow_column(values):
+    """Return ``(array, encoding)``: a typed Arrow array, or JSON text when the values have no single type."""
+    try:
+        array = pa.array(values, from_pandas=True)
+        # Objects would come back with a null for every key another row had
+        if not _has_struct(array.type):
+            return array, None
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    return pa.array([None if _missing(value) else json.dumps(value) for value in values], type=pa.string()), "json"
+
+
+def posts_table(posts):
+    """Return posts as an Arrow table: the flattened columns plus ``Content``, with typed ACPT columns.
+
+    Numbers, checkboxes and text keep their types and list fields stay
+    list columns. Each meta column carries its box and field in the field
+    metadata, so the table imports back into the same ACPT fields.
+    """
+    df = flatten_posts(posts, join_lists=False, content=True)
+    meta_columns = df.attrs["meta_fields"]
+    fields, arrays = [], []
+    for name in df.columns:
+        array, encoding = _arrow_column(df[name])
+        metadata = {}
+        if name in meta_columns:
+            box, field = meta_columns[name]
+            metadata = {BOX_KEY: box.encode(), FIELD_KEY: field.encode()}
+        if encoding:
+            metadata[ENCODING_KEY] = encoding.encode()
+        fields.append(pa.field(name, array.type, metadata=metadata or None))
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+def write_parquet(table, sink, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+    pq.write_table(table, sink, row_group_size=row_group_size)
+
+def write_arrow(table, sink, batch_size=DEFAULT_ROW_GROUP_SIZE):
+    """Write ``table`` to ``sink`` in the Arrow IPC file format (``.arrow`` / Feather v2)."""
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=batch_size):
+            writer.write_batch(batch)
+
+
+def columnar_format(head):
+    """Return ``"parquet"``, ``"arrow"`` or ``"arrow_stream"`` for a file starting with ``head``, else None."""
+    if head.startswith(PARQUET_MAGIC):
+        return "parquet"
+    if head.startswith(ARROW_FILE_MAGIC):
+        return "arrow"
+    if head.startswith(ARROW_STREAM_MAGIC):
+        return "arrow_stream"
+    return None
+
+def _batches(fileobj, file_format):
+    if file_format == "parquet":
+        parquet = pq.ParquetFile(fileobj)
+        for index in range(parquet.num_row_groups):
+            yield parquet.read_row_group(index)
+    elif file_format == "arrow":
+        reader = pa.ipc.open_file(fileobj)
+        for index in range(reader.num_record_batches):
+            yield reader.get_batch(index)
+    else:
+        yield from pa.ipc.open_stream(fileobj)
+
+def _column_roles(schema):
+    """Map each column to the post property or ``(box, field, encoding)`` it imports into."""
+    roles = {}
+    for field in schema:
+        metadata = field.metadata or {}
+        if BOX_KEY in metadata and FIELD_KEY in metadata:
+            encoding = metadata.get(ENCODING_KEY, b"").decode() or None
+            roles[field.name] = (metadata[BOX_KEY].decode(), metadata[FIELD_KEY].decode(), encoding)
+        elif field.name in BASE_COLUMNS or field.name.lower() in BASE_COLUMNS.values():
+            roles[field.name] = BASE_COLUMNS.get(field.name, field.name.lower())
+        elif "." in field.name:
+            # Files from other tools can name meta columns "box.field"
+            box, name = field.name.split(".", 1)
+            roles[field.name] = (box, name, None)
+    return roles
+
+def iter_columnar_items(fileobj, file_format):
+    """Yield ``(row, post, error)`` from a Parquet or Arrow IPC file, one row group / record batch at a time.
+
+    Rows become write-format posts: ``Title``/``Content``/``Status``/``Date``
+    (or their lowercase names) set the post properties and ACPT columns,
+    recognised by their field metadata or a ``box.field`` name, become
+    ``acpt.meta`` items. Null cells are left out. Other columns, such as
+    ``ID``, are ignored.
+    """
+    row = 0
+    for batch in _batches(fileobj, file_format):
+        roles = _column_roles(batch.schema)
+        for record in batch.to_pylist():
+            row += 1
+            post, meta, error = {}, [], None
+            for name, role in roles.items():
+                value = record.get(name)
+                if _missing(value):
+                    continue
+                if isinstance(role, str):
+                    if value != "":
+                        post[role] = value
+                    continue
+                box, field, encoding = role
+                if encoding == "json":
+                    try:
+                        value = json.loads(value)
+                    except (TypeError, json.JSONDecodeError) as e:
+                        error = f"row {row}: column {name} is not valid JSON ({e})"
+                meta.append({"box": box, "field": field, "value": value})
+            if meta:
+                post["acpt"] = {"meta": meta}
+            yield row, None if error else post, error
@@ -0,0 +1,268 @@
+"""Throughput benchmark for the app's REST layer.
+
+Drives the same functions the UI uses: ``run_requests`` for Bulk Create /
+Bulk Import, Bulk Update and Bulk Delete, and ``get_posts`` for View Posts
+and Export. For each phase it reports posts/sec, p50/p95/p99 HTTP latency and
+error counts. Without ``--url`` it starts a local ``mock_wp_server`` with the
+requested latency, jitter and error rate::
+
+    python benchmark.py --posts 2000 --latency 0.03 --jitter 0.01 --error-rate 0.02
+    python benchmark.py --url https://staging.example.com --username admin --password "app pass"
+
+``--flatten`` instead times the post-flattening engine behind the CSV export
+and the View Posts table against the per-row loop it replaced, on synthetic
+posts (no server involved)::
+
+    python benchmark.py --flatten 1000,10000,100000
+"""
+import argparse
+import json
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+import mock_wp_server
+from bulk import run_requests, DEFAULT_BULK_WORKERS
+from flatten import flatten_posts
+from throttle import AdaptiveLimiter
+from wp_api import (
+    APIError, WPClient, get_posts, create_request, update_request, delete_request,
+    DEFAULT_PAGE_WORKERS, DEFAULT_MAX_RETRIES
+)
+
+PHASES = ("create", "fetch", "update", "delete")
+
+
+class RequestRecorder:
+    """Collects the latency and status of every HTTP request a client sends.
+
+    Latency is timed with ``perf_counter`` around the whole
+    ``session.request`` call, so it runs until the response body has been
+    read; ``response.elapsed`` stops when the headers arrive.
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self.statuses = Counter()
+        self._lock = threading.Lock()
+        self._session = None
+        self._request = None
+
+    def attach(self, session):
+        self._session, self._request = session, session.request
+        session.request = self._timed_request
+
+    def detach(self):
+        if self._session is not None:
+            self._session.request = self._request
+            self._session = self._request = None
+
+    def _timed_request(self, *args, **kwargs):
+        started = time.perf_counter()
+        response = self._request(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.latencies.append(elapsed)
+            self.statuses[response.status_code] += 1
+        return response
+
+    def reset(self):
+        with self._lock:
+            self.latencies = []
+            self.statuses = Counter()
+
+
+def _payload(i, run_id):
+    return {
+        "title": f"Benchmark {run_id} #{i}",
+        "content": f"<p>Benchmark post {i}</p>",
+        "status": "publish",
+        "acpt": {"meta": [
+            {"box": "details", "field": "price", "value": i % 500 + 0.99},
+            {"box": "details", "field": "sku", "value": f"BENCH-{run_id}-{i:06d}"},
+            {"box": "details", "field": "in_stock", "value": i % 3 != 0}
+        ]}
+    }
+
+def _summarise(phase, posts, errors, seconds, recorder):
+    latencies = np.array(recorder.latencies) * 1000
+    percentiles = np.percentile(latencies, [50, 95, 99]) if len(latencies) else [float("nan")] * 3
+    return {
+        "phase": phase,
+        "posts": posts,
+        "seconds": round(seconds, 3),
+        "posts_per_sec": round(posts / seconds, 1) if seconds else 0.0,
+        "requests": len(recorder.latencies),
+        "p50_ms": round(float(percentiles[0]), 1),
+        "p95_ms": round(float(percentiles[1]), 1),
+        "p99_ms": round(float(percentiles[2]), 1),
+        "errors": errors,
+        "http_errors": sum(count for status, count in recorder.statuses.items() if status >= 400)
+    }
+
+def run_benchmark(client, post_type, count, phases=PHASES, use_batch=True, max_workers=DEFAULT_BULK_WORKERS,
+                  page_workers=DEFAULT_PAGE_WORKERS):
+    """Run the selected phases against ``client`` and return one summary dict per phase.
+
+    ``errors`` counts posts whose operation ultimately failed; ``http_errors``
+    counts every 4xx/5xx response, including ones that were retried.
+    """
+    recorder = RequestRecorder()
+    recorder.attach(client.session)
+    run_id = int(time.time())
+    ids = []
+    results = []
+
+    for phase in phases:
+        recorder.reset()
+        started = time.perf_counter()
+
+        if phase == "create":
+            outcome = run_requests(client, post_type, [create_request(post_type, _payload(i, run_id)) for i in range(count)],
+                                   use_batch=use_batch, max_workers=max_workers)
+            ids = [post["id"] for post in outcome if not isinstance(post, APIError) and isinstance(post, dict)]
+            posts, errors = len(outcome), sum(isinstance(post, APIError) for post in outcome)
+        elif phase == "fetch":
+            outcome = get_posts(None, post_type, params={"status": "any"}, client=client, max_workers=page_workers,
+                                use_cache=False)
+            if isinstance(outcome, APIError):
+                posts, errors = 0, 1
+            else:
+                json.dumps(outcome)  # Serialising is part of what Export pays for
+                posts, errors = len(outcome), 0
+        elif phase == "update":
+            outcome = run_requests(client, post_type,
+                                   [update_request(post_type, post_id, {"acpt": {"meta": [
+                                       {"box": "details", "field": "price", "value": 1.0}]}}) for post_id in ids],
+                                   use_batch=use_batch, max_workers=max_workers)
+            posts, errors = len(outcome), sum(isinstance(post, APIError) for post in outcome)
+        elif phase == "delete":
+            outcome = run_requests(client, post_type, [delete_request(post_type, post_id) for post_id in ids],
+                                   use_batch=use_batch, max_workers=max_workers)
+            posts, errors = len(outcome), sum(isinstance(post, APIError) for post in outcome)
+        else:
+            raise ValueError(f"Unknown phase {phase!r}")
+
+        results.append(_summarise(phase, posts, errors, time.perf_counter() - started, recorder))
+
+    recorder.detach()
+    return results
+
+def _fetched_post(i):
+    # Shaped like a REST response: read-format meta with a list field
+    return {
+        "id": i + 1,
+        "title": {"rendered": f"Benchmark #{i}"},
+        "status": "publish" if i % 4 else "draft",
+        "date": f"2024-{i % 12 + 1:02d}-01T00:00:00",
+        "acpt": {"meta": [{"meta_box": "details", "meta_fields": [
+            {"name": "price", "type": "Number", "value": i % 500 + 0.99},
+            {"name": "sku", "type": "Text", "value": f"BENCH-{i:06d}"},
+            {"name": "in_stock", "type": "Toggle", "value": i % 3 != 0},
+            {"name": "tags", "type": "Select multi", "value": ["a", "b"] if i % 2 else ["c"]}
+        ]}]}
+    }
+
+def _flatten_rows(posts):
+    # The per-row loop the CSV export used before flatten_posts
+    rows = []
+    for post in posts:
+        row = {"ID": post.get("id"), "Title": post.get("title", {}).get("rendered", "No Title"),
+               "Status": post.get("status", ""), "Date": post.get("date", "")}
+        for meta_box in post.get("acpt", {}).get("meta", []):
+            for field in meta_box.get("meta_fields", []):
+                value = field.get("value", "")
+                row[f"{meta_box['meta_box']}_{field['name']}"] = ", ".join(str(v) for v in value) \
+                    if isinstance(value, list) else value
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+def run_flatten_benchmark(sizes, repeat=3):
+    """Time ``flatten_posts`` and the per-row loop on ``sizes`` synthetic posts (best of ``repeat``).
+
+    Returns one summary dict per size.
+    """
+    results = []
+    for size in sizes:
+        posts = [_fetched_post(i) for i in range(size)]
+        timings = {}
+        for name, flatten in (("rows", _flatten_rows), ("engine", flatten_posts)):
+            for _ in range(repeat):
+                started = time.perf_counter()
+                df = flatten(posts)
+                timings[name] = min(timings.get(name, float("inf")), time.perf_counter() - started)
+        results.append({
+            "posts": size,
+            "columns": len(df.columns),
+            "rows_sec": round(timings["rows"], 3),
+            "engine_sec": round(timings["engine"], 3),
+            "engine_posts_per_sec": round(size / timings["engine"], 1) if timings["engine"] else 0.0
+        })
+    return results
+
+def format_table(results, columns=("phase", "posts", "seconds", "posts_per_sec", "requests", "p50_ms", "p95_ms",
+                                   "p99_ms", "errors", "http_errors")):
+    widths = {column: max(len(column), *(len(str(row[column])) for row in results)) for column in columns}
+    lines = ["  ".join(column.rjust(widths[column]) for column in columns)]
+    for row in results:
+        lines.append("  ".join(str(row[column]).rjust(widths[column]) for column in columns))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk create/fetch/update/delete throughput.")
+    parser.add_argument("--url", help="WordPress site to benchmark (default: start a local mock server)")
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--token")
+    parser.add_argument("--post-type", default="posts")
+    parser.add_argument("--posts", type=int, default=500, help="Posts to create, update and delete")
+    parser.add_argument("--phases", default=",".join(PHASES), help="Comma-separated subset of " + ", ".join(PHASES))
+    parser.add_argument("--workers", type=int, default=DEFAULT_BULK_WORKERS, help="Bulk operation workers")
+    parser.add_argument("--page-workers", type=int, default=DEFAULT_PAGE_WORKERS)
+    parser.add_argument("--no-batch", action="store_true", help="Send one request per post instead of batch/v1")
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--fixed-concurrency", action="store_true", help="Disable adaptive concurrency")
+    parser.add_argument("--max-retries", type=int, default=DEFAULT_MAX_RETRIES)
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock server base latency (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Mock server latency jitter (seconds)")
+    parser.add_argument("--write-latency", type=float, default=0.0, help="Mock server cost per written post (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Mock server injected error rate")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--flatten", metavar="SIZES",
+                        help="Benchmark post flattening on comma-separated post counts instead, e.g. 1000,10000")
+    args = parser.parse_args()
+
+    if args.flatten:
+        results = run_flatten_benchmark([int(size) for size in args.flatten.split(",") if size.strip()])
+        print(json.dumps(results, indent=2) if args.json else format_table(results, list(results[0])))
+        return
+
+    server = None
+    url = args.url
+    if not url:
+        site = mock_wp_server.MockSite(latency=args.latency, jitter=args.jitter, write_latency=args.write_latency,
+                                       error_rate=args.error_rate, seed=args.seed)
+        server, url = mock_wp_server.serve(site)
+
+    limiter = AdaptiveLimiter(args.workers, max_rps=args.max_rps, adaptive=not args.fixed_concurrency)
+    client = WPClient(url, args.username, args.password, args.token, pool_size=max(args.workers, args.page_workers),
+                      limiter=limiter, max_retries=args.max_retries)
+    try:
+        results = run_benchmark(client, args.post_type, args.posts,
+                                phases=[phase.strip() for phase in args.phases.split(",") if phase.strip()],
+                                use_batch=not args.no_batch, max_workers=args.workers, page_workers=args.page_workers)
+    finally:
+        client.close()
+        if server:
+            server.shutdown()
+
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+
+
+if __name__ == "__main__":
+    main()
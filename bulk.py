@@ -0,0 +1,101 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from wp_api import BATCH_MAX_REQUESTS, APIError, send_batch, send_request, supports_batch
+
+DEFAULT_BULK_WORKERS = 8
+DEFAULT_PIPELINE_DEPTH = 2
+
+
+def run_bulk(func, items, max_workers=DEFAULT_BULK_WORKERS, on_progress=None):
+    """Call ``func(item)`` for every item on a worker pool.
+
+    Returns a list of results in the same order as ``items``; an item whose call
+    raised gets an ``APIError``, matching the API functions' failure value.
+    ``on_progress(done, total)`` is invoked on the calling thread each time an
+    item finishes, so it can safely drive Streamlit progress widgets.
+    """
+    items = list(items)
+    total = len(items)
+    results = [None] * total
+    if not total:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as executor:
+        futures = {executor.submit(func, item): i for i, item in enumerate(items)}
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = APIError("processing", str(e))
+
+            if on_progress:
+                on_progress(done, total)
+
+    return results
+
+
+def run_requests(client, post_type, sub_requests, use_batch=True, max_workers=DEFAULT_BULK_WORKERS, on_progress=None):
+    """Execute batch-style write sub-requests for ``post_type``.
+
+    When ``use_batch`` is set and the site advertises batch support for the post
+    type, sub-requests are packed ``BATCH_MAX_REQUESTS`` at a time into batch/v1
+    calls that run on the worker pool; otherwise each one is sent as its own
+    request. Either way the per-item results come back in input order.
+    """
+    sub_requests = list(sub_requests)
+    total = len(sub_requests)
+
+    if not (use_batch and total and supports_batch(client, post_type)):
+        return run_bulk(lambda sub_request: send_request(client, sub_request), sub_requests,
+                        max_workers=max_workers, on_progress=on_progress)
+
+    chunks = [sub_requests[i:i + BATCH_MAX_REQUESTS] for i in range(0, total, BATCH_MAX_REQUESTS)]
+
+    def chunk_progress(done, _):
+        if on_progress:
+            on_progress(min(done * BATCH_MAX_REQUESTS, total), total)
+
+    chunk_results = run_bulk(lambda chunk: send_batch(client, chunk), chunks,
+                             max_workers=max_workers, on_progress=chunk_progress)
+
+    results = []
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        results.extend(chunk_result if isinstance(chunk_result, list) else [chunk_result] * len(chunk))
+    return results
+
+
+def run_pipelined(func, chunks, depth=DEFAULT_PIPELINE_DEPTH):
+    """Call ``func(chunk)`` for each chunk in the background, ``depth`` chunks at a time.
+
+    Yields ``(chunk, result)`` in input order. The next chunk is pulled from
+    ``chunks`` (e.g. parsed and validated from a file) while earlier ones are
+    still being sent, and at most ``depth`` chunks are in flight, so memory
+    stays bounded however long ``chunks`` is. A chunk whose call raised gets
+    an ``APIError`` as its result; if ``chunks`` itself raises, the chunks
+    already in flight are still yielded before the error propagates.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, depth)) as executor:
+        pending = deque()
+
+        def completed():
+            chunk, future = pending.popleft()
+            try:
+                return chunk, future.result()
+            except Exception as e:
+                return chunk, APIError("processing", str(e))
+
+        try:
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(func, chunk)))
+                if len(pending) >= depth:
+                    yield completed()
+        except Exception:
+            # The source failed (e.g. a parse error): report the chunks already sent, then re-raise
+            while pending:
+                yield completed()
+            raise
+
+        while pending:
+            yield completed()
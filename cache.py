@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+DEFAULT_CACHE_ENTRIES = 512
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_CACHE_TTL = 600  # seconds
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET responses used for conditional requests.
+
+    Keys are ``(site, auth_identity, post_type, params)`` tuples. Entries hold
+    the raw response body plus the validators (``ETag`` / ``Last-Modified``)
+    needed to revalidate it, and are evicted once older than ``ttl`` or when
+    the cache exceeds ``max_entries`` or ``max_bytes``.
+    """
+
+    def __init__(self, max_entries=DEFAULT_CACHE_ENTRIES, max_bytes=DEFAULT_CACHE_BYTES, ttl=DEFAULT_CACHE_TTL):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry["stored_at"] > self.ttl:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, content, etag=None, last_modified=None, headers=None):
+        if not (etag or last_modified) or len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = {
+                "content": content,
+                "etag": etag,
+                "last_modified": last_modified,
+                "headers": dict(headers or {}),
+                "stored_at": time.monotonic()
+            }
+            self.total_bytes += len(content)
+
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def touch(self, key):
+        """Mark an entry as freshly revalidated."""
+        with self._lock:
+            if key in self._entries:
+                self._entries[key]["stored_at"] = time.monotonic()
+                self._entries.move_to_end(key)
+
+    def invalidate(self, site, post_type=None):
+        """Drop every entry for ``site`` (optionally only for one post type)."""
+        with self._lock:
+            stale = [key for key in self._entries
+                     if key[0] == site and (post_type is None or key[2] == post_type)]
+            for key in stale:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self.total_bytes -= len(entry["content"])
+
+
+class FetchCoalescer:
+    """Process-wide request coalescing for whole fetches (singleflight).
+
+    Keys are ``(site, auth_identity, post_type, ...)`` tuples, so fetches are
+    only merged between sessions using the same site and credentials. When
+    several sessions ask for the same key at the same moment, only the first
+    runs the fetch; the others wait for and share its result. Nothing is kept
+    once the fetch finishes, so the next call always goes to the site (and
+    through the conditional-GET revalidation of ``ResponseCache``). Shared
+    values are read-only: callers get a new list but the post dicts inside it
+    are common to every waiting session and must not be modified in place.
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.coalesced = 0
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def run(self, key, fetch):
+        """Return ``fetch()``, or the result of the identical fetch already in flight for ``key``."""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            value = future.result()
+            return list(value) if isinstance(value, list) else value
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            self._release(key, future)
+            future.set_exception(e)
+            raise
+
+        self._release(key, future)
+        future.set_result(value)
+        return list(value) if isinstance(value, list) else value
+
+    def invalidate(self, site, post_type=None):
+        """Stop new callers from joining fetches for ``site`` that started before a write."""
+        with self._lock:
+            for key in [key for key in self._inflight
+                        if key[0] == site and (post_type is None or key[2] == post_type)]:
+                del self._inflight[key]
+
+    def _release(self, key, future):
+        with self._lock:
+            # The key may already belong to a newer fetch started after an invalidation
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from acpt_meta import iter_meta
+
+BASE_COLUMNS = ["ID", "Title", "Status", "Date"]
+LIST_SEPARATOR = ", "
+
+
+def _rendered(value, default=""):
+    # REST objects ({"rendered": ...}) or plain strings (templates, mock sites)
+    if isinstance(value, dict):
+        return value.get("rendered", default)
+    return value if isinstance(value, str) else default
+
+def _join_lists(values):
+    return [LIST_SEPARATOR.join(str(item) for item in value) if isinstance(value, list) else value
+            for value in values]
+
+def _typed(values, join_lists):
+    """Give a meta column the narrowest dtype its values allow; strings and mixed values stay objects."""
+    column = pd.Series(values, dtype=object)
+    inferred = pd.api.types.infer_dtype(column, skipna=True)
+    if inferred == "boolean":
+        return column.astype("boolean")
+    if inferred == "integer":
+        return column.astype("Int64")
+    if inferred in ("floating", "mixed-integer-float"):
+        return column.astype("float64")
+    if inferred == "mixed" and join_lists:
+        # Only columns holding lists (or other objects) are walked element by element
+        return pd.Series(np.fromiter(_join_lists(values), dtype=object, count=len(values)), dtype=object)
+    return column
+
+
+def flatten_posts(posts, join_lists=True, content=False):
+    """Flatten posts into one wide DataFrame: ``ID``, ``Title``, ``Status``, ``Date`` and a column per ACPT field.
+
+    Meta columns are named ``box_field`` (the CSV export's headers), in
+    first-seen order, and typed per column: nullable ``Int64``/``boolean``,
+    ``float64`` or object. With ``join_lists`` list values become
+    ``", "``-joined text, as in the CSV export. ``df.attrs["meta_fields"]``
+    maps each meta column to its ``(box, field)``. With ``content`` the
+    rendered post content is added as a ``Content`` column after ``Date``.
+
+    The nested ``acpt.meta`` formats are still walked post by post in
+    Python, so one call costs about the same as the per-row loop it
+    replaced (``benchmark.py --flatten``). The saving comes from callers
+    sharing one memoized frame instead of each walking the posts again.
+    """
+    ids, titles, statuses, dates, contents = [], [], [], [], []
+    collected = {}
+    for position, post in enumerate(posts):
+        if not isinstance(post, dict):
+            post = {}
+        ids.append(post.get("id"))
+        titles.append(_rendered(post.get("title"), "No Title"))
+        statuses.append(post.get("status", ""))
+        dates.append(post.get("date", ""))
+        if content:
+            contents.append(_rendered(post.get("content")))
+        for box, field, value in iter_meta(post):
+            column = collected.get((box, field))
+            if column is None:
+                column = collected[(box, field)] = ([], [])
+            column[0].append(position)
+            column[1].append(value)
+
+    count = len(ids)
+    df = pd.DataFrame({"ID": pd.array(ids, dtype="Int64"), "Title": titles, "Status": statuses, "Date": dates})
+    if content:
+        df["Content"] = contents
+
+    columns, wide = {}, {}
+    for (box, field), (positions, values) in collected.items():
+        key = f"{box}_{field}"
+        columns.setdefault(key, (box, field))
+        # Missing values stay None; a field repeated on one post keeps its last value
+        scattered = np.full(count, None, dtype=object)
+        scattered[np.asarray(positions)] = np.fromiter(values, dtype=object, count=len(values))
+        wide[key] = _typed(scattered, join_lists)
+    if wide:
+        df = pd.concat([df, pd.DataFrame(wide)], axis=1)
+
+    df.attrs["meta_fields"] = columns
+    return df
+
+def meta_fields(df, present_in=None):
+    """Return ``{box: [field, ...]}`` for a flattened frame's meta columns.
+
+    ``present_in`` is an optional boolean row mask; only fields with a value
+    in at least one of those rows are listed.
+    """
+    columns = df.attrs.get("meta_fields", {})
+    if present_in is not None and columns:
+        present = df.loc[present_in, list(columns)].notna().any()
+        columns = {key: box_field for key, box_field in columns.items() if present[key]}
+    fields = {}
+    for box, field in columns.values():
+        fields.setdefault(box, []).append(field)
+    return fields
@@ -0,0 +1,149 @@
+import gzip
+import io
+import json
+
+from arrow_io import columnar_format, iter_columnar_items
+
+DEFAULT_READ_SIZE = 1 << 20  # 1 MB of text per read
+DEFAULT_CHUNK_SIZE = 200  # Items validated and dispatched together
+MAX_ITEM_CHARS = 32 << 20  # A single array element larger than this is treated as corrupt input
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def iter_ndjson(text):
+    """Yield ``(line_number, item, error)`` for each non-blank line of NDJSON/JSONL text.
+
+    A line that is not valid JSON yields ``item=None`` and the parse error,
+    so one bad line fails on its own instead of aborting the import.
+    """
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"line {line_number}: invalid JSON ({e.msg} at column {e.colno})"
+
+def iter_json_array(text, read_size=DEFAULT_READ_SIZE):
+    """Yield ``(index, item, None)`` for each element of a JSON array, reading ``text`` incrementally.
+
+    Only the current element and one read buffer are held in memory. A
+    syntax error in the array itself cannot be skipped past and raises
+    ``ValueError``; elements before it have already been yielded.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        data = text.read(read_size)
+        eof = not data
+        buffer, pos = buffer[pos:] + data, 0
+        return not eof
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return buffer[pos] if pos < len(buffer) else ""
+
+    if skip_whitespace() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    if skip_whitespace() == "]":
+        return
+
+    index = 0
+    while True:
+        # A value ending exactly at the buffer end may be a truncated number; read more first
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                if end < len(buffer) or eof:
+                    break
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise ValueError(f"Invalid JSON in array element {index + 1}: {e.msg}") from e
+            if len(buffer) - pos > MAX_ITEM_CHARS:
+                raise ValueError(f"Array element {index + 1} is larger than {MAX_ITEM_CHARS // (1 << 20)} MB")
+            fill()
+
+        pos = end
+        yield index, item, None
+        index += 1
+
+        separator = skip_whitespace()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' after array element {index}")
+        pos += 1
+        skip_whitespace()
+
+def iter_import_items(fileobj, read_size=DEFAULT_READ_SIZE):
+    """Yield ``(number, item, error)`` from an uploaded JSON array, NDJSON, Parquet or Arrow file.
+
+    None of them is loaded whole. Gzip (``.json.gz``, ``.ndjson.gz``),
+    Parquet and Arrow IPC files are recognised by their magic bytes: gzip is
+    decompressed on the fly and its contents sniffed again; Parquet and
+    Arrow are read a row group / record batch at a time (``number`` is the
+    row). Otherwise the first non-blank character decides: ``[`` means a
+    JSON array (``number`` is the 1-based element), anything else NDJSON
+    (``number`` is the line). ``fileobj`` is a binary, seekable file such
+    as a Streamlit upload.
+    """
+    raw_head = fileobj.read(4096)
+    fileobj.seek(0)
+    if raw_head.startswith(GZIP_MAGIC):
+        # Decompressed as it is read; the archive may hold any of the formats below
+        try:
+            with gzip.GzipFile(fileobj=fileobj, mode="rb") as archive:
+                yield from iter_import_items(archive, read_size)
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Could not decompress the file: {e}") from e
+        finally:
+            fileobj.seek(0)
+        return
+
+    file_format = columnar_format(raw_head)
+    if file_format:
+        try:
+            yield from iter_columnar_items(fileobj, file_format)
+        finally:
+            fileobj.seek(0)
+        return
+
+    head = raw_head.decode("utf-8-sig", errors="ignore").lstrip()
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline=None)
+    try:
+        if head.startswith("["):
+            for index, item, error in iter_json_array(text, read_size):
+                yield index + 1, item, error
+        else:
+            yield from iter_ndjson(text)
+    finally:
+        # Leave the caller's file open (and rewound) for another pass
+        text.detach()
+        fileobj.seek(0)
+
+def chunked(iterable, size=DEFAULT_CHUNK_SIZE):
+    """Yield lists of up to ``size`` consecutive items.
+
+    If ``iterable`` raises, the items read so far are yielded as a final
+    chunk before the error propagates.
+    """
+    chunk = []
+    try:
+        for item in iterable:
+            chunk.append(item)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    except Exception:
+        if chunk:
+            yield chunk
+        raise
+    if chunk:
+        yield chunk
@@ -0,0 +1,176 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_JOBS = 2  # Jobs running at once; the rest wait in the queue
+DEFAULT_KEEP_FINISHED = 50
+DEFERRED_TTL = 600  # Seconds a finished job keeps results its session has not collected
+MAX_ERRORS_KEPT = 200
+
+QUEUED, RUNNING, COMPLETED, CANCELLED, CRASHED = "queued", "running", "completed", "cancelled", "crashed"
+
+
+class JobStatus:
+    """Live, thread-safe progress of one background job.
+
+    The job function reports through ``add_results``; the UI reads
+    ``snapshot()``. Results the submitting session still has to apply to its
+    own state (e.g. updated posts) are queued with ``defer`` and collected
+    with ``drain(session)``, which only hands them to the session that
+    submitted the job. Uncollected results are dropped ``DEFERRED_TTL``
+    seconds after the job finishes, or when the job is pruned.
+    """
+
+    def __init__(self, job_id, label, kind, post_type, total=None, owner=None, session=None):
+        self.job_id = job_id
+        self.label = label
+        self.kind = kind
+        self.post_type = post_type
+        self.total = total
+        self.owner = owner
+        self.session = session
+        self.state = QUEUED
+        self.succeeded = 0
+        self.failed = 0
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.errors = deque(maxlen=MAX_ERRORS_KEPT)
+        self._deferred = []
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def add_results(self, pairs):
+        """Count ``(index, result)`` pairs; falsy results (``APIError``) are failures."""
+        with self._lock:
+            for index, result in pairs:
+                if result:
+                    self.succeeded += 1
+                else:
+                    self.failed += 1
+                    self.errors.append((index, str(result)))
+
+    def defer(self, items):
+        with self._lock:
+            self._deferred.extend(items)
+
+    def drain(self, session):
+        """Return and clear the deferred results if ``session`` submitted the job; otherwise leave them queued."""
+        if session is None or session != self.session:
+            return []
+        with self._lock:
+            items, self._deferred = self._deferred, []
+        return items
+
+    def discard_deferred(self):
+        with self._lock:
+            self._deferred = []
+
+    def snapshot(self):
+        with self._lock:
+            processed = self.succeeded + self.failed
+            elapsed = ((self.finished or time.time()) - self.started) if self.started else 0.0
+            rate = processed / elapsed if elapsed > 0 else 0.0
+            remaining = (self.total - processed) if self.total is not None else None
+            return {
+                "job_id": self.job_id,
+                "label": self.label,
+                "kind": self.kind,
+                "post_type": self.post_type,
+                "state": self.state,
+                "total": self.total,
+                "processed": processed,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "elapsed": elapsed,
+                "rate": rate,
+                "eta": remaining / rate if self.state == RUNNING and rate and remaining is not None else None,
+                "error": self.error,
+                "errors": list(self.errors)
+            }
+
+
+class JobRunner:
+    """Process-wide pool that runs bulk jobs outside the Streamlit script run.
+
+    ``submit(func, ...)`` queues ``func(status)`` and returns its
+    ``JobStatus`` immediately, so the script finishes and the UI stays
+    responsive. Reruns and widget interactions do not touch running jobs;
+    sessions poll ``jobs()`` for progress. ``func`` should check
+    ``status.cancelled`` between chunks.
+    """
+
+    def __init__(self, max_jobs=DEFAULT_MAX_JOBS, keep_finished=DEFAULT_KEEP_FINISHED):
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="bulk-job")
+        self._jobs = {}
+        self._keep_finished = keep_finished
+        self._lock = threading.Lock()
+
+    def submit(self, func, job_id, label, kind, post_type, total=None, owner=None, session=None):
+        status = JobStatus(job_id, label, kind, post_type, total=total, owner=owner, session=session)
+        with self._lock:
+            self._jobs[job_id] = status
+            self._prune()
+        self._executor.submit(self._run, func, status)
+        return status
+
+    def _run(self, func, status):
+        if status.cancelled:
+            status.state, status.finished = CANCELLED, time.time()
+            return
+        status.state, status.started = RUNNING, time.time()
+        try:
+            func(status)
+            status.state = CANCELLED if status.cancelled else COMPLETED
+        except Exception as e:
+            status.state = CRASHED
+            status.error = f"{type(e).__name__}: {e}"
+            logger.exception("Background job %s crashed", status.job_id)
+        finally:
+            status.finished = time.time()
+
+    def _prune(self):
+        finished = [status for status in self._jobs.values() if status.finished]
+        expired = time.time() - DEFERRED_TTL
+        for status in finished:
+            if status.finished < expired:
+                status.discard_deferred()
+        for status in sorted(finished, key=lambda status: status.finished)[:-self._keep_finished or None]:
+            status.discard_deferred()
+            del self._jobs[status.job_id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, owner=None):
+        """Return job statuses, newest first, optionally only those submitted by ``owner``."""
+        with self._lock:
+            self._prune()
+            jobs = list(self._jobs.values())
+        if owner is not None:
+            jobs = [status for status in jobs if status.owner == owner]
+        return sorted(jobs, key=lambda status: status.submitted, reverse=True)
+
+    def active(self, owner=None):
+        return [status for status in self.jobs(owner) if status.state in (QUEUED, RUNNING)]
+
+
+@st.cache_resource(show_spinner=False)
+def get_runner(max_jobs=DEFAULT_MAX_JOBS):
+    """Return the process-wide background job runner."""
+    return JobRunner(max_jobs)
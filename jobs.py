@@ -0,0 +1,227 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+import pandas as pd
+import streamlit as st
+
+from bulk import run_pipelined, run_requests, DEFAULT_BULK_WORKERS
+from import_stream import chunked
+from wp_api import BATCH_MAX_REQUESTS
+
+DEFAULT_JOURNAL_PATH = os.environ.get(
+    "ACPT_JOURNAL_PATH",
+    os.path.join(os.path.expanduser("~"), ".acpt_manager", "jobs.sqlite3")
+)
+
+# Item states. "sent" means the request left but its result was never recorded
+# (the run was interrupted), so whether it took effect on the site is unknown.
+PENDING, SENT, DONE, FAILED = "pending", "sent", "done", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    site TEXT NOT NULL,
+    account TEXT NOT NULL,
+    post_type TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    label TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_site ON jobs (site, account, created);
+
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    request TEXT,
+    status TEXT NOT NULL,
+    remote_id INTEGER,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (job_id, idx)
+);
+CREATE INDEX IF NOT EXISTS job_items_status ON job_items (job_id, status);
+"""
+
+
+def _remote_id(result):
+    if not isinstance(result, dict):
+        return None
+    post_id = result.get("id")
+    if post_id is None and isinstance(result.get("previous"), dict):
+        post_id = result["previous"].get("id")  # Deleted posts come back as {"deleted": true, "previous": {...}}
+    return post_id if isinstance(post_id, int) else None
+
+
+def request_post_id(sub_request):
+    """Return the post ID a sub-request targets (``/wp/v2/posts/42?force=true`` -> 42), or None."""
+    last = sub_request["path"].split("?")[0].rstrip("/").rsplit("/", 1)[-1]
+    return int(last) if last.isdigit() else None
+
+
+class JobJournal:
+    """On-disk checkpoint journal for bulk jobs.
+
+    Every item of a job is recorded with its index (position in the input,
+    or line number for streamed files), the sub-request to send and its
+    status: ``pending`` until dispatched, ``sent`` while in flight, then
+    ``done`` with the remote post ID or ``failed`` with the error. Items
+    that failed validation are stored as failed without a request, so they
+    are never retried. Results are written as each chunk completes, so an
+    interrupted job can be resumed from its last checkpoint without
+    re-sending what already succeeded.
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def create_job(self, site, account, post_type, kind, label=None):
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, site, account, post_type, kind, label, created, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, site, account, post_type, kind, label, now, now)
+            )
+        return job_id
+
+    def add_items(self, job_id, items):
+        """Record ``(index, sub_request, error)`` items; those with an error are failed up front."""
+        rows = [(job_id, index, None if error else json.dumps(request), FAILED if error else PENDING, error)
+                for index, request, error in items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO job_items (job_id, idx, request, status, error) VALUES (?, ?, ?, ?, ?)", rows)
+            self._touch(job_id)
+
+    def mark_sent(self, job_id, indices):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE job_items SET status = ?, attempts = attempts + 1 WHERE job_id = ? AND idx = ?",
+                [(SENT, job_id, index) for index in indices]
+            )
+            self._touch(job_id)
+
+    def record_results(self, job_id, results):
+        """Checkpoint ``(index, result)`` pairs; falsy results (``APIError``) are failures."""
+        rows = [(DONE, _remote_id(result), None, job_id, index) if result else
+                (FAILED, None, str(result), job_id, index)
+                for index, result in results]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE job_items SET status = ?, remote_id = ?, error = ? WHERE job_id = ? AND idx = ?", rows)
+            self._touch(job_id)
+
+    def finish(self, job_id):
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE jobs SET finished = ?, updated = ? WHERE id = ?",
+                               (time.time(), time.time(), job_id))
+
+    def _touch(self, job_id):
+        self._conn.execute("UPDATE jobs SET updated = ?, finished = NULL WHERE id = ?", (time.time(), job_id))
+
+    def get_job(self, job_id):
+        with self._lock:
+            cursor = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            return dict(zip([column[0] for column in cursor.description], row)) if row else None
+
+    def jobs(self, site, account, limit=50):
+        """Return the most recent jobs for a site and account, with per-status item counts."""
+        with self._lock:
+            df = pd.read_sql_query(
+                "SELECT j.id, j.label, j.kind, j.post_type, j.created, j.updated, j.finished, "
+                "COUNT(i.idx) AS total, "
+                "SUM(i.status = 'done') AS done, SUM(i.status = 'failed') AS failed, "
+                "SUM(i.status = 'sent') AS unknown, SUM(i.status = 'pending') AS pending "
+                "FROM jobs j LEFT JOIN job_items i ON i.job_id = j.id "
+                "WHERE j.site = ? AND j.account = ? GROUP BY j.id ORDER BY j.created DESC LIMIT ?",
+                self._conn, params=[site, account, limit]
+            )
+        for column in ("total", "done", "failed", "unknown", "pending"):
+            df[column] = df[column].fillna(0).astype(int)
+        return df
+
+    def outstanding(self, job_id, statuses=(PENDING,), page_size=1000):
+        """Yield ``(index, sub_request)`` for retryable items in the given states, in index order."""
+        placeholders = ",".join("?" * len(statuses))
+        last = None
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT idx, request FROM job_items WHERE job_id = ? AND status IN ({placeholders}) "
+                    f"AND request IS NOT NULL AND (? IS NULL OR idx > ?) ORDER BY idx LIMIT ?",
+                    (job_id, *statuses, last, last, page_size)
+                ).fetchall()
+            if not rows:
+                return
+            for index, request in rows:
+                yield index, json.loads(request)
+            last = rows[-1][0]
+
+    def items(self, job_id, statuses=None, limit=None):
+        """Return the job's items (index, status, remote ID, error, attempts) as a DataFrame."""
+        sql = "SELECT idx AS item, status, remote_id, error, attempts FROM job_items WHERE job_id = ?"
+        args = [job_id]
+        if statuses:
+            sql += f" AND status IN ({','.join('?' * len(statuses))})"
+            args.extend(statuses)
+        sql += " ORDER BY idx"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=args)
+
+    def delete_job(self, job_id):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM job_items WHERE job_id = ?", (job_id,))
+            self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+
+def run_job(client, journal, job_id, post_type, items, use_batch=True, max_workers=DEFAULT_BULK_WORKERS,
+            chunk_size=None):
+    """Send ``(index, sub_request)`` items for a journaled job, checkpointing every chunk.
+
+    Chunks (by default one batch call per worker) are pipelined through
+    ``run_pipelined``. Each chunk is marked ``sent`` before it is dispatched
+    and its results are recorded as soon as it completes, from the worker
+    thread, so progress survives the script being stopped. Yields
+    ``(chunk, results)`` in order.
+    """
+    chunk_size = chunk_size or max(1, max_workers) * BATCH_MAX_REQUESTS
+
+    def send(chunk):
+        indices = [index for index, _ in chunk]
+        journal.mark_sent(job_id, indices)
+        results = run_requests(client, post_type, [request for _, request in chunk],
+                               use_batch=use_batch, max_workers=max_workers)
+        journal.record_results(job_id, zip(indices, results))
+        return results
+
+    for chunk, results in run_pipelined(send, chunked(items, chunk_size)):
+        if not isinstance(results, list):
+            results = [results] * len(chunk)
+            journal.record_results(job_id, zip([index for index, _ in chunk], results))
+        yield chunk, results
+
+    journal.finish(job_id)
+
+
+@st.cache_resource(show_spinner=False)
+def get_journal(path=DEFAULT_JOURNAL_PATH):
+    """Return the process-wide job journal at ``path``."""
+    return JobJournal(path)
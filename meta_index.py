@@ -0,0 +1,133 @@
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from acpt_meta import iter_meta
+
+NUMBER, BOOLEAN, TEXT, LIST, MIXED = "number", "boolean", "text", "list", "mixed"
+
+
+def _kind(values):
+    kinds = set()
+    for value in values:
+        if isinstance(value, bool):
+            kinds.add(BOOLEAN)
+        elif isinstance(value, (int, float)):
+            kinds.add(NUMBER)
+        elif isinstance(value, str):
+            kinds.add(TEXT)
+        elif isinstance(value, list):
+            kinds.add(LIST)
+        else:
+            kinds.add(MIXED)
+        if len(kinds) > 1:
+            return MIXED
+    return kinds.pop() if kinds else MIXED
+
+
+def _hashable(value):
+    # Objects and nested lists are counted and displayed by their text
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+
+
+class FieldColumn:
+    """Every value of one ACPT field as typed arrays.
+
+    ``positions`` index into the posts list the index was built from and
+    ``post_ids`` hold the matching post IDs. ``values`` is a float64 array
+    for numeric fields, a bool array for checkboxes and an object array
+    otherwise; ``kind`` says which.
+    """
+
+    def __init__(self, box, field, positions, post_ids, values):
+        self.box = box
+        self.field = field
+        self.kind = _kind(values)
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.post_ids = np.asarray(post_ids, dtype=np.int64)
+        if self.kind == NUMBER:
+            self.values = np.asarray(values, dtype=np.float64)
+        elif self.kind == BOOLEAN:
+            self.values = np.asarray(values, dtype=bool)
+        else:
+            # fromiter keeps equal-length lists as list elements instead of broadcasting them
+            self.values = np.fromiter(values, dtype=object, count=len(values))
+
+    def __len__(self):
+        return len(self.values)
+
+    @cached_property
+    def flat_values(self):
+        """List fields' items flattened into one array (other kinds: the values themselves)."""
+        if self.kind != LIST:
+            return self.values
+        return np.fromiter((item for values in self.values for item in values), dtype=object)
+
+    @cached_property
+    def value_counts(self):
+        """Return a DataFrame of Value / Count, most common first (list items counted individually)."""
+        values = self.flat_values
+        if self.kind in (LIST, MIXED):
+            values = [_hashable(value) for value in values]
+        counts = pd.Series(values, dtype=object).value_counts().reset_index()
+        counts.columns = ["Value", "Count"]
+        return counts
+
+    @cached_property
+    def summary(self):
+        """Return ``describe()`` statistics for the values as a two-column DataFrame."""
+        return pd.Series(self.values, name="Value").describe().reset_index()
+
+    def frame(self, titles=None):
+        """Return Post ID / Post Title / Value rows; ``titles`` is the index's title array."""
+        data = {"Post ID": self.post_ids}
+        if titles is not None:
+            data["Post Title"] = titles[self.positions]
+        values = self.values
+        if self.kind in (LIST, MIXED):
+            values = [_hashable(value) for value in values]
+        data["Value"] = values
+        return pd.DataFrame(data)
+
+
+class MetaIndex:
+    """Columnar index of the ACPT meta values of a list of posts: box -> field -> ``FieldColumn``.
+
+    Built in one pass over the posts (both the REST read format and the
+    write format are understood); boxes and fields keep first-seen order.
+    Build it once per posts version and read dropdowns, charts and
+    statistics from it instead of rescanning the posts.
+    """
+
+    def __init__(self, posts):
+        collected = {}
+        titles = []
+        for position, post in enumerate(posts):
+            title = post.get("title", "") if isinstance(post, dict) else ""
+            titles.append(title.get("rendered", "No Title") if isinstance(title, dict) else title)
+            post_id = post.get("id") if isinstance(post, dict) else None
+            post_id = post_id if isinstance(post_id, int) else -1
+            for box, field, value in iter_meta(post):
+                positions, post_ids, values = collected.setdefault((box, field), ([], [], []))
+                positions.append(position)
+                post_ids.append(post_id)
+                values.append(value)
+
+        self.titles = np.fromiter(titles, dtype=object, count=len(titles))
+        self._boxes = {}
+        for (box, field), (positions, post_ids, values) in collected.items():
+            self._boxes.setdefault(box, {})[field] = FieldColumn(box, field, positions, post_ids, values)
+
+    def __len__(self):
+        return sum(len(column) for fields in self._boxes.values() for column in fields.values())
+
+    def boxes(self):
+        return list(self._boxes)
+
+    def fields(self, box):
+        return list(self._boxes.get(box, {}))
+
+    def column(self, box, field):
+        """Return the ``FieldColumn`` for a field, or None if no post has it."""
+        return self._boxes.get(box, {}).get(field)
@@ -0,0 +1,63 @@
+import json
+import re
+import threading
+import time
+from collections import deque
+
+DEFAULT_LOG_SIZE = 5000
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_of(path):
+    """Normalise a REST path to its route, e.g. ``wp/v2/posts/42?force=true`` -> ``wp/v2/posts/{id}``."""
+    return _NUMERIC_SEGMENT.sub("/{id}", "/" + path.split("?")[0].strip("/"))[1:] or "/"
+
+
+class RequestLog:
+    """Fixed-size, thread-safe ring buffer of per-request timing records.
+
+    Every HTTP call made through a ``WPClient`` (retries and batch requests
+    included) appends one record; the oldest records are dropped once
+    ``maxlen`` is reached. ``duration`` is the full round trip, ``ttfb`` the
+    time until response headers arrived and ``wait`` the time spent queued
+    in the client's concurrency limiter before the request was sent.
+    """
+
+    def __init__(self, maxlen=DEFAULT_LOG_SIZE):
+        self._records = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._records)
+
+    def record(self, method, path, response=None, duration=0.0, wait=0.0, error=None):
+        record = {
+            "time": time.time(),
+            "method": method,
+            "endpoint": endpoint_of(path),
+            "status": response.status_code if response is not None else None,
+            "bytes": len(response.content) if response is not None else 0,
+            "request_bytes": len(response.request.body or b"") if response is not None and response.request else 0,
+            "duration": duration,
+            "ttfb": response.elapsed.total_seconds() if response is not None else None,
+            "wait": wait,
+            "error": error
+        }
+        with self._lock:
+            self._records.append(record)
+
+    def records(self, since=None):
+        """Return a copy of the records, optionally only those newer than ``since`` (epoch seconds)."""
+        with self._lock:
+            records = list(self._records)
+        if since is not None:
+            records = [record for record in records if record["time"] >= since]
+        return records
+
+    def to_jsonl(self):
+        return "".join(json.dumps(record) + "\n" for record in self.records())
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
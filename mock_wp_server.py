@@ -0,0 +1,408 @@
+"""Local stand-in for a WordPress site running ACPT.
+
+Implements the parts of the REST API the app uses: ``wp/v2/{post_type}``
+collection and item CRUD (with ``X-WP-Total`` / ``X-WP-TotalPages`` paging
+headers, ETags and ``modified_after``), the route OPTIONS response that
+advertises ``allow_batch`` and ``batch/v1``. Posts carry ACPT meta under
+``acpt.meta`` in the REST read format. Latency, jitter and error injection
+are configurable so the benchmark can reproduce slow or flaky sites.
+
+Run it standalone and point the app at ``http://127.0.0.1:8080``::
+
+    python mock_wp_server.py --posts 1000 --latency 0.05 --jitter 0.02 --error-rate 0.01
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BATCH_MAX_REQUESTS = 25
+DEFAULT_ERROR_STATUSES = (429, 500, 502, 503)
+
+_ITEM_PATH = re.compile(r"^wp/v2/([\w-]+)/(\d+)$")
+_COLLECTION_PATH = re.compile(r"^wp/v2/([\w-]+)$")
+_ORDERBY = {"date": "date", "id": "id", "modified": "modified", "title": "title"}
+
+
+def _now():
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+def _rendered(value):
+    """Accept ``"text"``, ``{"raw": ...}`` or ``{"rendered": ...}`` as written by clients."""
+    if isinstance(value, dict):
+        return value.get("raw", value.get("rendered", ""))
+    return "" if value is None else str(value)
+
+def _read_meta(meta):
+    """Convert ACPT write-format meta (``box`` / ``field`` / ``value``) to the read format."""
+    boxes = {}
+    for item in meta or []:
+        if not isinstance(item, dict):
+            continue
+        if "meta_box" in item:
+            boxes.setdefault(item["meta_box"], []).extend(item.get("meta_fields") or [])
+        elif "box" in item and "field" in item:
+            value = item.get("value")
+            field_type = ("Number" if isinstance(value, (int, float)) and not isinstance(value, bool)
+                          else "Toggle" if isinstance(value, bool)
+                          else "List" if isinstance(value, list) else "Text")
+            boxes.setdefault(item["box"], []).append({"name": item["field"], "type": field_type, "value": value})
+    return [{"meta_box": box, "meta_fields": fields} for box, fields in boxes.items()]
+
+
+class MockSite:
+    """Thread-safe in-memory post database plus the fault-injection settings."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_statuses=DEFAULT_ERROR_STATUSES,
+                 retry_after=None, write_latency=0.0, batch=True, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+        self.write_latency = write_latency
+        self.batch = batch
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.injected_errors = 0
+        self._posts = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def seed_posts(self, post_type, count, status="publish"):
+        """Add ``count`` generated posts with ACPT meta to ``post_type``."""
+        start = _now() - timedelta(minutes=count)
+        for i in range(count):
+            when = (start + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S")
+            self.create(post_type, {
+                "title": f"Sample {post_type} {i + 1}",
+                "content": f"<p>Generated content for item {i + 1}.</p>",
+                "status": status,
+                "date": when,
+                "acpt": {"meta": [
+                    {"box": "details", "field": "price", "value": round(self.random.uniform(5, 500), 2)},
+                    {"box": "details", "field": "sku", "value": f"SKU-{i + 1:06d}"},
+                    {"box": "details", "field": "in_stock", "value": self.random.random() > 0.2},
+                    {"box": "details", "field": "tags", "value": self.random.sample(["new", "sale", "featured", "eco"], 2)}
+                ]}
+            })
+
+    def list(self, post_type):
+        with self._lock:
+            return list(self._posts.get(post_type, {}).values())
+
+    def get(self, post_type, post_id):
+        with self._lock:
+            return self._posts.get(post_type, {}).get(post_id)
+
+    def create(self, post_type, data):
+        now = _now()
+        with self._lock:
+            post_id = self._next_id
+            self._next_id += 1
+            date = data.get("date") or now.strftime("%Y-%m-%dT%H:%M:%S")
+            post = {
+                "id": post_id,
+                "date": date,
+                "date_gmt": date,
+                "modified": now.strftime("%Y-%m-%dT%H:%M:%S"),
+                "modified_gmt": now.strftime("%Y-%m-%dT%H:%M:%S"),
+                "slug": re.sub(r"[^a-z0-9]+", "-", _rendered(data.get("title")).lower()).strip("-") or str(post_id),
+                "status": data.get("status", "draft"),
+                "type": post_type,
+                "link": f"http://mock.local/{post_type}/{post_id}/",
+                "title": {"rendered": _rendered(data.get("title"))},
+                "content": {"rendered": _rendered(data.get("content")), "protected": False},
+                "excerpt": {"rendered": _rendered(data.get("excerpt")), "protected": False},
+                "author": data.get("author", 1),
+                "featured_media": data.get("featured_media", 0),
+                "acpt": {"meta": _read_meta((data.get("acpt") or {}).get("meta"))}
+            }
+            self._posts.setdefault(post_type, {})[post_id] = post
+            return post
+
+    def update(self, post_type, post_id, data):
+        with self._lock:
+            post = self._posts.get(post_type, {}).get(post_id)
+            if post is None:
+                return None
+            post = dict(post)
+            for key in ("title", "content", "excerpt"):
+                if key in data:
+                    post[key] = {**post[key], "rendered": _rendered(data[key])}
+            for key in ("status", "date", "author", "featured_media"):
+                if key in data:
+                    post[key] = data[key]
+            if "acpt" in data:
+                post["acpt"] = {"meta": _read_meta((data.get("acpt") or {}).get("meta"))}
+            # Bump the modified time by at least a second so modified_after picks the edit up
+            modified = max(_now(), datetime.fromisoformat(post["modified"]).replace(tzinfo=timezone.utc) + timedelta(seconds=1))
+            post["modified"] = post["modified_gmt"] = modified.strftime("%Y-%m-%dT%H:%M:%S")
+            self._posts[post_type][post_id] = post
+            return post
+
+    def delete(self, post_type, post_id):
+        with self._lock:
+            return self._posts.get(post_type, {}).pop(post_id, None)
+
+    def delay(self, writes=0):
+        """Sleep for the configured latency plus jitter (and per-write cost)."""
+        latency = self.latency + self.random.uniform(-self.jitter, self.jitter) + self.write_latency * writes
+        if latency > 0:
+            time.sleep(latency)
+
+    def inject_error(self):
+        """Return an HTTP status to fail the current request with, or None."""
+        with self._lock:
+            self.requests += 1
+            if self.error_rate and self.random.random() < self.error_rate:
+                self.injected_errors += 1
+                return self.random.choice(self.error_statuses)
+        return None
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockWordPress/1.0"
+    # Headers and body go out in separate writes; with Nagle on, the body waits
+    # for the client's delayed ACK and every keep-alive request stalls ~40 ms
+    disable_nagle_algorithm = True
+    site = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def do_OPTIONS(self):
+        self._handle("OPTIONS")
+
+    def _handle(self, method):
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        body = self._read_body()
+
+        path = url.path
+        if path.rstrip("/") == "/wp-json":
+            route = ""
+        elif path.startswith("/wp-json/"):
+            route = path[len("/wp-json/"):].strip("/")
+        else:
+            return self._send(404, {"code": "rest_no_route", "message": "No route was found matching the URL and request method.",
+                                    "data": {"status": 404}})
+
+        writes = len(body.get("requests", [])) if route == "batch/v1" and isinstance(body, dict) \
+            else int(method in ("POST", "PUT", "PATCH", "DELETE"))
+        self.site.delay(writes)
+
+        status = self.site.inject_error()
+        if status:
+            headers = {"Retry-After": str(self.site.retry_after)} if self.site.retry_after is not None and status in (429, 503) else {}
+            return self._send(status, {"code": "mock_injected_error", "message": "Injected failure", "data": {"status": status}},
+                              headers)
+
+        if body is ValueError:
+            return self._send(400, {"code": "rest_invalid_json", "message": "Invalid JSON body passed.", "data": {"status": 400}})
+
+        status, payload, headers = self.dispatch(method, route, query, body)
+        self._send(status, payload, headers, conditional=method == "GET")
+
+    def dispatch(self, method, route, query, body):
+        """Route one request (also used for batch sub-requests); return ``(status, body, headers)``."""
+        if route == "":
+            return 200, {"name": "Mock ACPT Site", "namespaces": ["wp/v2", "batch/v1"]}, {}
+
+        if route == "batch/v1" and method == "POST":
+            return self._batch(body)
+
+        match = _COLLECTION_PATH.match(route)
+        if match:
+            post_type = match.group(1)
+            if method == "OPTIONS":
+                return 200, {"namespace": "wp/v2", "methods": ["GET", "POST"],
+                             "allow_batch": {"v1": self.site.batch}}, {}
+            if method == "GET":
+                return self._list(post_type, query)
+            if method == "POST":
+                return 201, self.site.create(post_type, body or {}), {}
+
+        match = _ITEM_PATH.match(route)
+        if match:
+            post_type, post_id = match.group(1), int(match.group(2))
+            if method == "GET":
+                post = self.site.get(post_type, post_id)
+            elif method in ("POST", "PUT", "PATCH"):
+                post = self.site.update(post_type, post_id, body or {})
+            elif method == "DELETE":
+                if query.get("force") not in ("true", "1"):
+                    post = self.site.update(post_type, post_id, {"status": "trash"})
+                else:
+                    post = self.site.delete(post_type, post_id)
+                    if post is not None:
+                        return 200, {"deleted": True, "previous": post}, {}
+            else:
+                post = None
+            if post is None:
+                return 404, {"code": "rest_post_invalid_id", "message": "Invalid post ID.", "data": {"status": 404}}, {}
+            return 200, self._fields(post, query), {}
+
+        return 404, {"code": "rest_no_route", "message": "No route was found matching the URL and request method.",
+                     "data": {"status": 404}}, {}
+
+    def _list(self, post_type, query):
+        try:
+            per_page = int(query.get("per_page", 10))
+            page = int(query.get("page", 1))
+        except ValueError:
+            return 400, {"code": "rest_invalid_param", "message": "Invalid parameter(s): per_page, page",
+                         "data": {"status": 400}}, {}
+        if not 1 <= per_page <= 100:
+            return 400, {"code": "rest_invalid_param", "message": "Invalid parameter(s): per_page",
+                         "data": {"status": 400}}, {}
+
+        posts = self.site.list(post_type)
+        statuses = query.get("status", "publish").split(",")
+        if "any" not in statuses:
+            posts = [post for post in posts if post["status"] in statuses]
+        if query.get("search"):
+            needle = query["search"].lower()
+            posts = [post for post in posts if needle in post["title"]["rendered"].lower()]
+        if query.get("modified_after"):
+            posts = [post for post in posts if post["modified"] > query["modified_after"]]
+        if query.get("include"):
+            include = {int(post_id) for post_id in query["include"].split(",")}
+            posts = [post for post in posts if post["id"] in include]
+        if query.get("exclude"):
+            exclude = {int(post_id) for post_id in query["exclude"].split(",")}
+            posts = [post for post in posts if post["id"] not in exclude]
+
+        orderby = _ORDERBY.get(query.get("orderby", "date"), "date")
+        key = (lambda post: post["title"]["rendered"]) if orderby == "title" else (lambda post: (post[orderby], post["id"]))
+        posts.sort(key=key, reverse=query.get("order", "desc") == "desc")
+
+        total_pages = max(1, -(-len(posts) // per_page))
+        if page < 1 or (page > total_pages and posts):
+            return 400, {"code": "rest_post_invalid_page_number",
+                         "message": "The page number requested is larger than the number of pages available.",
+                         "data": {"status": 400}}, {}
+
+        page_posts = [self._fields(post, query) for post in posts[(page - 1) * per_page:page * per_page]]
+        return 200, page_posts, {"X-WP-Total": str(len(posts)), "X-WP-TotalPages": str(total_pages)}
+
+    def _batch(self, body):
+        sub_requests = (body or {}).get("requests") or []
+        if len(sub_requests) > BATCH_MAX_REQUESTS:
+            return 400, {"code": "rest_batch_max_requests",
+                         "message": f"The maximum number of requests in a batch is {BATCH_MAX_REQUESTS}.",
+                         "data": {"status": 400}}, {}
+
+        responses = []
+        for sub_request in sub_requests:
+            url = urlparse(sub_request.get("path", ""))
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            status, sub_body, headers = self.dispatch(sub_request.get("method", "POST").upper(),
+                                                      url.path.strip("/"), query, sub_request.get("body"))
+            responses.append({"body": sub_body, "status": status, "headers": headers})
+        return 207, {"responses": responses}, {}
+
+    @staticmethod
+    def _fields(post, query):
+        if not query.get("_fields"):
+            return post
+        fields = query["_fields"].split(",")
+        return {key: value for key, value in post.items() if key in fields}
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return ValueError
+
+    def _send(self, status, payload, headers=None, conditional=False):
+        data = json.dumps(payload).encode("utf-8")
+        headers = dict(headers or {})
+        if conditional and status == 200:
+            etag = '"' + hashlib.md5(data).hexdigest() + '"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                status, data = 304, b""
+
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def serve(site=None, host="127.0.0.1", port=0):
+    """Start a mock site on a background thread; return ``(server, base_url)``.
+
+    ``port=0`` picks a free port. Call ``server.shutdown()`` when finished.
+    """
+    handler = type("BoundMockHandler", (MockHandler,), {"site": site or MockSite()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a mock WordPress/ACPT REST API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--post-type", default="posts", help="Post type to seed")
+    parser.add_argument("--posts", type=int, default=100, help="Number of posts to seed")
+    parser.add_argument("--latency", type=float, default=0.0, help="Base latency per request (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- jitter added to the latency (seconds)")
+    parser.add_argument("--write-latency", type=float, default=0.0, help="Extra latency per written post, batches included")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failed with an injected error")
+    parser.add_argument("--error-statuses", default=",".join(map(str, DEFAULT_ERROR_STATUSES)),
+                        help="Comma-separated statuses used for injected errors")
+    parser.add_argument("--retry-after", type=int, default=None, help="Retry-After sent with injected 429/503 responses")
+    parser.add_argument("--no-batch", action="store_true", help="Do not advertise batch/v1 support")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+    args = parser.parse_args()
+
+    site = MockSite(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                    error_statuses=[int(status) for status in args.error_statuses.split(",") if status],
+                    retry_after=args.retry_after, write_latency=args.write_latency,
+                    batch=not args.no_batch, seed=args.seed)
+    site.seed_posts(args.post_type, args.posts)
+
+    server, base_url = serve(site, args.host, args.port)
+    print(f"Mock WordPress site with {args.posts} {args.post_type} listening on {base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
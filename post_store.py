@@ -0,0 +1,235 @@
+import json
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+import streamlit as st
+
+from acpt_meta import iter_meta
+
+DEFAULT_STORE_PATH = os.environ.get(
+    "ACPT_STORE_PATH",
+    os.path.join(os.path.expanduser("~"), ".acpt_manager", "posts.sqlite3")
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    site TEXT NOT NULL,
+    account TEXT NOT NULL,
+    post_type TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    status TEXT,
+    date TEXT,
+    modified TEXT,
+    modified_gmt TEXT,
+    title TEXT,
+    raw TEXT NOT NULL,
+    PRIMARY KEY (site, account, post_type, id)
+);
+CREATE INDEX IF NOT EXISTS posts_status ON posts (site, account, post_type, status);
+CREATE INDEX IF NOT EXISTS posts_date ON posts (site, account, post_type, date);
+CREATE INDEX IF NOT EXISTS posts_modified ON posts (site, account, post_type, modified_gmt);
+
+CREATE TABLE IF NOT EXISTS meta (
+    site TEXT NOT NULL,
+    account TEXT NOT NULL,
+    post_type TEXT NOT NULL,
+    post_id INTEGER NOT NULL,
+    box TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS meta_post ON meta (site, account, post_type, post_id);
+CREATE INDEX IF NOT EXISTS meta_field ON meta (site, account, post_type, box, field);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    site TEXT NOT NULL,
+    account TEXT NOT NULL,
+    post_type TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (site, account, post_type)
+);
+"""
+
+_ORDER_COLUMNS = {"date", "modified_gmt", "title", "id", "status"}
+
+
+def _title(post):
+    title = post.get("title", "")
+    return title.get("rendered", "") if isinstance(title, dict) else title
+
+def _same_revision(stored, post):
+    # Records without modification stamps cannot tell, so they count as the same revision
+    return all(post.get(key) is None or post.get(key) == stored.get(key) for key in ("modified_gmt", "modified"))
+
+
+class PostStore:
+    """On-disk mirror of fetched posts, partitioned by site, account and post type.
+
+    Each post is kept as raw JSON next to indexed list columns, and its ACPT
+    meta is exploded into one ``(box, field, value)`` row per value so views can
+    filter and aggregate in SQL. ``account`` is the client's hashed auth
+    identity, so drafts fetched with one set of credentials are never served
+    to another.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def upsert_posts(self, site, account, post_type, posts):
+        """Insert or refresh posts.
+
+        Partial records (e.g. fetched with ``_fields``) are merged over the stored
+        JSON so previously loaded content and meta are kept, as long as the
+        post has not been modified since. A partial record with a newer
+        ``modified``/``modified_gmt`` replaces the stored one outright, and
+        its meta rows are dropped, so the details are fetched again instead
+        of pairing old content with the new revision.
+        """
+        posts = [post for post in posts if isinstance(post, dict) and post.get("id") is not None]
+        if not posts:
+            return
+
+        with self._lock, self._conn:
+            partial_ids = [post["id"] for post in posts if "content" not in post]
+            stored = {}
+            for chunk_start in range(0, len(partial_ids), 500):
+                chunk = partial_ids[chunk_start:chunk_start + 500]
+                rows = self._conn.execute(
+                    f"SELECT id, raw FROM posts WHERE site = ? AND account = ? AND post_type = ? "
+                    f"AND id IN ({','.join('?' * len(chunk))})",
+                    (site, account, post_type, *chunk)
+                )
+                stored.update((post_id, json.loads(raw)) for post_id, raw in rows)
+
+            post_rows = []
+            meta_posts = []
+            stale_ids = []
+            for post in posts:
+                if post["id"] in stored:
+                    if _same_revision(stored[post["id"]], post):
+                        post = {**stored[post["id"]], **post}
+                    else:
+                        stale_ids.append(post["id"])
+                post_rows.append((
+                    site, account, post_type, post["id"], post.get("status"), post.get("date"),
+                    post.get("modified"), post.get("modified_gmt"), _title(post), json.dumps(post)
+                ))
+                if "acpt" in post:
+                    meta_posts.append(post)
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO posts (site, account, post_type, id, status, date, modified, "
+                "modified_gmt, title, raw) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                post_rows
+            )
+
+            self._conn.executemany(
+                "DELETE FROM meta WHERE site = ? AND account = ? AND post_type = ? AND post_id = ?",
+                [(site, account, post_type, post_id) for post_id in [post["id"] for post in meta_posts] + stale_ids]
+            )
+            self._conn.executemany(
+                "INSERT INTO meta (site, account, post_type, post_id, box, field, value) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(site, account, post_type, post["id"], box, field, json.dumps(value))
+                 for post in meta_posts for box, field, value in iter_meta(post)]
+            )
+
+    def delete_posts(self, site, account, post_type, ids):
+        ids = [(site, account, post_type, post_id) for post_id in ids]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM posts WHERE site = ? AND account = ? AND post_type = ? AND id = ?", ids)
+            self._conn.executemany(
+                "DELETE FROM meta WHERE site = ? AND account = ? AND post_type = ? AND post_id = ?", ids)
+
+    def load_posts(self, site, account, post_type):
+        """Return every stored post for the collection as parsed JSON, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT raw FROM posts WHERE site = ? AND account = ? AND post_type = ? ORDER BY date DESC",
+                (site, account, post_type)
+            ).fetchall()
+        return [json.loads(raw) for (raw,) in rows]
+
+    def query(self, site, account, post_type, ids=None, status=None, search=None, order_by="date",
+              descending=True, limit=None):
+        """Return the indexed list columns as a DataFrame, filtered and sorted in SQL.
+
+        ``ids`` restricts the result to a working set of post IDs.
+        """
+        if order_by not in _ORDER_COLUMNS:
+            raise ValueError(f"Cannot order by {order_by!r}")
+
+        sql = "SELECT id, title, status, date, modified FROM posts WHERE site = ? AND account = ? AND post_type = ?"
+        args = [site, account, post_type]
+        if ids is not None:
+            sql += " AND id IN (SELECT value FROM json_each(?))"
+            args.append(json.dumps(list(ids)))
+        if status:
+            sql += " AND status = ?"
+            args.append(status)
+        if search:
+            sql += " AND title LIKE ?"
+            args.append(f"%{search}%")
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=args)
+
+    def meta_values(self, site, account, post_type, box, field):
+        """Return ``post_id`` / ``value`` rows for one ACPT field as a DataFrame."""
+        with self._lock:
+            df = pd.read_sql_query(
+                "SELECT post_id, value FROM meta WHERE site = ? AND account = ? AND post_type = ? "
+                "AND box = ? AND field = ?",
+                self._conn, params=[site, account, post_type, box, field]
+            )
+        df["value"] = df["value"].map(json.loads)
+        return df
+
+    def count(self, site, account, post_type):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM posts WHERE site = ? AND account = ? AND post_type = ?",
+                (site, account, post_type)
+            ).fetchone()[0]
+
+    def get_sync_state(self, site, account, post_type):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM sync_state WHERE site = ? AND account = ? AND post_type = ?",
+                (site, account, post_type)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_sync_state(self, site, account, post_type, state):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (site, account, post_type, state) VALUES (?, ?, ?, ?)",
+                (site, account, post_type, json.dumps(state))
+            )
+
+    def clear(self, site, account, post_type):
+        with self._lock, self._conn:
+            for table in ("posts", "meta", "sync_state"):
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE site = ? AND account = ? AND post_type = ?",
+                    (site, account, post_type)
+                )
+
+
+@st.cache_resource(show_spinner=False)
+def get_store(path=DEFAULT_STORE_PATH):
+    """Return the process-wide post store at ``path``."""
+    return PostStore(path)
@@ -0,0 +1,111 @@
+import functools
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+DEFAULT_HISTORY = 50
+
+
+class RerunProfiler:
+    """Times named sections of one Streamlit script run.
+
+    Create one at the top of the script, wrap sections in ``section(name)``
+    (or decorate functions with ``timed(name)``, or bracket them with
+    ``start(name)``/``stop()``) and call ``finish()`` at the
+    end; the rerun's timings are appended to a bounded history in
+    ``st.session_state[history_key]``. Sections may nest; only top-level
+    sections count towards the "Other" remainder. When disabled every method
+    is a no-op.
+    """
+
+    def __init__(self, enabled, history_key="rerun_profile", max_history=DEFAULT_HISTORY):
+        self.enabled = enabled
+        self.history_key = history_key
+        self.max_history = max_history
+        self.timings = {}
+        self.depths = {}
+        self._depth = 0
+        self._open = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def section(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        self.depths.setdefault(name, self._depth)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def start(self, name):
+        """Open a section without a ``with`` block; close it with ``stop()``.
+
+        For code that must stay at its own indentation level, such as the
+        script's top-level sections.
+        """
+        context = self.section(name)
+        context.__enter__()
+        self._open.append(context)
+
+    def stop(self):
+        """Close the section most recently opened with ``start()``."""
+        if self._open:
+            self._open.pop().__exit__(None, None, None)
+
+    def timed(self, name):
+        """Decorator form of ``section``."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.section(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def finish(self):
+        """Record this rerun in the session history; return the history (empty when disabled)."""
+        if not self.enabled:
+            return []
+
+        total = time.perf_counter() - self._started
+        top_level = sum(seconds for name, seconds in self.timings.items() if self.depths[name] == 0)
+        history = st.session_state.setdefault(self.history_key, [])
+        history.append({
+            "rerun": (history[-1]["rerun"] + 1) if history else 1,
+            "time": time.time(),
+            "total": total,
+            "sections": dict(self.timings),
+            "depths": dict(self.depths),
+            "other": max(0.0, total - top_level)
+        })
+        del history[:-self.max_history]
+        return history
+
+
+def breakdown(run):
+    """Return one rerun's timings as a DataFrame of section / depth / ms / share."""
+    rows = [{"section": ("  " * run["depths"][name]) + name, "ms": seconds * 1000}
+            for name, seconds in run["sections"].items()]
+    rows.append({"section": "Other (unprofiled)", "ms": run["other"] * 1000})
+    df = pd.DataFrame(rows)
+    df["share"] = (df["ms"] / (run["total"] * 1000)).map("{:.0%}".format)
+    df["ms"] = df["ms"].round(1)
+    return df
+
+def trend(history):
+    """Return top-level section times (ms) per rerun as a DataFrame indexed by rerun number."""
+    rows = []
+    for run in history:
+        row = {name: seconds * 1000 for name, seconds in run["sections"].items() if run["depths"][name] == 0}
+        row["Other"] = run["other"] * 1000
+        row["rerun"] = run["rerun"]
+        rows.append(row)
+    return pd.DataFrame(rows).set_index("rerun").fillna(0.0)
@@ -0,0 +1,141 @@
+import functools
+
+import jsonschema
+
+from acpt_meta import iter_meta
+
+POST_STATUSES = ["publish", "future", "draft", "pending", "private", "trash"]
+
+# Matches numbers typed into text inputs or read from CSV, e.g. "12" or "-3.5"
+NUMERIC_STRING = r"^\s*-?\d+(\.\d+)?\s*$"
+
+# Title/content/excerpt may be plain strings or REST objects ({"raw": ...} / {"rendered": ...})
+_TEXT = {
+    "type": ["string", "object"],
+    "properties": {
+        "raw": {"type": "string"},
+        "rendered": {"type": "string"}
+    }
+}
+
+# ACPT meta items come in the write format ({"box", "field", "value"}) or the
+# REST read format ({"meta_box", "meta_fields": [{"name", "type", "value"}]})
+_META_ITEM = {
+    "type": "object",
+    "if": {"required": ["meta_box"]},
+    "then": {
+        "properties": {
+            "meta_box": {"type": "string", "minLength": 1},
+            "meta_fields": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {"name": {"type": "string", "minLength": 1}, "type": {"type": "string"}}
+                }
+            }
+        }
+    },
+    "else": {
+        "required": ["box", "field"],
+        "properties": {
+            "box": {"type": "string", "minLength": 1},
+            "field": {"type": "string", "minLength": 1}
+        }
+    }
+}
+
+POST_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "ACPT post",
+    "type": "object",
+    "properties": {
+        "title": _TEXT,
+        "content": _TEXT,
+        "excerpt": _TEXT,
+        "status": {"enum": POST_STATUSES},
+        "date": {"type": "string"},
+        "acpt": {
+            "type": "object",
+            "properties": {
+                "meta": {"type": "array", "items": _META_ITEM}
+            }
+        }
+    }
+}
+
+# Value constraints per JSON type, lenient where forms and CSV files produce strings
+_VALUE_SCHEMAS = {
+    "number": {"type": ["number", "string"], "pattern": NUMERIC_STRING},
+    "boolean": {"type": "boolean"},
+    "array": {"type": "array"},
+    "object": {"type": "object"},
+    "string": {"type": ["string", "number"]}
+}
+
+
+def json_type(value):
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, str):
+        return "string"
+    return None
+
+def field_types(template):
+    """Return the ``((box, field), json_type)`` pairs implied by a template's meta values.
+
+    The result is a sorted tuple so it can key the validator cache.
+    """
+    types = {}
+    for box, field, value in iter_meta(template or {}):
+        if json_type(value):
+            types[(box, field)] = json_type(value)
+    return tuple(sorted(types.items()))
+
+def build_schema(types=()):
+    """Return the post schema, with per-field value types for write-format meta items.
+
+    Each typed field adds an ``if box/field match, then value must match``
+    rule to the write-format branch of the meta item schema.
+    """
+    if not types:
+        return POST_SCHEMA
+
+    rules = [{
+        "if": {"properties": {"box": {"const": box}, "field": {"const": field}}, "required": ["value"]},
+        "then": {"properties": {"value": _VALUE_SCHEMAS[value_type]}}
+    } for (box, field), value_type in types]
+    meta_item = {**_META_ITEM, "else": {**_META_ITEM["else"], "allOf": rules}}
+    acpt = {**POST_SCHEMA["properties"]["acpt"], "properties": {"meta": {"type": "array", "items": meta_item}}}
+    return {**POST_SCHEMA, "properties": {**POST_SCHEMA["properties"], "acpt": acpt}}
+
+
+@functools.lru_cache(maxsize=64)
+def get_validator(types=()):
+    """Return the jsonschema validator for a field-type set, built and checked once per process."""
+    schema = build_schema(types)
+    jsonschema.Draft7Validator.check_schema(schema)
+    return jsonschema.Draft7Validator(schema)
+
+def _errors(validator, item):
+    return [f"{'/'.join(str(part) for part in error.absolute_path) or 'item'}: {error.message}"
+            for error in validator.iter_errors(item)]
+
+def validate_posts(items, types=()):
+    """Validate ``items`` against the post schema in one pass.
+
+    Returns one entry per item, in order: None when the item is valid,
+    otherwise a message listing every problem found (``path: error``).
+    """
+    validator = get_validator(types)
+    return ["; ".join(errors) or None for errors in (_errors(validator, item) for item in items)]
+
+def validate_post(item, types=()):
+    """Validate a single post; return None or an error message."""
+    return validate_posts([item], types)[0]
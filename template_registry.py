@@ -0,0 +1,168 @@
+import glob
+import json
+import os
+
+import streamlit as st
+
+from schema import validate_post
+
+# Templates bundled with the app
+BUNDLED_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+# Drop-in templates; later directories override earlier ones with the same category and name
+USER_TEMPLATE_DIR = os.path.join(os.path.expanduser("~"), ".acpt_manager", "templates")
+DEFAULT_TEMPLATE_DIRS = (
+    BUNDLED_TEMPLATE_DIR,
+    *[path for path in os.environ.get("ACPT_TEMPLATE_PATH", "").split(os.pathsep) if path],
+    USER_TEMPLATE_DIR
+)
+
+
+class FrozenDict(dict):
+    """Read-only dict shared between sessions. ``copy.deepcopy`` returns a mutable copy."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Template data is shared and read-only; use thaw() to get an editable copy")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return dict, (thaw(self),)
+
+
+class FrozenList(list):
+    """Read-only list shared between sessions. ``copy.deepcopy`` returns a mutable copy."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Template data is shared and read-only; use thaw() to get an editable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return list, (thaw(self),)
+
+
+def freeze(value):
+    """Return a deeply read-only version of JSON data (still a ``dict``/``list`` for isinstance checks)."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+def thaw(value):
+    """Return a plain, mutable deep copy of (possibly frozen) JSON data."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+EMPTY_TEMPLATE = freeze({
+    "title": "",
+    "content": "",
+    "status": "draft",
+    "acpt": {
+        "meta": []
+    }
+})
+
+
+class TemplateRegistry:
+    """Industry templates loaded from ``*.json`` files, indexed by category and name.
+
+    Each file holds one template::
+
+        {"category": "Real Estate", "name": "Rental Listing", "order": 130,
+         "post": {"title": ..., "content": ..., "status": ..., "acpt": {"meta": [...]}}}
+
+    ``order`` (optional) positions the template in the sidebar; categories are
+    ordered by their first template. Template posts are frozen so one
+    instance can be shared by every session. Files that fail to load or
+    whose post does not match the ACPT post schema are skipped and reported
+    in ``errors``.
+    """
+
+    def __init__(self, template_dirs=DEFAULT_TEMPLATE_DIRS):
+        self.template_dirs = tuple(template_dirs)
+        self.errors = []
+        self._templates = {}
+        self._orders = {}
+        self._categories = {}
+
+        for template_dir in self.template_dirs:
+            for path in sorted(glob.glob(os.path.join(template_dir, "**", "*.json"), recursive=True)):
+                self._load(path)
+
+        for key in sorted(self._templates, key=lambda key: (self._orders[key], key)):
+            category, name = key
+            self._categories.setdefault(category, []).append(name)
+
+    def _load(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                document = json.load(f)
+            category, name, post = document["category"], document["name"], document["post"]
+            if not isinstance(post, dict):
+                raise ValueError("'post' must be an object")
+            validation_error = validate_post(post)
+            if validation_error:
+                raise ValueError(validation_error)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.errors.append((path, f"{type(e).__name__}: {e}"))
+            return
+
+        key = (category, name)
+        self._templates[key] = freeze({**EMPTY_TEMPLATE, **post})
+        self._orders[key] = document.get("order", float("inf"))
+
+    def __len__(self):
+        return len(self._templates)
+
+    def __contains__(self, key):
+        return self._split(key) in self._templates
+
+    def categories(self):
+        return list(self._categories)
+
+    def names(self, category):
+        return list(self._categories.get(category, []))
+
+    def get(self, category, name, default=None):
+        """Return the frozen post data for a template, or ``default``."""
+        return self._templates.get((category, name), default)
+
+    def get_key(self, key, default=None):
+        """Look up a template by its ``"Category - Name"`` key."""
+        return self._templates.get(self._split(key), default)
+
+    @staticmethod
+    def _split(key):
+        category, _, name = (key or "").partition(" - ")
+        return category, name
+
+
+def template_signature(template_dirs=DEFAULT_TEMPLATE_DIRS):
+    """Cheap fingerprint (paths and mtimes) of the template files, used to notice drop-ins."""
+    return tuple(
+        (path, os.path.getmtime(path))
+        for template_dir in template_dirs
+        for path in sorted(glob.glob(os.path.join(template_dir, "**", "*.json"), recursive=True))
+    )
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_registry(template_dirs=DEFAULT_TEMPLATE_DIRS, signature=None):
+    """Return the process-wide template registry.
+
+    Pass ``template_signature()`` as ``signature`` to reload it when template
+    files are added, removed or edited.
+    """
+    return TemplateRegistry(template_dirs)
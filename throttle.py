@@ -0,0 +1,179 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Latency above this multiple of the fastest response seen counts as congestion
+LATENCY_TOLERANCE = 3.0
+# How quickly the latency baseline follows slower responses (0 = pure minimum)
+BASELINE_DRIFT = 0.02
+# Upper bound on how long a single Retry-After may pause the limiter
+MAX_RETRY_AFTER = 120
+
+
+def parse_retry_after(value):
+    """Return the delay in seconds requested by a Retry-After header, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency controller with a hard requests-per-second ceiling.
+
+    Every request takes a slot with ``acquire()`` and hands it back with
+    ``release()``. Healthy, fast responses grow the concurrency limit by roughly
+    one per round of requests; 429/5xx responses, network errors and latency
+    spikes cut it multiplicatively. ``Retry-After`` pauses all new requests
+    until the server's deadline has passed.
+    """
+
+    def __init__(self, max_concurrency, min_concurrency=1, max_rps=None, adaptive=True):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.max_rps = max_rps or None
+        self.adaptive = adaptive
+
+        # Start at a quarter of the ceiling and ramp up while the server stays healthy
+        self.limit = float(max(self.min_concurrency, self.max_concurrency / 4) if adaptive else self.max_concurrency)
+        self.in_flight = 0
+        self.min_latency = None
+
+        self._cond = threading.Condition()
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._cooldown_until = 0.0
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    self._cond.wait(self._paused_until - now)
+                elif self.in_flight >= int(self.limit):
+                    self._cond.wait(0.5)
+                else:
+                    break
+
+            self.in_flight += 1
+
+            # Reserve the next send slot under the requests-per-second ceiling
+            slot = now
+            if self.max_rps:
+                slot = max(now, self._next_slot)
+                self._next_slot = slot + 1.0 / self.max_rps
+
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self, status=None, latency=None, retry_after=None):
+        """Return a slot. ``status`` is None when the request failed without a response."""
+        now = time.monotonic()
+        overloaded = status is None or status == 429 or status >= 500
+
+        with self._cond:
+            self.in_flight -= 1
+
+            delay = parse_retry_after(retry_after) if status in (429, 503) else None
+            if delay:
+                self._paused_until = max(self._paused_until, now + min(delay, MAX_RETRY_AFTER))
+
+            if self.adaptive:
+                if latency is not None and not overloaded:
+                    if self.min_latency is None or latency < self.min_latency:
+                        self.min_latency = latency
+                    else:
+                        self.min_latency += (latency - self.min_latency) * BASELINE_DRIFT
+                slow = (latency is not None and self.min_latency is not None
+                        and latency > self.min_latency * LATENCY_TOLERANCE)
+
+                if overloaded or slow:
+                    # Decrease at most once per round trip so one burst of failures
+                    # does not collapse the limit straight to the floor
+                    if now >= self._cooldown_until:
+                        factor = 0.5 if overloaded else 0.9
+                        self.limit = max(self.min_concurrency, self.limit * factor)
+                        self._cooldown_until = now + (latency or self.min_latency or 1.0)
+                else:
+                    self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+
+            self._cond.notify_all()
+
+
+class CircuitBreaker:
+    """Per-site circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    ``allow()`` refuses requests for ``reset_timeout`` seconds. It then lets a
+    single trial request through (half-open); success closes the circuit,
+    failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def retry_in(self):
+        """Seconds until an open circuit will let a trial request through."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(site):
+    """Return the process-wide circuit breaker for ``site``."""
+    with _breakers_lock:
+        if site not in _breakers:
+            _breakers[site] = CircuitBreaker()
+        return _breakers[site]
@@ -0,0 +1,429 @@
+import hashlib
+import json
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+
+from cache import ResponseCache, FetchCoalescer
+from metrics import RequestLog
+from throttle import AdaptiveLimiter, get_breaker, parse_retry_after
+
+# Connection defaults used when the sidebar settings are left untouched
+DEFAULT_POOL_SIZE = 20
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 30
+DEFAULT_PER_PAGE = 100  # WordPress caps per_page at 100
+DEFAULT_PAGE_WORKERS = 4
+DEFAULT_MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # seconds
+BACKOFF_MAX = 30
+# Statuses that mean "try again later" rather than "this request is wrong"
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+# Failures where the server provably never processed the request, so even a
+# non-idempotent POST can be resent without risking a duplicate post
+UNPROCESSED_STATUSES = {429, 503}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# Fields list views need; everything else is loaded per post on demand
+LIST_FIELDS = ["id", "title", "status", "date", "modified", "modified_gmt", "link"]
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+
+class WPClient:
+    """Keep-alive REST client for one WordPress site and one set of credentials.
+
+    Wraps a single ``requests.Session`` whose connection pool is shared by every
+    call made through it, so bulk operations reuse TCP/TLS connections instead of
+    opening a new one per post.
+    """
+
+    def __init__(self, wp_url, username=None, password=None, token=None,
+                 pool_size=DEFAULT_POOL_SIZE, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT, headers=None, limiter=None,
+                 max_retries=DEFAULT_MAX_RETRIES):
+        self.base_url = wp_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.breaker = get_breaker(self.base_url)
+        # Stable, non-reversible identity for partitioning cached responses
+        self.auth_identity = hashlib.sha256(
+            f"{username or ''}:{password or ''}:{token or ''}".encode()
+        ).hexdigest()[:16]
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        elif username and password:
+            self.session.auth = HTTPBasicAuth(username, password)
+
+        # post_type -> whether batch/v1 accepts writes for it
+        self.batch_support = {}
+        # Timing of every HTTP call made through this client
+        self.request_log = RequestLog()
+
+    def url(self, path=""):
+        return f"{self.base_url}/wp-json/{path.lstrip('/')}"
+
+    def request(self, method, path="", **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+
+        # Every HTTP call holds a limiter slot and reports back how the server coped
+        queued = time.monotonic()
+        if self.limiter is not None:
+            self.limiter.acquire()
+        response = None
+        error = None
+        start = time.monotonic()
+        try:
+            response = self.session.request(method, self.url(path), **kwargs)
+            return response
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.monotonic() - start
+            if self.limiter is not None:
+                self.limiter.release(response.status_code if response is not None else None, duration,
+                                     response.headers.get("Retry-After") if response is not None else None)
+            self.request_log.record(method, path, response, duration, start - queued, error)
+
+    def get(self, path="", **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path="", **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path="", **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path="", **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+@st.cache_resource(show_spinner=False)
+def get_client(wp_url, username=None, password=None, token=None,
+               pool_size=DEFAULT_POOL_SIZE, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+               read_timeout=DEFAULT_READ_TIMEOUT, headers=None,
+               max_concurrency=None, max_rps=None, adaptive=True, max_retries=DEFAULT_MAX_RETRIES):
+    """Return the shared client for this site, credentials and pool settings.
+
+    Cached with ``st.cache_resource`` so the same pooled session survives reruns
+    and is reused by every session connecting with identical settings. When
+    ``max_concurrency`` or ``max_rps`` is given, requests go through an
+    ``AdaptiveLimiter`` shared by everyone using the client.
+    """
+    limiter = None
+    if max_concurrency or max_rps:
+        limiter = AdaptiveLimiter(max_concurrency or pool_size, max_rps=max_rps, adaptive=adaptive)
+
+    return WPClient(wp_url, username, password, token, pool_size=pool_size,
+                    connect_timeout=connect_timeout, read_timeout=read_timeout,
+                    headers=headers, limiter=limiter, max_retries=max_retries)
+
+
+# Process-wide cache of list responses, revalidated with conditional GETs
+response_cache = ResponseCache()
+# Merges identical get_posts() calls in flight at once from sessions on the same site and account
+fetch_coalescer = FetchCoalescer()
+
+def _post_type_from_path(path):
+    parts = path.split("?")[0].strip("/").split("/")
+    if len(parts) > 2 and parts[0] == "wp" and parts[1] == "v2":
+        return parts[2]
+    return None
+
+def _invalidate_cache(client, path):
+    post_type = _post_type_from_path(path)
+    if post_type:
+        response_cache.invalidate(client.base_url, post_type)
+        fetch_coalescer.invalidate(client.base_url, post_type)
+
+
+class APIError(Exception):
+    """Failed API call.
+
+    Returned (not raised) by the API functions in place of the response data.
+    It is falsy, so ``if result:`` checks keep working, and carries what the UI
+    needs to report the failure.
+    """
+
+    def __init__(self, action, message, status=None, response_text=None):
+        super().__init__(message)
+        self.action = action
+        self.message = message
+        self.status = status
+        self.response_text = response_text
+
+    def __bool__(self):
+        return False
+
+    def __str__(self):
+        return f"Error {self.action} post: {self.message}"
+
+
+def _backoff(attempt, retry_after=None):
+    # Full jitter keeps concurrent workers from retrying in lockstep
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+    server_delay = parse_retry_after(retry_after)
+    if server_delay:
+        delay = max(delay, min(server_delay, BACKOFF_MAX))
+    time.sleep(delay)
+
+def _request(client, method, path, action, idempotent=None, **kwargs):
+    """Send one REST call with retries; return the response or raise ``APIError``.
+
+    Idempotent calls (GET/PUT/DELETE) are retried with jittered exponential
+    backoff on connection errors, timeouts and retryable statuses. Other calls
+    are only retried when the server provably did not process them. Every
+    outcome feeds the site's circuit breaker, which fails fast while open.
+    """
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
+    breaker = client.breaker
+
+    for attempt in range(client.max_retries + 1):
+        if not breaker.allow():
+            raise APIError(action, f"{client.base_url} is failing; requests paused for "
+                                   f"{breaker.retry_in():.0f}s (circuit open)")
+
+        retry_after = None
+        try:
+            response = client.request(method, path, **kwargs)
+        except requests.exceptions.RequestException as e:
+            breaker.record_failure()
+            error = APIError(action, str(e))
+            retryable = idempotent or isinstance(e, requests.exceptions.ConnectTimeout)
+        else:
+            if response.ok:
+                breaker.record_success()
+                return response
+
+            error = APIError(action, f"{response.status_code} {response.reason}",
+                             status=response.status_code, response_text=response.text)
+            if response.status_code in RETRYABLE_STATUSES:
+                breaker.record_failure()
+                retry_after = response.headers.get("Retry-After")
+                retryable = idempotent or response.status_code in UNPROCESSED_STATUSES
+            else:
+                # The site answered; the request itself was rejected
+                breaker.record_success()
+                retryable = False
+
+        if not retryable or attempt == client.max_retries:
+            raise error
+        _backoff(attempt, retry_after)
+
+def _send(client, method, path, action, idempotent=None, **kwargs):
+    try:
+        return _request(client, method, path, action, idempotent, **kwargs).json()
+    except APIError as e:
+        return e
+    except ValueError as e:
+        return APIError(action, f"Invalid JSON in response: {str(e)}")
+    finally:
+        # Even a failed write may have changed the collection
+        if method not in ("GET", "HEAD", "OPTIONS"):
+            _invalidate_cache(client, path)
+
+
+# Functions for API interaction
+def _fetch_page(client, post_type, params, page, use_cache=True):
+    """Fetch one page of a collection; return ``(total_pages, posts)``.
+
+    With ``use_cache`` the request carries ``If-None-Match`` /
+    ``If-Modified-Since`` from the last response for the same site, auth
+    identity, post type and params, and a 304 reuses the cached body.
+    """
+    params = {**params, "page": page}
+    key = (client.base_url, client.auth_identity, post_type, tuple(sorted((k, str(v)) for k, v in params.items())))
+    cached = response_cache.get(key) if use_cache else None
+
+    headers = {}
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = _request(client, "GET", f"wp/v2/{post_type}", "fetching", params=params, headers=headers)
+
+    if response.status_code == 304 and cached:
+        response_cache.touch(key)
+        content, response_headers = cached["content"], cached["headers"]
+    else:
+        content, response_headers = response.content, response.headers
+        if use_cache:
+            response_cache.put(key, content, etag=response.headers.get("ETag"),
+                               last_modified=response.headers.get("Last-Modified"),
+                               headers={"X-WP-TotalPages": response.headers.get("X-WP-TotalPages", "1")})
+
+    return int(response_headers.get("X-WP-TotalPages") or 1), json.loads(content)
+
+def get_posts(wp_url, post_type, username=None, password=None, token=None, params=None, client=None,
+              max_items=None, max_workers=DEFAULT_PAGE_WORKERS, use_cache=True, shared=True):
+    """Fetch every post of ``post_type`` matching ``params``, across all pages.
+
+    The first page is fetched on its own to read ``X-WP-TotalPages``; the
+    remaining pages are fetched concurrently on at most ``max_workers`` threads
+    and concatenated in page order. ``max_items`` stops paging once enough
+    posts have been requested. Passing an explicit ``page`` in ``params``
+    fetches only that page. Returns an ``APIError`` if any page fails.
+
+    Unless ``use_cache`` is False, pages are revalidated against the response
+    cache, and identical fetches from other sessions (same site, account,
+    post type and params) that are in flight at the same moment are merged
+    through ``fetch_coalescer``. Results are not kept afterwards, so every
+    new call asks the site. The returned post dicts may be shared with other
+    sessions and must not be modified in place. ``shared=False`` skips the
+    coalescing (pages are still revalidated), for callers that need a
+    response issued after the call, such as incremental sync.
+    """
+    client = client or get_client(wp_url, username, password, token)
+
+    params = dict(params or {})
+    if not (use_cache and shared):
+        return _get_posts(client, post_type, params, max_items, max_workers, use_cache)
+
+    key = (client.base_url, client.auth_identity, post_type,
+           tuple(sorted((k, str(v)) for k, v in params.items())), max_items)
+    return fetch_coalescer.run(key, lambda: _get_posts(client, post_type, params, max_items, max_workers, use_cache))
+
+def _get_posts(client, post_type, params, max_items, max_workers, use_cache):
+    """Body of ``get_posts`` without coalescing; returns the posts or an ``APIError``."""
+    params = dict(params)
+    single_page = "page" in params
+    per_page = int(params.get("per_page", DEFAULT_PER_PAGE))
+    if max_items:
+        per_page = min(per_page, max_items)
+    params["per_page"] = per_page
+
+    try:
+        total_pages, posts = _fetch_page(client, post_type, params, params.pop("page", 1), use_cache)
+        if single_page:
+            return posts
+
+        if max_items:
+            total_pages = min(total_pages, math.ceil(max_items / per_page))
+
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total_pages - 1))) as executor:
+                # map() yields in submission order, so pages stay in order
+                for _, page_posts in executor.map(
+                        lambda page: _fetch_page(client, post_type, params, page, use_cache),
+                        range(2, total_pages + 1)):
+                    posts.extend(page_posts)
+
+        return posts[:max_items] if max_items else posts
+    except APIError as e:
+        return e
+    except ValueError as e:
+        return APIError("fetching", f"Invalid JSON in response: {str(e)}")
+
+def get_post(wp_url, post_type, post_id, username=None, password=None, token=None, client=None, params=None):
+    client = client or get_client(wp_url, username, password, token)
+    return _send(client, "GET", f"wp/v2/{post_type}/{post_id}", "fetching", params=params)
+
+def create_post(wp_url, post_type, post_data, username=None, password=None, token=None, client=None):
+    client = client or get_client(wp_url, username, password, token)
+    return _send(client, "POST", f"wp/v2/{post_type}", "creating", json=post_data)
+
+def update_post(wp_url, post_type, post_id, post_data, username=None, password=None, token=None, client=None):
+    client = client or get_client(wp_url, username, password, token)
+    return _send(client, "PUT", f"wp/v2/{post_type}/{post_id}", "updating", json=post_data)
+
+def delete_post(wp_url, post_type, post_id, username=None, password=None, token=None, client=None):
+    client = client or get_client(wp_url, username, password, token)
+    return _send(client, "DELETE", f"wp/v2/{post_type}/{post_id}", "deleting", params={"force": "true"})
+
+
+# Batch API (WordPress 5.6+)
+BATCH_MAX_REQUESTS = 25
+_BATCH_ACTIONS = {"POST": "creating", "PUT": "updating", "DELETE": "deleting"}
+
+def create_request(post_type, post_data):
+    return {"method": "POST", "path": f"/wp/v2/{post_type}", "body": post_data}
+
+def update_request(post_type, post_id, post_data):
+    return {"method": "PUT", "path": f"/wp/v2/{post_type}/{post_id}", "body": post_data}
+
+def delete_request(post_type, post_id):
+    return {"method": "DELETE", "path": f"/wp/v2/{post_type}/{post_id}?force=true"}
+
+def supports_batch(client, post_type):
+    """Return True if the site accepts ``post_type`` writes through batch/v1.
+
+    WordPress advertises this per route as ``allow_batch`` in the OPTIONS
+    response; the answer is remembered on the client.
+    """
+    if post_type not in client.batch_support:
+        try:
+            response = _request(client, "OPTIONS", f"wp/v2/{post_type}", "checking")
+            allow_batch = response.json().get("allow_batch") or {}
+            client.batch_support[post_type] = bool(allow_batch.get("v1"))
+        except (APIError, ValueError, AttributeError):
+            client.batch_support[post_type] = False
+    return client.batch_support[post_type]
+
+def send_request(client, sub_request):
+    """Send one batch-style sub-request as a regular REST call."""
+    return _send(client, sub_request["method"], sub_request["path"],
+                 _BATCH_ACTIONS.get(sub_request["method"], "sending"), json=sub_request.get("body"))
+
+def send_batch(client, sub_requests):
+    """Send up to ``BATCH_MAX_REQUESTS`` sub-requests in one batch/v1 call.
+
+    Returns one entry per sub-request, in order: the response body for 2xx
+    sub-responses, an ``APIError`` otherwise. A batch made only of updates and
+    deletes is idempotent and is retried like any PUT/DELETE.
+    """
+    idempotent = all(sub_request["method"] in IDEMPOTENT_METHODS for sub_request in sub_requests)
+    try:
+        response = _request(client, "POST", "batch/v1", "sending batch for", idempotent=idempotent,
+                            json={"validation": "normal", "requests": sub_requests})
+        responses = response.json().get("responses", [])
+    except APIError as e:
+        return [e] * len(sub_requests)
+    except ValueError as e:
+        return [APIError("sending batch for", f"Invalid JSON in response: {str(e)}")] * len(sub_requests)
+    finally:
+        for post_type in {_post_type_from_path(sub_request["path"]) for sub_request in sub_requests} - {None}:
+            response_cache.invalidate(client.base_url, post_type)
+            fetch_coalescer.invalidate(client.base_url, post_type)
+
+    results = []
+    for sub_request, sub_response in zip(sub_requests, responses):
+        status = sub_response.get("status", 500)
+        if 200 <= status < 300:
+            results.append(sub_response.get("body"))
+        else:
+            body = sub_response.get("body") or {}
+            results.append(APIError(_BATCH_ACTIONS.get(sub_request["method"], "sending"),
+                                    f"{status} {body.get('message', '')}".strip(),
+                                    status=status, response_text=json.dumps(body)))
+
+    # A short response list means the missing sub-requests were not applied
+    for sub_request in sub_requests[len(results):]:
+        results.append(APIError(_BATCH_ACTIONS.get(sub_request["method"], "sending"),
+                                "No response in batch reply"))
+    return results